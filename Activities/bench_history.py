@@ -0,0 +1,209 @@
+"""
+Persistent benchmark history for the sorting analyzer.
+
+Results are stored as JSON lines (one record per algorithm run) so that
+timings survive between sessions and can be compared against a saved
+baseline after a Python upgrade or a host change.
+"""
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_HISTORY_FILE = "bench_history.jsonl"
+
+# Samples needed per side before a comparison can be called significant
+# (with 3 against 3 the exact test's smallest p-value is 1/20 = 0.05)
+MIN_SAMPLES = 4
+
+
+def fingerprint(data: List[int]) -> str:
+    """Short, order-sensitive hash identifying the exact input dataset"""
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, data)).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+
+def cpu_name() -> str:
+    """Best-effort CPU model string for the current host"""
+    try:
+        with open("/proc/cpuinfo", "r") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine() or "unknown"
+
+
+def make_record(algorithm: str, data: List[int], times: List[float]) -> Dict:
+    """Build a history record for one algorithm measured on one dataset"""
+    return {
+        "algorithm": algorithm,
+        "n": len(data),
+        "fingerprint": fingerprint(data),
+        "median": statistics.median(times),
+        "times": list(times),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cpu": cpu_name(),
+        "host": platform.node(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def append_records(path: str, records: List[Dict]):
+    """Append records to a JSON lines history file"""
+    with open(path, "a") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+
+
+def load_records(path: str) -> List[Dict]:
+    """Load every record from a JSON lines history file"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"History file '{path}' not found")
+
+    records = []
+    with open(path, "r") as file:
+        for line_no, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid record ({e})")
+    return records
+
+
+def latest_by_key(records: List[Dict]) -> Dict[Tuple[str, int, str], Dict]:
+    """Keep the most recent record for each (algorithm, n, fingerprint)"""
+    latest = {}
+    for record in records:
+        latest[(record["algorithm"], record["n"], record["fingerprint"])] = record
+    return latest
+
+
+@lru_cache(maxsize=None)
+def _u_counts(m: int, n: int) -> Tuple[int, ...]:
+    """Number of arrangements giving each Mann-Whitney U value for sizes m, n"""
+    if m == 0 or n == 0:
+        return (1,)
+    # The largest element comes from the first sample (adds n to U) or not
+    with_first = _u_counts(m - 1, n)
+    without_first = _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, ways in enumerate(with_first):
+        counts[u + n] += ways
+    for u, ways in enumerate(without_first):
+        counts[u] += ways
+    return tuple(counts)
+
+
+def smallest_p_value(m: int, n: int) -> float:
+    """Smallest p-value the exact test can give for sample sizes m, n (all of one side above the other)"""
+    return 1 / math.comb(m + n, m)
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test.
+    Returns the p-value for "current times are stochastically larger".
+    Uses the exact distribution for small samples and the normal
+    approximation (with tie correction) otherwise.
+    """
+    m, n = len(current), len(baseline)
+    u = 0.0
+    for x in current:
+        for y in baseline:
+            if x > y:
+                u += 1.0
+            elif x == y:
+                u += 0.5
+
+    has_ties = len(set(current) | set(baseline)) < m + n
+    if m + n <= 20 and not has_ties:
+        counts = _u_counts(m, n)
+        tail = sum(counts[int(u):])
+        return tail / math.comb(m + n, m)
+
+    combined = sorted(current + baseline)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j < len(combined) and combined[j] == combined[i]:
+            j += 1
+        t = j - i
+        tie_term += t ** 3 - t
+        i = j
+
+    total = m + n
+    mean = m * n / 2
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 1.0 - statistics.NormalDist().cdf(z)
+
+
+def compare(baseline: List[Dict], current: List[Dict],
+            threshold: float = 0.05, alpha: float = 0.05) -> List[Dict]:
+    """
+    Compare the latest current records against the latest baseline records.
+    A run is a regression when its median is more than `threshold` slower
+    and the slowdown is significant at level `alpha`.
+    """
+    base_by_key = latest_by_key(baseline)
+    results = []
+
+    for key, record in sorted(latest_by_key(current).items()):
+        algorithm, n, _ = key
+        entry = {
+            "algorithm": algorithm,
+            "n": n,
+            "current": record["median"],
+            "baseline": None,
+            "change": None,
+            "p_value": None,
+            "status": "new",
+        }
+
+        base = base_by_key.get(key)
+        if base is not None:
+            entry["baseline"] = base["median"]
+            entry["change"] = (
+                (record["median"] - base["median"]) / base["median"]
+                if base["median"] > 0 else 0.0
+            )
+
+            m, n_base = len(record["times"]), len(base["times"])
+            # Too few samples for any outcome to reach alpha
+            if min(m, n_base) < MIN_SAMPLES or smallest_p_value(m, n_base) >= alpha:
+                entry["status"] = "insufficient samples"
+            else:
+                entry["p_value"] = mann_whitney_greater(record["times"], base["times"])
+                if entry["change"] > threshold and entry["p_value"] < alpha:
+                    entry["status"] = "REGRESSION"
+                elif entry["change"] < -threshold:
+                    entry["status"] = "faster"
+                else:
+                    entry["status"] = "ok"
+
+        results.append(entry)
+
+    return results
+
+
+def environment_summary(records: List[Dict]) -> Optional[str]:
+    """Describe the interpreter and CPU the records were measured on"""
+    if not records:
+        return None
+    last = records[-1]
+    return f"{last.get('implementation', 'Python')} {last['python']} on {last['cpu']}"
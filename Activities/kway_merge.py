@@ -0,0 +1,98 @@
+"""
+Streaming k-way merge of files that are already sorted in descending order.
+
+Each input is read in 64 KiB chunks (file_tasks.iter_number_chunks). A heap
+holds one head entry per file, so memory stays bounded by k entries, one
+chunk per file and one output batch, however large the files are.
+The merged numbers are written in batches through a temp file that
+replaces the output at the end. Equal values come out in input file order.
+"""
+import heapq
+import os
+import time
+from typing import Callable, Dict, Iterator, Optional, Sequence
+
+from common import file_tasks
+
+READ_CHUNK = 1 << 16  # Bytes read per file at a time (64 KiB keeps k open files cheap)
+WRITE_BATCH = 1 << 16  # Numbers formatted per write
+
+
+class UnsortedInputError(ValueError):
+    """Raised when verification finds an input that is not in descending order"""
+
+
+def read_stream(file_path: str, chunk_size: int = READ_CHUNK) -> Iterator[int]:
+    """The numbers of a file, one at a time, read chunk by chunk"""
+    for numbers, _ in file_tasks.iter_number_chunks(file_path, chunk_size):
+        yield from numbers
+
+
+def verified(stream: Iterator[int], file_path: str) -> Iterator[int]:
+    """Pass the stream through, raising UnsortedInputError at the first ascent"""
+    previous = None
+    for position, value in enumerate(stream):
+        if previous is not None and value > previous:
+            raise UnsortedInputError(
+                f"'{file_path}' is not in descending order: item {position + 1:,} ({value}) "
+                f"follows {previous}"
+            )
+        previous = value
+        yield value
+
+
+def merge_files(input_paths: Sequence[str], output_path: str, verify: bool = False,
+                progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    Merge the descending inputs into output_path, one number per line.
+    progress(numbers_written) is called after each batch. Returns
+    {"count", "bytes_read", "elapsed"}.
+    """
+    start_time = time.perf_counter()
+    streams = [read_stream(path) for path in input_paths]
+    if verify:
+        streams = [verified(stream, path) for stream, path in zip(streams, input_paths)]
+
+    # Min-heap on negated values, so the largest head is on top; the file
+    # index breaks ties and keeps equal values in input order
+    heap = []
+    for index, stream in enumerate(streams):
+        value = next(stream, None)
+        if value is not None:
+            heap.append((-value, index))
+    heapq.heapify(heap)
+
+    temp_path = output_path + ".part"
+    count = 0
+    try:
+        with open(temp_path, "w", buffering=file_tasks.CHUNK_SIZE) as file:
+            batch = []
+            while heap:
+                negated, index = heap[0]
+                batch.append(-negated)
+                value = next(streams[index], None)
+                if value is None:
+                    heapq.heappop(heap)
+                else:
+                    heapq.heapreplace(heap, (-value, index))
+
+                if len(batch) == WRITE_BATCH:
+                    file.write("\n".join(map(str, batch)) + "\n")
+                    count += len(batch)
+                    batch = []
+                    if progress is not None:
+                        progress(count)
+            if batch:
+                file.write("\n".join(map(str, batch)) + "\n")
+                count += len(batch)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return {
+        "count": count,
+        "bytes_read": sum(os.path.getsize(path) for path in input_paths),
+        "elapsed": time.perf_counter() - start_time,
+    }
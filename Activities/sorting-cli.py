@@ -1,12 +1,44 @@
 import time
 import os
+import sys
+import argparse
+import csv
 from typing import List, Tuple
 
+# The helpers shared by all three apps live in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bench_history
+import kway_merge
+import records
+import sorting_algorithms
+
+from common import data_profile, merge_tuning, sort_profiler, sort_verifier, sorting_networks
+
+# Menu name of the Distinct + counts result, which downloads as value,count lines
+DISTINCT_COUNTS = "Distinct + Counts"
+
+
+def read_numbers(file_path: str) -> List[int]:
+    """Parse every integer token (spaces, commas or newlines) from a text file"""
+    with open(file_path, 'r') as file:
+        content = file.read()
+    return [int(x.strip()) for x in content.replace(',', ' ').split() if x.strip().isdigit() or (x.strip()[0] == '-' and x.strip()[1:].isdigit())]
+
+
 class SortingAnalyzer:
-    def __init__(self):
+    def __init__(self, history_path: str = None, profile_mode: str = None, trace_memory: bool = False):
         self.data = []
+        self.data_path = None
         self.last_sorted_data = None
         self.last_algorithm_name = None
+        self.data_profile = None  # data_profile.analyze() of the loaded data
+        # When set, "Run All Algorithms" results are appended to this history file
+        self.history_path = history_path
+        # "cprofile", "sampling" or None to time sorts without profiling
+        self.profile_mode = profile_mode
+        # When set, "Run All Algorithms" ends with the heap vs merge sort peak memory
+        self.trace_memory = trace_memory
     
     def greet(self):
         """Display welcome message"""
@@ -25,78 +57,61 @@ class SortingAnalyzer:
                 continue
             
             try:
-                with open(file_path, 'r') as file:
-                    content = file.read()
-                    # Try to parse numbers from the file
-                    self.data = [int(x.strip()) for x in content.replace(',', ' ').split() if x.strip().isdigit() or (x.strip()[0] == '-' and x.strip()[1:].isdigit())]
-                    
-                    if not self.data:
-                        print("Error: No valid numbers found in the file. Please try again.\n")
-                        continue
-                    
-                    print(f"\nSuccessfully loaded {len(self.data)} numbers from the file.")
-                    print(f"Preview: {self.data[:10]}{'...' if len(self.data) > 10 else ''}\n")
-                    return True
+                # Try to parse numbers from the file
+                self.data = read_numbers(file_path)
+                self.data_path = file_path
+                
+                if not self.data:
+                    print("Error: No valid numbers found in the file. Please try again.\n")
+                    continue
+                
+                print(f"\nSuccessfully loaded {len(self.data)} numbers from the file.")
+                print(f"Preview: {self.data[:10]}{'...' if len(self.data) > 10 else ''}")
+                self.data_profile = data_profile.analyze(self.data)
+                print("\n".join(data_profile.format_profile(self.data_profile)) + "\n")
+                return True
                     
             except Exception as e:
                 print(f"Error reading file: {e}. Please try again.\n")
     
     def bubble_sort(self, arr: List[int]) -> List[int]:
-        """Bubble sort implementation"""
-        arr = arr.copy()
-        n = len(arr)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                if arr[j] < arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-        return arr
+        """Bubble sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.bubble_sort(arr)
     
     def insertion_sort(self, arr: List[int]) -> List[int]:
-        """Insertion sort implementation"""
-        arr = arr.copy()
-        for i in range(1, len(arr)):
-            key = arr[i]
-            j = i - 1
-            while j >= 0 and arr[j] < key:
-                arr[j + 1] = arr[j]
-                j -= 1
-            arr[j + 1] = key
-        return arr
+        """Insertion sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.insertion_sort(arr)
     
     def merge_sort(self, arr: List[int]) -> List[int]:
-        """Merge sort implementation"""
-        arr = arr.copy()
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = self.merge_sort(arr[:mid])
-        right = self.merge_sort(arr[mid:])
-        
-        return self._merge(left, right)
-    
-    def _merge(self, left: List[int], right: List[int]) -> List[int]:
-        """Helper function for merge sort"""
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            if left[i] >= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
-    
-    def execute_sort(self, name: str, sort_func) -> Tuple[List[int], float]:
+        """Merge sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.merge_sort(arr)
+    
+    def shell_sort(self, arr: List[int], gaps: str = "ciura") -> List[int]:
+        """Shell sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.shell_sort(arr, gaps=gaps)
+    
+    def introsort(self, arr: List[int]) -> List[int]:
+        """Introsort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.introsort(arr)
+    
+    def heap_sort(self, arr: List[int]) -> List[int]:
+        """Heap sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.heap_sort(arr)
+    
+    def execute_sort(self, name: str, sort_func, **kwargs) -> Tuple[List[int], float]:
         """Execute a sorting algorithm and measure time"""
         print(f"\nLoading... (Running {name})")
+        
+        if self.profile_mode:
+            output_path = sort_profiler.profile_output_path(name, self.data_path, len(self.data), self.profile_mode)
+            sorted_data, elapsed_time, report = sort_profiler.run_profiled(
+                lambda data: sort_func(data, **kwargs), self.data, self.profile_mode, output_path
+            )
+            print("\n".join(report))
+            return sorted_data, elapsed_time
+        
         start_time = time.time()
-        sorted_data = sort_func(self.data)
+        sorted_data = sort_func(self.data, **kwargs)
         end_time = time.time()
         elapsed_time = end_time - start_time
         return sorted_data, elapsed_time
@@ -109,12 +124,25 @@ class SortingAnalyzer:
         print(f"Time Taken: {elapsed_time:.6f} seconds")
         print("-" * 60)
     
+    def get_algorithms(self) -> List[Tuple[str, callable]]:
+        """All algorithms offered by the analyzer, in menu order"""
+        return [
+            ("Bubble Sort", self.bubble_sort),
+            ("Insertion Sort", self.insertion_sort),
+            ("Merge Sort", self.merge_sort),
+            ("Shell Sort", self.shell_sort),
+            ("Introsort", self.introsort),
+            ("Heap Sort", self.heap_sort)
+        ]
+    
     def run_single_sort(self, choice: int):
         """Run a single sorting algorithm"""
         algorithms = {
             1: ("Bubble Sort", self.bubble_sort),
             2: ("Insertion Sort", self.insertion_sort),
-            3: ("Merge Sort", self.merge_sort)
+            3: ("Merge Sort", self.merge_sort),
+            5: ("Introsort", self.introsort),
+            6: ("Heap Sort", self.heap_sort)
         }
         
         name, sort_func = algorithms[choice]
@@ -125,23 +153,94 @@ class SortingAnalyzer:
         self.last_sorted_data = sorted_data
         self.last_algorithm_name = name
     
+    def run_auto_sort(self):
+        """Run the engine data_profile recommends for the loaded data"""
+        algorithm, reason = data_profile.recommend(self.data_profile)
+        name = algorithm.replace("_", " ").title()
+        print(f"\nAuto picked {name}: {reason}")
+        
+        name = f"Auto ({name})"
+        sorted_data, elapsed_time = self.execute_sort(name, sorting_algorithms.ALGORITHMS[algorithm])
+        self.display_result(name, sorted_data, elapsed_time)
+        
+        self.last_sorted_data = sorted_data
+        self.last_algorithm_name = name
+    
+    def run_distinct_counts(self):
+        """Distinct values with their frequencies, without sorting the full list"""
+        print("\nLoading... (Counting distinct values)")
+        start_time = time.time()
+        pairs = sorting_algorithms.distinct_counts(self.data)
+        elapsed_time = time.time() - start_time
+        
+        print("\nDistinct + Counts Result:")
+        print("-" * 60)
+        print(f"Values (value, count): {pairs[:10]}{'...' if len(pairs) > 10 else ''}")
+        print(f"Distinct values: {len(pairs):,} of {len(self.data):,} numbers ({len(pairs) / len(self.data):.1%} of the full sorted list)")
+        print(f"Time Taken: {elapsed_time:.6f} seconds")
+        print("-" * 60)
+        
+        self.last_sorted_data = pairs
+        self.last_algorithm_name = DISTINCT_COUNTS
+    
+    def run_shell_sort(self):
+        """Run Shell sort with one gap sequence, or compare all of them"""
+        sequences = list(sorting_algorithms.GAP_SEQUENCES)
+        print("\nGap sequences:")
+        for number, gaps in enumerate(sequences, 1):
+            print(f"{number}. {gaps.title()}")
+        print(f"{len(sequences) + 1}. Compare all")
+        
+        choice = input(f"Select a gap sequence (default: {len(sequences) + 1}): ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(sequences):
+            sequences = [sequences[int(choice) - 1]]
+        
+        results = []
+        for gaps in sequences:
+            name = f"Shell Sort ({gaps.title()})"
+            (sorted_data, comparisons), elapsed_time = self.execute_sort(
+                name, sorting_algorithms.counted_shell_sort, gaps=gaps
+            )
+            self.display_result(name, sorted_data, elapsed_time)
+            print(f"Comparisons: {comparisons:,}")
+            results.append((name, elapsed_time, comparisons))
+        
+        if len(results) > 1:
+            results.sort(key=lambda x: x[1])
+            print("\n" + "=" * 60)
+            print("GAP SEQUENCE RANKING (Fastest to Slowest)")
+            print("=" * 60)
+            for rank, (name, elapsed_time, comparisons) in enumerate(results, 1):
+                print(f"{rank}. {name}: {elapsed_time:.6f} seconds, {comparisons:,} comparisons")
+            print("=" * 60)
+        
+        # Store the last sorted data for download option
+        self.last_sorted_data = sorted_data
+        self.last_algorithm_name = results[0][0] if len(results) == 1 else "Shell Sort"
+    
     def run_all_sorts(self):
         """Run all sorting algorithms and rank them"""
         print("\nRunning all sorting algorithms...\n")
         
-        algorithms = [
-            ("Bubble Sort", self.bubble_sort),
-            ("Insertion Sort", self.insertion_sort),
-            ("Merge Sort", self.merge_sort)
-        ]
+        algorithms = self.get_algorithms()
         
         results = []
+        # Fingerprint the input once; every output is checked against it
+        expected = sort_verifier.fingerprint(self.data)
         
         for name, sort_func in algorithms:
             sorted_data, elapsed_time = self.execute_sort(name, sort_func)
             self.display_result(name, sorted_data, elapsed_time)
+            print(sort_verifier.describe(sort_verifier.verify(sorted_data, expected)))
             results.append((name, elapsed_time))
         
+        if self.history_path:
+            bench_history.append_records(
+                self.history_path,
+                [bench_history.make_record(name, self.data, [elapsed_time]) for name, elapsed_time in results]
+            )
+            print(f"\nResults recorded to '{self.history_path}'")
+        
         # Rank by time (fastest to slowest)
         results.sort(key=lambda x: x[1])
         
@@ -152,10 +251,27 @@ class SortingAnalyzer:
             print(f"{rank}. {name}: {elapsed_time:.6f} seconds")
         print("=" * 60)
         
+        if self.trace_memory:
+            self.display_memory_comparison()
+        
         # Store the last sorted data for download option
         self.last_sorted_data = sorted_data
         self.last_algorithm_name = "All Algorithms"
     
+    def display_memory_comparison(self):
+        """Peak memory of in-place heap sort against merge sort, traced on a prefix of the data"""
+        sample = self.data[:sort_profiler.MEMORY_SAMPLE]
+        print(f"\nPEAK MEMORY (first {len(sample):,} numbers)")
+        print("-" * 60)
+        for name, sort_func, in_place in [
+            ("Heap Sort (in place)", sorting_algorithms.heap_sort_in_place, True),
+            ("Merge Sort", self.merge_sort, False),
+        ]:
+            peak, auxiliary = sort_profiler.measure_peak_memory(sort_func, sample, in_place)
+            print(f"{name}: {sort_profiler.format_bytes(peak)} peak, "
+                  f"{sort_profiler.format_bytes(auxiliary)} beyond the output list")
+        print("-" * 60)
+    
     def download_sorted_data(self):
         """Download the last sorted data to a text file"""
         if self.last_sorted_data is None:
@@ -166,23 +282,26 @@ class SortingAnalyzer:
         print("DOWNLOAD SORTED DATA")
         print("=" * 60)
         
-        default_filename = "sorted_data.txt"
+        # Distinct + counts results are saved as value,count lines
+        counts = self.last_algorithm_name == DISTINCT_COUNTS
+        extension = '.csv' if counts else '.txt'
+        default_filename = "distinct_counts.csv" if counts else "sorted_data.txt"
         filename = input(f"Enter filename (default: {default_filename}): ").strip()
         
         if not filename:
             filename = default_filename
         
-        # Add .txt extension if not present
-        if not filename.endswith('.txt'):
-            filename += '.txt'
+        # Add the extension if not present
+        if not filename.endswith(extension):
+            filename += extension
         
         try:
             with open(filename, 'w') as file:
-                # Write each number on a new line
-                for num in self.last_sorted_data:
-                    file.write(f"{num}\n")
+                # Write each number (or value,count pair) on a new line
+                for item in self.last_sorted_data:
+                    file.write("%d,%d\n" % item if counts else f"{item}\n")
             
-            print(f"\n✓ Successfully saved {len(self.last_sorted_data)} numbers to '{filename}'")
+            print(f"\n✓ Successfully saved {len(self.last_sorted_data)} {'distinct values' if counts else 'numbers'} to '{filename}'")
             print(f"  Algorithm used: {self.last_algorithm_name}")
             print("=" * 60)
             
@@ -198,10 +317,15 @@ class SortingAnalyzer:
         print("1. Bubble Sort")
         print("2. Insertion Sort")
         print("3. Merge Sort")
-        print("4. Run All Algorithms")
-        print("5. Download Sorted Data")
-        print("6. Load New File")
-        print("7. Exit")
+        print("4. Shell Sort")
+        print("5. Introsort")
+        print("6. Heap Sort")
+        print("7. Auto (best for this data)")
+        print("8. Distinct + Counts")
+        print("9. Run All Algorithms")
+        print("10. Download Sorted Data")
+        print("11. Load New File")
+        print("12. Exit")
         print("=" * 60)
     
     def run(self):
@@ -215,28 +339,296 @@ class SortingAnalyzer:
             self.display_menu()
             
             try:
-                choice = input("\nEnter your choice (1-7): ").strip()
+                choice = input("\nEnter your choice (1-12): ").strip()
                 
-                if choice == '7':
+                if choice == '12':
                     print("\nThank you for using our program!")
                     print("Goodbye!\n")
                     break
-                elif choice == '6':
+                elif choice == '11':
                     if self.load_data():
                         continue
-                elif choice == '5':
+                elif choice == '10':
                     self.download_sorted_data()
-                elif choice == '4':
+                elif choice == '9':
                     self.run_all_sorts()
-                elif choice in ['1', '2', '3']:
+                elif choice == '8':
+                    self.run_distinct_counts()
+                elif choice == '7':
+                    self.run_auto_sort()
+                elif choice == '4':
+                    self.run_shell_sort()
+                elif choice in ['1', '2', '3', '5', '6']:
                     self.run_single_sort(int(choice))
                 else:
-                    print("\nInvalid choice. Please enter a number between 1 and 7.")
+                    print("\nInvalid choice. Please enter a number between 1 and 12.")
                     
             except Exception as e:
                 print(f"\nError: {e}. Please try again.")
 
 
-if __name__ == "__main__":
+def run_benchmark(args) -> int:
+    """Benchmark every algorithm on a dataset and append the results to the history file"""
     analyzer = SortingAnalyzer()
+    analyzer.data = read_numbers(args.data)
+    if not analyzer.data:
+        print(f"Error: No valid numbers found in '{args.data}'.")
+        return 2
+    
+    print(f"Benchmarking {len(analyzer.data):,} numbers ({args.repeat} runs each)")
+    print("-" * 60)
+    
+    records = []
+    for name, sort_func in analyzer.get_algorithms():
+        times = []
+        for _ in range(args.repeat):
+            start_time = time.perf_counter()
+            sort_func(analyzer.data)
+            times.append(time.perf_counter() - start_time)
+        record = bench_history.make_record(name, analyzer.data, times)
+        records.append(record)
+        print(f"{name}: median {record['median']:.6f}s (min {min(times):.6f}s, max {max(times):.6f}s)")
+    
+    bench_history.append_records(args.history, records)
+    print("-" * 60)
+    print(f"Environment: {bench_history.environment_summary(records)}")
+    print(f"Recorded {len(records)} results to '{args.history}'")
+    return 0
+
+
+def run_compare(args) -> int:
+    """Compare the history file against a baseline; exit code 1 on any regression"""
+    try:
+        baseline = bench_history.load_records(args.baseline)
+        current = bench_history.load_records(args.history)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 2
+    
+    results = bench_history.compare(baseline, current, threshold=args.threshold, alpha=args.alpha)
+    
+    print("=" * 60)
+    print("BENCHMARK COMPARISON")
+    print("=" * 60)
+    print(f"Baseline: {bench_history.environment_summary(baseline)}")
+    print(f"Current:  {bench_history.environment_summary(current)}")
+    print("-" * 60)
+    
+    regressions = 0
+    for entry in results:
+        line = f"{entry['algorithm']} (n={entry['n']:,}): {entry['current']:.6f}s"
+        if entry["baseline"] is not None:
+            line += f" vs {entry['baseline']:.6f}s ({entry['change']:+.1%})"
+        if entry["p_value"] is not None:
+            line += f", p={entry['p_value']:.4f}"
+        print(f"{line} -> {entry['status']}")
+        if entry["status"] == "REGRESSION":
+            regressions += 1
+    
+    print("=" * 60)
+    if regressions:
+        print(f"{regressions} significant regression(s) detected")
+        return 1
+    print("No significant regressions")
+    return 0
+
+
+def run_calibrate(args) -> int:
+    """Time merge sort with each candidate insertion cutoff and save the best one for this machine"""
+    print(f"Calibrating the merge sort cutoff on {args.size:,} random numbers ({args.repeat} runs each)")
+    print("-" * 60)
+    timings = merge_tuning.calibrate(sorting_algorithms.merge_sort, size=args.size, repeat=args.repeat)
+    entry = merge_tuning.save_calibration(sorting_algorithms.MERGE_CONFIG_PATH, timings, args.size)
+    print("\n".join(merge_tuning.report_lines(sorting_algorithms.MERGE_CONFIG_PATH, timings)))
+    print("-" * 60)
+    print(f"Merge sort will use cutoff {entry['cutoff']} on this machine")
+    return 0
+
+
+def run_networks(args) -> int:
+    """Microbenchmark the sorting networks against insertion sort at each size"""
+    print(f"Sorting networks vs insertion sort ({args.batches:,} random inputs per size, best of {args.repeat})")
+    print("-" * 60)
+    print(f"{'n':>3} {'comparators':>11} {'network':>10} {'insertion':>10} {'speedup':>8}")
+    for n, comparators, network_time, insertion_time in sorting_networks.benchmark(
+        sorting_algorithms.insertion_sort, batches=args.batches, repeat=args.repeat
+    ):
+        verified = "" if sorting_networks.verify(sorting_networks.NETWORKS[n], n) else "  NOT VERIFIED"
+        print(f"{n:>3} {comparators:>11} {network_time / args.batches * 1e6:>8.2f}us "
+              f"{insertion_time / args.batches * 1e6:>8.2f}us {insertion_time / network_time:>7.2f}x{verified}")
+    print("-" * 60)
+    return 0
+
+
+def run_records(args) -> int:
+    """Sort the rows of a delimited file by key columns (descending, stable) and write them out"""
+    start_time = time.perf_counter()
+    try:
+        header, rows = records.read_records(args.data, delimiter=args.delimiter, header=args.header)
+        columns = records.resolve_columns(args.keys, header)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"Error: {e}")
+        return 2
+    timings = [("Parse", time.perf_counter() - start_time)]
+    
+    start_time = time.perf_counter()
+    try:
+        keys, index_bits = records.decorate(rows, columns)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+    timings.append(("Extract keys", time.perf_counter() - start_time))
+    
+    engine = args.engine
+    if engine == "auto":
+        engine, reason = data_profile.recommend(data_profile.analyze(keys))
+        print(f"Auto picked {engine.replace('_', ' ').title()}: {reason}")
+    start_time = time.perf_counter()
+    sorted_keys = sorting_algorithms.ALGORITHMS[engine](keys)
+    timings.append((f"Sort ({engine})", time.perf_counter() - start_time))
+    
+    start_time = time.perf_counter()
+    sorted_rows = records.undecorate(rows, sorted_keys, index_bits)
+    records.write_records(args.output, header, sorted_rows, delimiter=args.delimiter)
+    timings.append(("Write", time.perf_counter() - start_time))
+    
+    names = [header[c] if header is not None else str(c + 1) for c in columns]
+    print(f"Sorted {len(rows):,} rows by {', '.join(names)} (descending) into '{args.output}'")
+    print("-" * 60)
+    for phase, elapsed_time in timings:
+        print(f"{phase}: {elapsed_time:.6f} seconds")
+    print("-" * 60)
+    return 0
+
+
+def run_distinct(args) -> int:
+    """Write the distinct values of a dataset in descending order as value,count lines"""
+    start_time = time.perf_counter()
+    numbers = read_numbers(args.data)
+    parse_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    pairs = sorting_algorithms.distinct_counts(numbers)
+    count_time = time.perf_counter() - start_time
+    
+    with open(args.output, "w") as file:
+        file.writelines(map("%d,%d\n".__mod__, pairs))
+    
+    print(f"{len(pairs):,} distinct values of {len(numbers):,} numbers written to '{args.output}'")
+    print(f"Parse: {parse_time:.6f} seconds, count and sort: {count_time:.6f} seconds")
+    return 0
+
+
+def run_merge(args) -> int:
+    """Stream a k-way merge of descending files into one descending file"""
+    for path in args.inputs:
+        if not os.path.exists(path):
+            print(f"Error: File '{path}' not found.")
+            return 2
+    
+    print(f"Merging {len(args.inputs)} files into '{args.output}'{' (verifying order)' if args.verify else ''}")
+    try:
+        stats = kway_merge.merge_files(args.inputs, args.output, verify=args.verify)
+    except kway_merge.UnsortedInputError as e:
+        print(f"Error: {e}")
+        return 1
+    except OSError as e:
+        print(f"Error: {e}")
+        return 2
+    
+    elapsed_time = max(stats["elapsed"], 1e-9)
+    print("-" * 60)
+    print(f"Merged {stats['count']:,} numbers in {stats['elapsed']:.6f} seconds")
+    print(f"Throughput: {stats['count'] / elapsed_time:,.0f} numbers/s, "
+          f"{stats['bytes_read'] / elapsed_time / (1 << 20):.1f} MiB/s read")
+    print("-" * 60)
+    return 0
+
+
+def positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SDA - Sorting in Descending Algorithms")
+    parser.add_argument("--record", default=None, metavar="HISTORY",
+                        help="record 'Run All Algorithms' results to this history file")
+    parser.add_argument("--profile", dest="profile_mode", action="store_const", const="cprofile",
+                        help=f"profile each sort with cProfile (.pstats files in '{sort_profiler.PROFILE_DIR}/')")
+    parser.add_argument("--profile-sampling", dest="profile_mode", action="store_const", const="sampling",
+                        help="profile each sort with the low-overhead sampling profiler")
+    parser.add_argument("--memory", dest="trace_memory", action="store_true",
+                        help="end 'Run All Algorithms' with the peak memory of heap sort against merge sort")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    bench = subparsers.add_parser("bench", help="benchmark all algorithms and record the results")
+    bench.add_argument("data", help="path to the .txt data file")
+    bench.add_argument("--repeat", type=positive_int, default=5,
+                       help=f"runs per algorithm (default: 5; compare needs at least {bench_history.MIN_SAMPLES})")
+    bench.add_argument("--history", default=bench_history.DEFAULT_HISTORY_FILE,
+                       help=f"history file (default: {bench_history.DEFAULT_HISTORY_FILE})")
+    
+    compare = subparsers.add_parser("compare", help="flag regressions against a saved baseline")
+    compare.add_argument("baseline", help="baseline history file")
+    compare.add_argument("--history", default=bench_history.DEFAULT_HISTORY_FILE,
+                         help=f"history file to check (default: {bench_history.DEFAULT_HISTORY_FILE})")
+    compare.add_argument("--threshold", type=float, default=0.05,
+                         help="minimum relative slowdown to report (default: 0.05)")
+    compare.add_argument("--alpha", type=float, default=0.05,
+                         help="significance level (default: 0.05)")
+    
+    calibrate = subparsers.add_parser("calibrate", help="find and save the best merge sort cutoff for this machine")
+    calibrate.add_argument("--size", type=int, default=merge_tuning.CALIBRATION_SIZE,
+                           help=f"numbers sorted per run (default: {merge_tuning.CALIBRATION_SIZE})")
+    calibrate.add_argument("--repeat", type=positive_int, default=5, help="runs per cutoff (default: 5)")
+    
+    networks = subparsers.add_parser("networks", help="time the sorting networks against insertion sort")
+    networks.add_argument("--batches", type=positive_int, default=2000, help="random inputs per size (default: 2000)")
+    networks.add_argument("--repeat", type=positive_int, default=5, help="runs per size (default: 5)")
+    
+    records_parser = subparsers.add_parser("records", help="sort the rows of a CSV file by key columns")
+    records_parser.add_argument("data", help="path to the delimited data file")
+    records_parser.add_argument("--keys", required=True,
+                                help="comma-separated key columns, most significant first (1-based numbers or header names)")
+    records_parser.add_argument("--output", required=True, help="file to write the sorted rows to")
+    records_parser.add_argument("--delimiter", default=",", help="field delimiter (default: ',')")
+    records_parser.add_argument("--header", action="store_true", help="the first row is a header and is kept on top")
+    records_parser.add_argument("--engine", default="auto", choices=["auto"] + list(sorting_algorithms.ALGORITHMS),
+                                help="sort engine for the packed keys (default: auto, picked from the key profile)")
+    
+    distinct = subparsers.add_parser("distinct", help="write distinct values with their counts (value,count lines)")
+    distinct.add_argument("data", help="path to the .txt data file")
+    distinct.add_argument("--output", required=True, help="file to write the value,count lines to")
+    
+    merge = subparsers.add_parser("merge", help="merge descending sorted files into one (streaming k-way merge)")
+    merge.add_argument("inputs", nargs="+", help="descending sorted .txt files, e.g. saved by Download Sorted Data")
+    merge.add_argument("--output", required=True, help="file to write the merged numbers to")
+    merge.add_argument("--verify", action="store_true", help="check that every input is descending while merging")
+    
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    
+    if args.command == "bench":
+        sys.exit(run_benchmark(args))
+    elif args.command == "compare":
+        sys.exit(run_compare(args))
+    elif args.command == "calibrate":
+        sys.exit(run_calibrate(args))
+    elif args.command == "networks":
+        sys.exit(run_networks(args))
+    elif args.command == "records":
+        sys.exit(run_records(args))
+    elif args.command == "distinct":
+        sys.exit(run_distinct(args))
+    elif args.command == "merge":
+        sys.exit(run_merge(args))
+    
+    analyzer = SortingAnalyzer(history_path=args.record, profile_mode=args.profile_mode, trace_memory=args.trace_memory)
     analyzer.run()
\ No newline at end of file
@@ -1,9 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import os
+import sys
 import time
 from typing import List
 import threading
 
+# The helpers shared by all three apps live in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sorting_algorithms
+
+from common import data_profile, file_tasks, process_runner, sort_profiler, sort_verifier
+from common.data_viewer import VirtualDataView
+from common.ui_queue import UIUpdateQueue
+
+# Shell Sort gap selector entry that runs every sequence side by side
+COMPARE_ALL_GAPS = "Compare all"
+
 class ModernSortingGUI:
     def __init__(self, root):
         self.root = root
@@ -14,7 +28,19 @@ class ModernSortingGUI:
         # Data storage
         self.data = []
         self.last_sorted_data = None
+        self.last_counts = None  # Distinct + counts result, exported as value,count lines
         self.is_sorting = False
+        self.is_loading = False
+        self.load_cancel = None
+        self.is_saving = False
+        self.save_cancel = None
+        self.dataset_name = None
+        self.data_profile = None  # data_profile.analyze() of the loaded data
+        self.profile_mode = None  # Captured from the Profile toggles when a run starts
+        self.use_process = False  # Captured from the Separate process toggle
+        self.trace_memory = False  # Captured from the Peak memory toggle
+        self.sort_process = None  # process_runner.ProcessSort while a child process sorts
+        self.stop_requested = False
         
         # Modern dark theme colors
         self.colors = {
@@ -27,12 +53,16 @@ class ModernSortingGUI:
             'text': '#E5E7EB',
             'text_dim': '#9CA3AF',
             'border': '#374151',
-            'accent': '#8B5CF6'
+            'accent': '#8B5CF6',
+            'danger': '#EF4444'
         }
         
         self.root.configure(bg=self.colors['bg'])
         self.setup_styles()
         self.create_widgets()
+        
+        # Worker threads update widgets only through this queue
+        self.ui = UIUpdateQueue(self.root)
     
     def setup_styles(self):
         style = ttk.Style()
@@ -46,6 +76,23 @@ class ModernSortingGUI:
             borderwidth=0,
             thickness=4
         )
+        
+        # Configure combobox
+        style.configure(
+            "TCombobox",
+            fieldbackground=self.colors['surface_light'],
+            background=self.colors['surface_light'],
+            foreground=self.colors['text'],
+            arrowcolor=self.colors['text'],
+            borderwidth=0,
+            relief="flat"
+        )
+        
+        style.map('TCombobox',
+            fieldbackground=[('readonly', self.colors['surface_light'])],
+            selectbackground=[('readonly', self.colors['primary'])],
+            selectforeground=[('readonly', self.colors['text'])]
+        )
     
     def create_widgets(self):
         # Header
@@ -118,12 +165,13 @@ class ModernSortingGUI:
         )
         self.file_label.pack(anchor=tk.W, padx=15, pady=(0, 12))
         
-        self.create_button(
+        self.load_button = self.create_button(
             load_section,
             "📁  Load Data File",
             self.load_file,
             self.colors['primary']
-        ).pack(fill=tk.X, padx=15, pady=(0, 15))
+        )
+        self.load_button.pack(fill=tk.X, padx=15, pady=(0, 15))
         
         # Algorithms section
         algo_section = self.create_section(parent, "Sorting Algorithms", top_margin=15)
@@ -131,7 +179,12 @@ class ModernSortingGUI:
         algorithms = [
             ("Bubble Sort", 1),
             ("Insertion Sort", 2),
-            ("Merge Sort", 3)
+            ("Merge Sort", 3),
+            ("Shell Sort", 5),
+            ("Introsort", 6),
+            ("Heap Sort", 9),
+            ("⚡  Auto (best for this data)", 7),
+            ("Σ  Distinct + counts", 8)
         ]
         
         for text, choice in algorithms:
@@ -144,6 +197,42 @@ class ModernSortingGUI:
             )
             btn.pack(fill=tk.X, padx=15, pady=3)
         
+        # Gap sequence for the Shell Sort button
+        gaps_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        gaps_row.pack(fill=tk.X, padx=15, pady=(4, 0))
+        tk.Label(
+            gaps_row,
+            text="Shell gaps",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim']
+        ).pack(side=tk.LEFT)
+        self.gaps_var = tk.StringVar(value=COMPARE_ALL_GAPS)
+        ttk.Combobox(
+            gaps_row,
+            textvariable=self.gaps_var,
+            values=[COMPARE_ALL_GAPS] + [name.title() for name in sorting_algorithms.GAP_SEQUENCES],
+            state="readonly",
+            font=("Segoe UI", 9),
+            width=14
+        ).pack(side=tk.RIGHT)
+        
+        # Profiling toggles
+        self.profile_var = tk.BooleanVar(value=False)
+        self.sampling_var = tk.BooleanVar(value=False)
+        toggle_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        toggle_row.pack(fill=tk.X, padx=15, pady=(8, 0))
+        self.create_toggle(toggle_row, "Profile", self.profile_var).pack(side=tk.LEFT)
+        self.create_toggle(toggle_row, "Sampling (low overhead)", self.sampling_var).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Sort in a killable child process so the UI stays responsive
+        self.process_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Separate process (enables Stop)", self.process_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
+        # Peak memory tracing after Run All; tracemalloc slows the sorts down, so it is off by default
+        self.memory_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Peak memory after Run All", self.memory_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
         # Run all button
         self.create_button(
             algo_section,
@@ -155,12 +244,21 @@ class ModernSortingGUI:
         # Export section
         export_section = self.create_section(parent, "Export", top_margin=15)
         
-        self.create_button(
+        self.save_button = self.create_button(
             export_section,
             "💾  Save Sorted Data",
             self.download_sorted_data,
             self.colors['success']
-        ).pack(fill=tk.X, padx=15, pady=(0, 15))
+        )
+        self.save_button.pack(fill=tk.X, padx=15, pady=(0, 15))
+        
+        # Export progress, shown under the save button while a file is written
+        self.save_progress = ttk.Progressbar(
+            export_section,
+            mode='determinate',
+            maximum=100,
+            style="Modern.Horizontal.TProgressbar"
+        )
     
     def create_section(self, parent, title, top_margin=0):
         section = tk.Frame(parent, bg=self.colors['surface'], relief=tk.FLAT)
@@ -203,6 +301,22 @@ class ModernSortingGUI:
         
         return btn
     
+    def create_toggle(self, parent, text, variable):
+        return tk.Checkbutton(
+            parent,
+            text=text,
+            variable=variable,
+            font=("Segoe UI", 9),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim'],
+            activebackground=self.colors['surface'],
+            activeforeground=self.colors['text'],
+            selectcolor=self.colors['surface_light'],
+            highlightthickness=0,
+            bd=0,
+            cursor="hand2"
+        )
+    
     def create_results_panel(self, parent):
         # Results header with progress
         header = tk.Frame(parent, bg=self.colors['surface'])
@@ -234,17 +348,25 @@ class ModernSortingGUI:
         # Spacer
         tk.Frame(right_container, bg=self.colors['surface'], width=10).pack(side=tk.LEFT)
         
-        # Clear button (30%)
+        # Stop and Clear buttons (30%)
         clear_btn_frame = tk.Frame(right_container, bg=self.colors['surface'])
         clear_btn_frame.pack(side=tk.LEFT)
         
+        self.create_button(
+            clear_btn_frame,
+            "⏹  Stop",
+            self.stop_sort,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(side=tk.LEFT, pady=6, padx=(0, 6))
+        
         self.create_button(
             clear_btn_frame,
             "🗑️  Clear",
             self.clear_results,
             self.colors['surface_light'],
             hover_color=self.colors['border']
-        ).pack(pady=6)
+        ).pack(side=tk.LEFT, pady=6)
         
         # Results text area
         text_frame = tk.Frame(parent, bg=self.colors['border'], bd=1)
@@ -271,8 +393,26 @@ class ModernSortingGUI:
         self.results_text.tag_config("header", foreground=self.colors['primary'], font=("Consolas", 11, "bold"))
         self.results_text.tag_config("success", foreground=self.colors['success'])
         self.results_text.tag_config("dim", foreground=self.colors['text_dim'])
+        self.results_text.tag_config("danger", foreground=self.colors['danger'])
+        
+        # Sorted data viewer (renders only the visible rows)
+        self.data_view = VirtualDataView(parent, self.colors, title="Complete Sorted Dataset")
+        self.data_view.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
     
     def load_file(self):
+        if self.is_loading:
+            self.cancel_load()
+            return
+        
+        if self.is_saving:
+            messagebox.showinfo("Info", "Please wait for the export to finish.")
+            return
+        
+        # New data mid-run would change the dataset under Run All and take over the progress bar
+        if self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the sort to finish.")
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Select a text file",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
@@ -281,89 +421,115 @@ class ModernSortingGUI:
         if not file_path:
             return
         
+        # Parse on a worker; the load button doubles as "Cancel" meanwhile
+        self.is_loading = True
+        self.load_cancel = threading.Event()
+        self.load_button.config(text="✖  Cancel Loading")
+        self.progress.config(mode='determinate', maximum=100, value=0)
+        self.set_status(f"Loading {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(target=self._load_file_worker, args=(file_path, self.load_cancel))
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_load(self):
+        """Stop the file load in progress"""
+        if self.is_loading:
+            self.load_cancel.set()
+            self.set_status("Cancelling load...")
+    
+    def _load_file_worker(self, file_path: str, cancel_event):
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                self.data = [
-                    int(x.strip()) 
-                    for x in content.replace(',', ' ').split() 
-                    if x.strip().lstrip('-').isdigit()
-                ]
-                
-                if not self.data:
-                    messagebox.showerror("Error", "No valid numbers found in the file.")
-                    return
-                
-                # Update UI
-                filename = file_path.split('/')[-1]
-                self.file_label.config(
-                    text=f"✓ {filename}",
-                    fg=self.colors['success']
-                )
-                
-                self.data_count_label.config(text=f"{len(self.data):,} numbers loaded")
-                self.status_label.config(text="Data loaded successfully")
-                
-                self.append_result(
-                    f"Loaded {len(self.data):,} numbers from {filename}\n",
-                    "success"
-                )
-                self.append_result(
-                    f"Preview (first 20): {str(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n\n",
-                    "dim"
-                )
-                
+            numbers = file_tasks.parse_numbers_file(
+                file_path,
+                progress=lambda done, total: self.ui.call(self._set_task_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_load, "Loading cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error reading file: {e}")
+            self.ui.call(self._end_load, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error reading file: {e}")
+            return
+        
+        # Profile the data here too, off the UI thread
+        self.set_status("Analyzing data...")
+        profile = data_profile.analyze(numbers)
+        
+        # Hand the parsed buffer to the UI thread in one step
+        self.ui.call(self._finish_load, file_path, numbers, profile)
     
-    def bubble_sort(self, arr: List[int]) -> List[int]:
-        arr = arr.copy()
-        n = len(arr)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                if arr[j] < arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-        return arr
+    def _set_task_progress(self, done: int, total: int):
+        self.progress.config(value=done * 100 / total if total else 100)
     
-    def insertion_sort(self, arr: List[int]) -> List[int]:
-        arr = arr.copy()
-        for i in range(1, len(arr)):
-            key = arr[i]
-            j = i - 1
-            while j >= 0 and arr[j] < key:
-                arr[j + 1] = arr[j]
-                j -= 1
-            arr[j + 1] = key
-        return arr
+    def _end_load(self, status: str):
+        """Restore the loading controls (main thread)"""
+        self.is_loading = False
+        self.load_button.config(text="📁  Load Data File")
+        self.progress.config(mode='indeterminate', value=0)
+        self.set_status(status)
     
-    def merge_sort(self, arr: List[int]) -> List[int]:
-        arr = arr.copy()
-        if len(arr) <= 1:
-            return arr
+    def _finish_load(self, file_path: str, numbers: List[int], profile: dict):
+        """Install freshly parsed data and refresh the preview (main thread)"""
+        if not numbers:
+            self._end_load("Ready to load data")
+            messagebox.showerror("Error", "No valid numbers found in the file.")
+            return
         
-        mid = len(arr) // 2
-        left = self.merge_sort(arr[:mid])
-        right = self.merge_sort(arr[mid:])
+        self._end_load("Data loaded successfully")
+        self.data = numbers
+        self.data_profile = profile
         
-        return self._merge(left, right)
-    
-    def _merge(self, left: List[int], right: List[int]) -> List[int]:
-        result = []
-        i = j = 0
+        # Update UI
+        filename = file_path.split('/')[-1]
+        self.dataset_name = filename
+        self.file_label.config(
+            text=f"✓ {filename}",
+            fg=self.colors['success']
+        )
         
-        while i < len(left) and j < len(right):
-            if left[i] >= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
+        self.data_count_label.config(text=f"{len(self.data):,} numbers loaded")
         
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+        self.append_result(
+            f"Loaded {len(self.data):,} numbers from {filename}\n",
+            "success"
+        )
+        self.append_result(
+            f"Preview (first 20): {str(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n",
+            "dim"
+        )
+        self.append_result("\n".join(data_profile.format_profile(profile)) + "\n\n", "dim")
+    
+    def bubble_sort(self, arr: List[int]) -> List[int]:
+        """Bubble sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.bubble_sort(arr)
+    
+    def insertion_sort(self, arr: List[int]) -> List[int]:
+        """Insertion sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.insertion_sort(arr)
+    
+    def merge_sort(self, arr: List[int]) -> List[int]:
+        """Merge sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.merge_sort(arr)
+    
+    def shell_sort(self, arr: List[int], gaps: str = "ciura") -> List[int]:
+        """Shell sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.shell_sort(arr, gaps=gaps)
+    
+    def introsort(self, arr: List[int]) -> List[int]:
+        """Introsort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.introsort(arr)
+    
+    def heap_sort(self, arr: List[int]) -> List[int]:
+        """Heap sort implementation (see sorting_algorithms)"""
+        return sorting_algorithms.heap_sort(arr)
     
     def run_sort(self, choice: int):
+        if self.is_loading:
+            messagebox.showinfo("Info", "Please wait for the file to finish loading.")
+            return
+        
         if not self.data:
             messagebox.showwarning("Warning", "Please load a data file first.")
             return
@@ -372,30 +538,47 @@ class ModernSortingGUI:
             messagebox.showinfo("Info", "Sorting is already in progress.")
             return
         
+        # Tk variables are only read on the main thread
+        if self.profile_var.get():
+            self.profile_mode = "sampling" if self.sampling_var.get() else "cprofile"
+        else:
+            self.profile_mode = None
+        self.use_process = self.process_var.get()
+        self.trace_memory = self.memory_var.get()
+        self.gap_choice = self.gaps_var.get()
+        self.stop_requested = False
+        
+        self.is_sorting = True
         thread = threading.Thread(target=self._execute_sort, args=(choice,))
         thread.daemon = True
         thread.start()
     
     def _execute_sort(self, choice: int):
-        self.is_sorting = True
-        self.progress.start(10)
+        self.ui.call(self.progress.start, 10)
         
         try:
             if choice == 4:
                 self._run_all_sorts()
+            elif choice == 5:
+                self._run_shell_sorts()
+            elif choice == 8:
+                self._run_distinct_counts()
             else:
                 algorithms = {
                     1: ("Bubble Sort", self.bubble_sort),
                     2: ("Insertion Sort", self.insertion_sort),
-                    3: ("Merge Sort", self.merge_sort)
+                    3: ("Merge Sort", self.merge_sort),
+                    6: ("Introsort", self.introsort),
+                    9: ("Heap Sort", self.heap_sort)
                 }
                 
-                name, sort_func = algorithms[choice]
-                self.status_label.config(text=f"Running {name}...")
+                if choice == 7:
+                    name, sort_func = self._auto_algorithm()
+                else:
+                    name, sort_func = algorithms[choice]
+                self.set_status(f"Running {name}...")
                 
-                start_time = time.time()
-                sorted_data = sort_func(self.data)
-                elapsed_time = time.time() - start_time
+                sorted_data, elapsed_time = self._timed_sort(name, sort_func)
                 
                 self.last_sorted_data = sorted_data
                 
@@ -404,47 +587,106 @@ class ModernSortingGUI:
                 self.append_result(f"Dataset size: {len(sorted_data):,} numbers\n\n", "dim")
                 
                 # Display entire sorted dataset
-                self.append_result("Complete Sorted Dataset:\n", "header")
-                self.append_result(self._format_dataset(sorted_data))
-                self.append_result("\n\n")
+                self.show_sorted_data(name, sorted_data)
                 
-                self.status_label.config(text=f"{name} completed")
+                self.set_status(f"{name} completed")
                 
+        except process_runner.SortKilled:
+            self.append_result("\nSort stopped\n", "dim")
+            self.set_status("Sort stopped")
         except Exception as e:
-            messagebox.showerror("Error", f"Error during sorting: {e}")
-            self.status_label.config(text="Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error during sorting: {e}")
+            self.set_status("Error occurred")
         finally:
             self.is_sorting = False
-            self.progress.stop()
+            self.ui.call(self.progress.stop)
     
-    def _format_dataset(self, data: List[int], items_per_line: int = 10) -> str:
-        """Format the dataset for display with a specified number of items per line"""
-        lines = []
-        for i in range(0, len(data), items_per_line):
-            chunk = data[i:i + items_per_line]
-            lines.append(', '.join(map(str, chunk)))
-        return '\n'.join(lines)
+    def _auto_algorithm(self):
+        """(name, sort_func) of the engine data_profile recommends for the loaded data"""
+        algorithm, reason = data_profile.recommend(self.data_profile)
+        name = algorithm.replace("_", " ").title()
+        self.append_result(f"\nAuto picked {name}: {reason}\n", "dim")
+        return f"Auto ({name})", sorting_algorithms.ALGORITHMS[algorithm]
+    
+    def _timed_sort(self, name: str, sort_func, **kwargs):
+        """Run one sort on the current data, wrapped in the selected profiler if enabled"""
+        if self.use_process and not self.profile_mode:
+            return self._process_sort(sort_func, kwargs)
+        
+        if not self.profile_mode:
+            start_time = time.time()
+            result = sort_func(self.data, **kwargs)
+            return result, time.time() - start_time
+        
+        output_path = sort_profiler.profile_output_path(
+            name, self.dataset_name, len(self.data), self.profile_mode
+        )
+        result, elapsed_time, report = sort_profiler.run_profiled(
+            lambda data: sort_func(data, **kwargs), self.data, self.profile_mode, output_path
+        )
+        self.append_result("\n".join(report) + "\n", "dim")
+        return result, elapsed_time
+    
+    def _process_sort(self, sort_func, kwargs=None):
+        """Run sort_func in a child process (see process_runner), driving the progress bar"""
+        if self.stop_requested:
+            raise process_runner.SortKilled()
+        
+        self.sort_process = process_runner.ProcessSort(
+            sorting_algorithms.__name__, sort_func.__name__, self.data,
+            on_progress=lambda fraction: self.ui.call(self.progress.config, value=fraction * 100),
+            kwargs=kwargs
+        )
+        self.ui.call(self.progress.stop)
+        self.ui.call(self.progress.config, mode='determinate', value=0)
+        try:
+            sorted_data, elapsed_time, extra = self.sort_process.run()
+        finally:
+            self.sort_process = None
+            self.ui.call(self.progress.config, mode='indeterminate', value=0)
+            self.ui.call(self.progress.start, 10)
+        
+        result = (sorted_data,) + tuple(extra) if extra else sorted_data
+        return result, elapsed_time
+    
+    def stop_sort(self):
+        """Kill the running sort (only possible in Separate process mode)"""
+        if not self.is_sorting:
+            return
+        
+        if not self.use_process:
+            messagebox.showinfo("Info", "Enable 'Separate process' before starting a sort to be able to stop it.")
+            return
+        
+        self.stop_requested = True
+        if self.sort_process is not None:
+            self.sort_process.kill()
+        self.set_status("Stopping...")
     
     def _run_all_sorts(self):
-        self.status_label.config(text="Running all algorithms...")
+        self.set_status("Running all algorithms...")
         
         algorithms = [
             ("Bubble Sort", self.bubble_sort),
             ("Insertion Sort", self.insertion_sort),
-            ("Merge Sort", self.merge_sort)
+            ("Merge Sort", self.merge_sort),
+            ("Shell Sort (Ciura)", self.shell_sort),
+            ("Introsort", self.introsort),
+            ("Heap Sort", self.heap_sort)
         ]
         
         results = []
+        # Fingerprint the input once; every output is checked against it
+        expected = sort_verifier.fingerprint(self.data)
         self.append_result("\nPerformance Comparison\n", "header")
         
         for name, sort_func in algorithms:
-            start_time = time.time()
-            sorted_data = sort_func(self.data)
-            elapsed_time = time.time() - start_time
+            sorted_data, elapsed_time = self._timed_sort(name, sort_func)
             results.append((name, elapsed_time))
             
             self.append_result(f"{name}: ", "dim")
             self.append_result(f"{elapsed_time:.6f}s\n", "success")
+            self._append_verification(name, sorted_data, expected)
         
         # Rank by time
         results.sort(key=lambda x: x[1])
@@ -453,54 +695,187 @@ class ModernSortingGUI:
         for rank, (name, elapsed_time) in enumerate(results, 1):
             self.append_result(f"{rank}. {name}: {elapsed_time:.6f}s\n")
         
+        if self.trace_memory:
+            self._memory_comparison()
+        
         # Display complete sorted dataset from the last algorithm
         self.last_sorted_data = sorted_data
-        self.append_result(f"\nComplete Sorted Dataset ({len(sorted_data):,} numbers):\n", "header")
-        self.append_result(self._format_dataset(sorted_data))
-        self.append_result("\n\n")
+        self.show_sorted_data("All Algorithms", sorted_data)
         
-        self.status_label.config(text="All algorithms completed")
+        self.set_status("All algorithms completed")
     
-    def append_result(self, text: str, tag=None):
-        self.results_text.config(state=tk.NORMAL)
-        if tag:
-            self.results_text.insert(tk.END, text, tag)
+    def _append_verification(self, name: str, sorted_data: List[int], expected):
+        """Check an output in linear time and report the result and its cost"""
+        self.set_status(f"Verifying {name}...")
+        verification = sort_verifier.verify(sorted_data, expected)
+        self.append_result(f"  {sort_verifier.describe(verification)}\n", "dim" if verification["ok"] else "danger")
+    
+    def _memory_comparison(self):
+        """Peak memory of in-place heap sort against merge sort, traced on a prefix of the data"""
+        sample = self.data[:sort_profiler.MEMORY_SAMPLE]
+        self.set_status("Measuring peak memory...")
+        self.append_result(f"\nPeak Memory (first {len(sample):,} numbers)\n", "header")
+        for name, sort_func, in_place in [
+            ("Heap Sort (in place)", sorting_algorithms.heap_sort_in_place, True),
+            ("Merge Sort", self.merge_sort, False),
+        ]:
+            peak, auxiliary = sort_profiler.measure_peak_memory(sort_func, sample, in_place)
+            self.append_result(f"{name}: ", "dim")
+            self.append_result(f"{sort_profiler.format_bytes(peak)} peak", "success")
+            self.append_result(f", {sort_profiler.format_bytes(auxiliary)} beyond the output\n", "dim")
+    
+    def _run_shell_sorts(self):
+        """Shell sort with the selected gap sequence, or every sequence side by side"""
+        if self.gap_choice == COMPARE_ALL_GAPS:
+            sequences = list(sorting_algorithms.GAP_SEQUENCES)
         else:
-            self.results_text.insert(tk.END, text)
-        self.results_text.see(tk.END)
-        self.results_text.config(state=tk.DISABLED)
+            sequences = [self.gap_choice.lower()]
+        
+        results = []
+        self.append_result("\nShell Sort Gap Sequences\n", "header")
+        
+        for gaps in sequences:
+            name = f"Shell Sort ({gaps.title()})"
+            self.set_status(f"Running {name}...")
+            (sorted_data, comparisons), elapsed_time = self._timed_sort(
+                name, sorting_algorithms.counted_shell_sort, gaps=gaps
+            )
+            results.append((name, elapsed_time, comparisons))
+            
+            self.append_result(f"{name}: ", "dim")
+            self.append_result(f"{elapsed_time:.6f}s", "success")
+            self.append_result(f", {comparisons:,} comparisons\n", "dim")
+        
+        if len(results) > 1:
+            results.sort(key=lambda x: x[1])
+            self.append_result("\nRanking (Fastest to Slowest)\n", "header")
+            for rank, (name, elapsed_time, comparisons) in enumerate(results, 1):
+                self.append_result(f"{rank}. {name}: {elapsed_time:.6f}s, {comparisons:,} comparisons\n")
+        
+        self.last_sorted_data = sorted_data
+        self.show_sorted_data(results[0][0] if len(results) == 1 else "Shell Sort", sorted_data)
+        
+        self.set_status("Shell sort completed")
+    
+    def _run_distinct_counts(self):
+        """Distinct values with their frequencies, without sorting the full list"""
+        self.set_status("Counting distinct values...")
+        start_time = time.time()
+        pairs = sorting_algorithms.distinct_counts(self.data)
+        elapsed_time = time.time() - start_time
+        
+        self.last_sorted_data = pairs
+        self.last_counts = pairs
+        
+        self.append_result("\nDistinct + Counts\n", "header")
+        self.append_result(f"Time: {elapsed_time:.6f} seconds\n", "success")
+        self.append_result(
+            f"Distinct values: {len(pairs):,} of {len(self.data):,} numbers "
+            f"({len(pairs) / len(self.data):.1%} of the full sorted list)\n\n",
+            "dim"
+        )
+        self.ui.call(
+            self.data_view.show, pairs, "Distinct + Counts",
+            f"(value, count) in descending order ({len(pairs):,} distinct values)"
+        )
+        
+        self.set_status("Distinct + counts completed")
+    
+    def append_result(self, text: str, tag=None):
+        """Append to the results text box (safe from worker threads)"""
+        self.ui.append(self.results_text, text, tag)
+    
+    def set_status(self, text: str):
+        """Update the footer status (safe from worker threads)"""
+        self.ui.call(self.status_label.config, text=text)
+    
+    def show_sorted_data(self, title: str, data: List[int]):
+        """Show a sorted dataset in the virtualized viewer below the results (safe from worker threads)"""
+        self.ui.call(self.data_view.show, data, title, f"Descending Order ({len(data):,} numbers)")
     
     def download_sorted_data(self):
+        if self.is_saving:
+            self.cancel_save()
+            return
+        
         if self.last_sorted_data is None:
             messagebox.showwarning("Warning", "No sorted data available. Run a sorting algorithm first.")
             return
         
+        if self.is_loading or self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the current task to finish.")
+            return
+        
+        # A Distinct + counts result (until the next sort replaces it) is saved as value,count lines
+        counts = self.last_sorted_data is self.last_counts
         file_path = filedialog.asksaveasfilename(
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialfile="sorted_data.txt"
+            defaultextension=".csv" if counts else ".txt",
+            filetypes=[("CSV files", "*.csv") if counts else ("Text files", "*.txt"), ("All files", "*.*")],
+            initialfile="distinct_counts.csv" if counts else "sorted_data.txt"
         )
         
         if not file_path:
             return
         
+        # Write on a worker; the save button doubles as "Cancel" and the export
+        # has its own progress bar, leaving the main one to any sort started meanwhile
+        self.is_saving = True
+        self.save_cancel = threading.Event()
+        self.save_button.config(text="✖  Cancel Saving")
+        self.save_progress.config(value=0)
+        self.save_progress.pack(fill=tk.X, padx=15, pady=(0, 12), after=self.save_button)
+        self.set_status(f"Saving {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(
+            target=self._save_file_worker, args=(file_path, self.last_sorted_data, self.save_cancel, counts)
+        )
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_save(self):
+        """Stop the export in progress; the partial file is discarded"""
+        if self.is_saving:
+            self.save_cancel.set()
+            self.set_status("Cancelling save...")
+    
+    def _save_file_worker(self, file_path: str, numbers: List[int], cancel_event, counts: bool = False):
+        write = file_tasks.write_counts_file if counts else file_tasks.write_numbers_file
         try:
-            with open(file_path, 'w') as file:
-                for num in self.last_sorted_data:
-                    file.write(f"{num}\n")
-            
-            messagebox.showinfo("Success", f"Saved {len(self.last_sorted_data):,} numbers successfully!")
-            self.status_label.config(text="Data exported successfully")
-            
+            write(
+                file_path,
+                numbers,
+                progress=lambda done, total: self.ui.call(self._set_save_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_save, "Saving cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving file: {e}")
+            self.ui.call(self._end_save, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error saving file: {e}")
+            return
+        
+        self.ui.call(self._end_save, "Data exported successfully")
+        self.ui.call(messagebox.showinfo, "Success", f"Saved {len(numbers):,} {'distinct values' if counts else 'numbers'} successfully!")
+    
+    def _set_save_progress(self, done: int, total: int):
+        if self.is_saving:
+            self.save_progress.config(value=done * 100 / total if total else 100)
+    
+    def _end_save(self, status: str):
+        """Restore the export controls (main thread)"""
+        self.is_saving = False
+        self.save_button.config(text="💾  Save Sorted Data")
+        self.save_progress.pack_forget()
+        self.set_status(status)
     
     def clear_results(self):
         """Clear the results text area"""
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
         self.results_text.config(state=tk.DISABLED)
-        self.status_label.config(text="Results cleared")
+        self.data_view.clear()
+        self.set_status("Results cleared")
 
 
 
@@ -0,0 +1,402 @@
+"""
+Sorting algorithms shared by the Sorting Algorithm Analyzer CLI and GUI.
+
+Kept free of tkinter so the functions can be pickled into a separate
+process (see process_runner). All algorithms sort in DESCENDING order and
+return a new list. The optional progress(done, total) callback is called
+from the outer loop.
+"""
+import os
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+
+from common import merge_tuning, sorting_networks
+
+# Per-machine config written by the calibrate command
+MERGE_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), merge_tuning.CONFIG_NAME)
+# merge_sort hands lists of this size or smaller to a sorting network or insertion sort
+MERGE_CUTOFF = merge_tuning.load_cutoff(MERGE_CONFIG_PATH)
+# counting_sort refuses value ranges this wide (its count loop walks every value)
+COUNTING_MAX_RANGE = 1 << 24
+# Digit width of radix_sort: 2048 buckets per pass
+RADIX_BITS = 11
+
+
+def bubble_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Bubble sort implementation"""
+    arr = arr.copy()
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            if arr[j] < arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        if progress is not None:
+            progress(i + 1, n)
+    return arr
+
+
+def insertion_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Insertion sort implementation"""
+    arr = arr.copy()
+    _gapped_insertion(arr, 1, progress)
+    return arr
+
+
+def _gapped_insertion(arr: List[int], gap: int, progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """
+    In-place insertion sort of every gap-th item (gap 1 is plain insertion sort).
+    Returns the number of comparisons made.
+    """
+    n = len(arr)
+    comparisons = 0
+    for i in range(gap, n):
+        key = arr[i]
+        j = i - gap
+        while j >= 0 and arr[j] < key:
+            arr[j + gap] = arr[j]
+            j -= gap
+        arr[j + gap] = key
+        # One comparison per shift, plus the one that stopped the scan
+        comparisons += (i - j) // gap - 1 + (j >= 0)
+        # Work grows with i, so report the share of i² done
+        if progress is not None and i & 1023 == 0:
+            progress(i * i, n * n)
+    return comparisons
+
+
+def shell_gaps(n: int) -> List[int]:
+    """Shell (1959): n/2, n/4, ..., 1"""
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps or [1]
+
+
+def knuth_gaps(n: int) -> List[int]:
+    """Knuth (1973): 1, 4, 13, 40, ... (3h + 1) up to n/3"""
+    gaps = [1]
+    while gaps[-1] * 3 + 1 < n // 3:
+        gaps.append(gaps[-1] * 3 + 1)
+    return gaps[::-1]
+
+
+def sedgewick_gaps(n: int) -> List[int]:
+    """Sedgewick (1986): 1, 8, 23, 77, 281, ... (4^k + 3·2^(k-1) + 1)"""
+    gaps = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps[::-1]
+
+
+def ciura_gaps(n: int) -> List[int]:
+    """Ciura (2001): 1, 4, 10, 23, 57, ..., 1750, then ×2.25"""
+    gaps = [1]
+    for gap in (4, 10, 23, 57, 132, 301, 701, 1750):
+        if gap >= n:
+            return gaps[::-1]
+        gaps.append(gap)
+    while int(gaps[-1] * 2.25) < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return gaps[::-1]
+
+
+# Gap sequence name -> generator (largest gap first, always ending in 1)
+GAP_SEQUENCES = {
+    "shell": shell_gaps,
+    "knuth": knuth_gaps,
+    "sedgewick": sedgewick_gaps,
+    "ciura": ciura_gaps,
+}
+
+
+def shell_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+               gaps: str = "ciura") -> List[int]:
+    """Shell sort implementation (gapped insertion sort, no extra memory)"""
+    return counted_shell_sort(arr, progress, gaps)[0]
+
+
+def counted_shell_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                       gaps: str = "ciura") -> Tuple[List[int], int]:
+    """Shell sort that also returns its comparison count: (sorted_array, comparisons)"""
+    arr = arr.copy()
+    sequence = GAP_SEQUENCES[gaps](len(arr))
+    comparisons = 0
+    for done, gap in enumerate(sequence, 1):
+        comparisons += _gapped_insertion(arr, gap)
+        if progress is not None:
+            progress(done, len(sequence))
+    return arr, comparisons
+
+
+def merge_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+               cutoff: Optional[int] = None) -> List[int]:
+    """Merge sort implementation (a sorting network or insertion sort at or below the cutoff, MERGE_CUTOFF by default)"""
+    if cutoff is None:
+        cutoff = MERGE_CUTOFF
+    arr = arr.copy()
+    if len(arr) <= max(cutoff, 1):
+        if len(arr) <= sorting_networks.MAX_SIZE:
+            sorting_networks.sort_range(arr, 0, len(arr))
+        else:
+            _gapped_insertion(arr, 1)
+        return arr
+    
+    mid = len(arr) // 2
+    left = merge_sort(arr[:mid], cutoff=cutoff)
+    if progress is not None:
+        progress(1, 2)
+    right = merge_sort(arr[mid:], cutoff=cutoff)
+    
+    return _merge(left, right)
+
+
+def _merge(left: List[int], right: List[int]) -> List[int]:
+    """Helper function for merge sort"""
+    result = []
+    i = j = 0
+    
+    while i < len(left) and j < len(right):
+        if left[i] >= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+    
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+# Partitions at or below this size are finished by a sorting network
+NETWORK_CUTOFF = sorting_networks.MAX_SIZE
+# Partitions above this size take a ninther (median of three medians) pivot
+NINTHER_THRESHOLD = 128
+
+
+def introsort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Introsort implementation (3-way quicksort with heap sort fallback)"""
+    arr = arr.copy()
+    n = len(arr)
+    _introsort_range(arr, 0, n, 2 * n.bit_length(), progress)
+    return arr
+
+
+def _introsort_range(arr: List[int], lo: int, hi: int, depth_limit: int,
+                     progress: Optional[Callable[[int, int], None]] = None):
+    """Partition arr[lo:hi] down to sorting network size, heap sorting any range that recurses too deep"""
+    n = hi - lo
+    settled = 0
+    steps = 0
+    stack = [(lo, hi, depth_limit)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= NETWORK_CUTOFF:
+            sorting_networks.sort_range(arr, lo, hi)
+            settled += hi - lo
+            continue
+        if depth == 0:
+            # Too many unbalanced partitions: heap sort keeps this range O(n log n)
+            _heap_sort_range(arr, lo, hi)
+            settled += hi - lo
+            continue
+
+        lt, gt = _partition3(arr, lo, hi, _choose_pivot(arr, lo, hi))
+        settled += gt - lt
+        stack.append((gt, hi, depth - 1))
+        stack.append((lo, lt, depth - 1))
+
+        steps += 1
+        if progress is not None and steps & 1023 == 0:
+            progress(settled, n)
+
+
+def _choose_pivot(arr: List[int], lo: int, hi: int) -> int:
+    """Median of three, or Tukey's ninther on large partitions"""
+    mid = (lo + hi) // 2
+    last = hi - 1
+    if hi - lo > NINTHER_THRESHOLD:
+        step = (hi - lo) // 8
+        return _median3(
+            _median3(arr[lo], arr[lo + step], arr[lo + 2 * step]),
+            _median3(arr[mid - step], arr[mid], arr[mid + step]),
+            _median3(arr[last - 2 * step], arr[last - step], arr[last])
+        )
+    return _median3(arr[lo], arr[mid], arr[last])
+
+
+def _median3(a: int, b: int, c: int) -> int:
+    """Median of three values"""
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _partition3(arr: List[int], lo: int, hi: int, pivot: int) -> Tuple[int, int]:
+    """
+    Dutch flag partition of arr[lo:hi] for descending order:
+    arr[lo:lt] > pivot, arr[lt:gt] == pivot, arr[gt:hi] < pivot.
+    Returns (lt, gt); a run of equal keys is settled in one pass.
+    """
+    lt = i = lo
+    gt = hi - 1
+    while i <= gt:
+        value = arr[i]
+        if value > pivot:
+            arr[i] = arr[lt]
+            arr[lt] = value
+            lt += 1
+            i += 1
+        elif value < pivot:
+            arr[i] = arr[gt]
+            arr[gt] = value
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt + 1
+
+
+def heap_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Heap sort implementation on a copy of arr (see heap_sort_in_place)"""
+    arr = list(arr)
+    heap_sort_in_place(arr, progress)
+    return arr
+
+
+def heap_sort_in_place(arr: List[int], progress: Optional[Callable[[int, int], None]] = None):
+    """Heap sort of arr itself, with O(1) auxiliary memory"""
+    _heap_sort_range(arr, 0, len(arr), progress)
+
+
+def _heap_sort_range(arr: List[int], lo: int, hi: int,
+                     progress: Optional[Callable[[int, int], None]] = None):
+    """In-place heap sort of arr[lo:hi] into descending order using a min-heap"""
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        # The smallest item goes to the back of the shrinking heap
+        smallest = arr[lo]
+        arr[lo] = arr[lo + end]
+        arr[lo + end] = smallest
+        _sift_down(arr, lo, 0, end)
+        if progress is not None and end & 1023 == 0:
+            progress(size - end, size)
+
+
+def _sift_down(arr: List[int], lo: int, root: int, size: int):
+    """
+    Restore the min-heap below root in arr[lo:lo + size], bottom-up: the
+    hole walks down to a leaf along the smaller children (one comparison
+    per level), then the item climbs back to its place. Values are moved
+    into the hole one at a time, so no swap tuples are built.
+    """
+    item = arr[lo + root]
+    start = root
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child + 1] < arr[lo + child]:
+            child += 1
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    while root > start:
+        parent = (root - 1) >> 1
+        if arr[lo + parent] <= item:
+            break
+        arr[lo + root] = arr[lo + parent]
+        root = parent
+    arr[lo + root] = item
+
+
+def counting_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Counting sort implementation (O(n + k) for integers spanning k values)"""
+    if not arr:
+        return []
+    counts = Counter(arr)
+    lo = min(counts)
+    hi = max(counts)
+    if hi - lo >= COUNTING_MAX_RANGE:
+        raise ValueError(f"counting sort needs a value range below {COUNTING_MAX_RANGE:,}, got {hi - lo + 1:,}")
+    result = []
+    for value in range(hi, lo - 1, -1):
+        count = counts.get(value)
+        if count:
+            result += [value] * count
+        if progress is not None and value & 0xFFFF == 0:
+            progress(hi - value, hi - lo + 1)
+    return result
+
+
+def radix_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """LSD radix sort implementation (RADIX_BITS per pass, offset by the minimum so negatives work)"""
+    if len(arr) < 2:
+        return list(arr)
+    lo = min(arr)
+    span = max(arr) - lo
+    shifts = range(0, max(span.bit_length(), 1), RADIX_BITS)
+    mask = (1 << RADIX_BITS) - 1
+    for done, shift in enumerate(shifts):
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for value in arr:
+            buckets[((value - lo) >> shift) & mask].append(value)
+        # Each pass is stable, so concatenating high buckets first keeps the order descending
+        arr = [value for bucket in reversed(buckets) for value in bucket]
+        if progress is not None:
+            progress(done + 1, len(shifts))
+    return arr
+
+
+def natural_merge_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """Natural merge sort implementation (merges the existing descending runs pairwise)"""
+    runs = _descending_runs(arr)
+    total = len(runs)
+    while len(runs) > 1:
+        merged = [_merge(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+        if progress is not None:
+            progress(total - len(runs), total - 1)
+    return runs[0] if runs else []
+
+
+def _descending_runs(arr: List[int]) -> List[List[int]]:
+    """Split arr into its maximal non-increasing runs"""
+    runs = []
+    start = 0
+    for i in range(1, len(arr)):
+        if arr[i - 1] < arr[i]:
+            runs.append(list(arr[start:i]))
+            start = i
+    if arr:
+        runs.append(list(arr[start:]))
+    return runs
+
+
+def distinct_counts(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[Tuple[int, int]]:
+    """Distinct values in descending order with their frequencies (one counting pass, then only the distinct keys are sorted)"""
+    counts = Counter(arr)
+    return [(value, counts[value]) for value in introsort(list(counts), progress)]
+
+
+# Name -> function, in menu order
+ALGORITHMS = {
+    "bubble_sort": bubble_sort,
+    "insertion_sort": insertion_sort,
+    "merge_sort": merge_sort,
+    "shell_sort": shell_sort,
+    "introsort": introsort,
+    "heap_sort": heap_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "natural_merge_sort": natural_merge_sort,
+}
@@ -0,0 +1,90 @@
+"""
+Headless benchmark entry point for the Bubble Sort Analyzer.
+
+Runs the same bubble sort variants as the GUI without importing
+tkinter, so it works on display-less build servers. From the repository root:
+
+    python -m LabWork1 bench --dataset LabWork1/dataset.txt --sizes 1000,5000
+
+Timings, pass and comparison counts are printed as JSON.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import List
+
+# Make the sibling modules importable for both "python -m LabWork1" and "python LabWork1"
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# ... and the helpers shared by all three apps, in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bubble_algorithms
+
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset.txt")
+
+
+def parse_sizes(text: str) -> List[int]:
+    return [int(size.replace("_", "")) for size in text.split(",") if size.strip()]
+
+
+def run_bench(args) -> dict:
+    data = bubble_algorithms.read_numbers(args.dataset)
+    if not data:
+        raise ValueError(f"No valid numbers found in '{args.dataset}'")
+    
+    results = []
+    for size in args.sizes or [len(data)]:
+        subset = data[:size]
+        for name in args.algorithms:
+            sort_func = bubble_algorithms.ALGORITHMS[name]
+            times = []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                _, passes, comparisons = sort_func(subset)
+                times.append(time.perf_counter() - start_time)
+            results.append({
+                "algorithm": name,
+                "n": len(subset),
+                "time": statistics.median(times),
+                "times": times,
+                "passes": passes,
+                "comparisons": comparisons,
+                "max_passes": max(len(subset) - 1, 0),
+            })
+    
+    return {
+        "dataset": os.path.abspath(args.dataset),
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m LabWork1", description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    bench = subparsers.add_parser("bench", help="time the bubble sort variants and print JSON")
+    bench.add_argument("--dataset", default=DEFAULT_DATASET, help="path to the .txt data file")
+    bench.add_argument("--sizes", type=parse_sizes, default=None,
+                       help="comma-separated prefix sizes, e.g. 1000,5000 (default: whole file)")
+    bench.add_argument("--algorithms", nargs="+", choices=list(bubble_algorithms.ALGORITHMS),
+                       default=list(bubble_algorithms.ALGORITHMS))
+    bench.add_argument("--repeat", type=int, default=1, help="runs per algorithm and size (default: 1)")
+    
+    args = parser.parse_args(argv)
+    try:
+        report = run_bench(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Bubble sort variants compared by the Bubble Sort Analyzer.
+
+Kept free of tkinter so the same code can run headless (see __main__.py).
+All variants sort in DESCENDING order and return
+(sorted_array, passes, comparisons).
+The optional progress(done, total) callback is called after every pass,
+which lets process_runner report progress from a separate process, and an
+optional PassTelemetry records per-pass statistics. Classic and optimized
+bubble sort also take a step(arr, lo, hi) callback that sort_visualizer uses
+to watch them: after each pass arr is the live working list and lo..hi the
+range that pass scanned.
+"""
+import csv
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class PassTelemetry:
+    """
+    Per-pass swap count, last swap index and elapsed time, stored in
+    preallocated arrays so recording costs one perf_counter() per pass.
+    Create it right before the sort: elapsed times count from construction.
+    """
+
+    def __init__(self, max_passes: int):
+        size = max(max_passes, 0)
+        self.swaps = array('q', bytes(8 * size))
+        self.last_swap = array('q', bytes(8 * size))
+        self.elapsed = array('d', bytes(8 * size))  # Seconds since the start, at the end of each pass
+        self.passes = 0
+        self.start_time = time.perf_counter()
+
+    def record(self, swaps: int, last_swap: int):
+        i = self.passes
+        self.swaps[i] = swaps
+        self.last_swap[i] = last_swap
+        self.elapsed[i] = time.perf_counter() - self.start_time
+        self.passes = i + 1
+
+    def pass_time(self, i: int) -> float:
+        return self.elapsed[i] - (self.elapsed[i - 1] if i else 0.0)
+
+    def idle_passes(self) -> Tuple[int, float]:
+        """Passes (and their seconds) run after the data was already sorted"""
+        for i in range(self.passes):
+            if self.swaps[i] == 0:
+                before = self.elapsed[i - 1] if i else 0.0
+                return self.passes - i, self.elapsed[self.passes - 1] - before
+        return 0, 0.0
+
+
+def write_telemetry_csv(file_path: str, telemetry: Dict[str, PassTelemetry]):
+    """Write variant,pass,swaps,last_swap_index,elapsed_s,pass_s rows"""
+    with open(file_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["variant", "pass", "swaps", "last_swap_index", "elapsed_s", "pass_s"])
+        for name, record in telemetry.items():
+            for i in range(record.passes):
+                writer.writerow([
+                    name, i + 1, record.swaps[i], record.last_swap[i],
+                    f"{record.elapsed[i]:.9f}", f"{record.pass_time(i):.9f}"
+                ])
+
+
+def read_numbers(file_path: str) -> List[int]:
+    """Parse every integer token (spaces, commas or newlines) from a text file"""
+    with open(file_path, 'r') as file:
+        content = file.read()
+    return [
+        int(x.strip())
+        for x in content.replace(',', ' ').split()
+        if x.strip().lstrip('-').isdigit()
+    ]
+
+
+def classic_bubble_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                        telemetry: Optional[PassTelemetry] = None,
+                        step: Optional[Callable[[List[int], int, int], None]] = None) -> Tuple[List[int], int, int]:
+    """
+    Classic Bubble Sort - Always performs n-1 passes
+    Sorts in DESCENDING order (largest to smallest)
+    Returns: (sorted_array, number_of_passes, comparisons)
+    """
+    arr = arr.copy()
+    n = len(arr)
+    passes = 0
+    comparisons = 0
+    
+    # Always perform n-1 passes
+    for i in range(n - 1):
+        passes += 1
+        comparisons += n - 1 - i
+        if telemetry is None:
+            # Compare adjacent elements
+            for j in range(n - 1 - i):
+                # Changed comparison for descending order
+                if arr[j] < arr[j + 1]:
+                    # Swap if out of order
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        else:
+            swaps, last_swap = _counted_pass(arr, 0, n - 1 - i)
+            telemetry.record(swaps, last_swap)
+        
+        if step is not None:
+            step(arr, 0, n - i)
+        if progress is not None:
+            progress(passes, n - 1)
+    
+    return arr, passes, comparisons
+
+
+def optimized_bubble_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                          telemetry: Optional[PassTelemetry] = None,
+                          step: Optional[Callable[[List[int], int, int], None]] = None) -> Tuple[List[int], int, int]:
+    """
+    Optimized Bubble Sort - Early exit if no swaps occur
+    Sorts in DESCENDING order (largest to smallest)
+    Returns: (sorted_array, number_of_passes, comparisons)
+    """
+    arr = arr.copy()
+    n = len(arr)
+    passes = 0
+    comparisons = 0
+    
+    for i in range(n - 1):
+        passes += 1
+        comparisons += n - 1 - i
+        swapped = False  # Flag to detect swaps
+        
+        if telemetry is None:
+            for j in range(n - 1 - i):
+                # Changed comparison for descending order
+                if arr[j] < arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    swapped = True  # Mark that a swap occurred
+        else:
+            swaps, last_swap = _counted_pass(arr, 0, n - 1 - i)
+            telemetry.record(swaps, last_swap)
+            swapped = swaps > 0
+        
+        if step is not None:
+            step(arr, 0, n - i)
+        
+        # If no swaps occurred, array is sorted - exit early
+        if not swapped:
+            break
+        
+        if progress is not None:
+            progress(passes, n - 1)
+    
+    return arr, passes, comparisons
+
+
+def last_swap_bubble_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                          telemetry: Optional[PassTelemetry] = None) -> Tuple[List[int], int, int]:
+    """
+    Last-Swap Bubble Sort - Each pass stops where the previous one last swapped
+    Everything after the last swap is already in place, so a tail that
+    stopped changing is never scanned again (no swaps at all means done)
+    Sorts in DESCENDING order (largest to smallest)
+    Returns: (sorted_array, number_of_passes, comparisons)
+    """
+    arr = arr.copy()
+    n = len(arr)
+    passes = 0
+    comparisons = 0
+    bound = n - 1  # Compare arr[j] and arr[j + 1] for j < bound
+    
+    while bound > 0:
+        passes += 1
+        comparisons += bound
+        
+        if telemetry is None:
+            last_swap = -1
+            for j in range(bound):
+                if arr[j] < arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    last_swap = j
+        else:
+            swaps, last_swap = _counted_pass(arr, 0, bound)
+            telemetry.record(swaps, last_swap)
+        
+        # arr[last_swap + 1:] is final
+        bound = last_swap
+        
+        if progress is not None:
+            progress(n - 1 - max(bound, 0), n - 1)
+    
+    return arr, passes, comparisons
+
+
+def cocktail_shaker_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                         telemetry: Optional[PassTelemetry] = None) -> Tuple[List[int], int, int]:
+    """
+    Cocktail Shaker Sort - Alternates forward and backward passes
+    A forward pass carries the smallest value to the back, a backward pass
+    carries the largest value to the front. That fixes "turtles" (for a
+    descending sort, large values near the back) which a one-direction
+    bubble sort moves only one position per pass. Both bounds shrink to
+    the last swap of their pass
+    Sorts in DESCENDING order (largest to smallest)
+    Returns: (sorted_array, number_of_passes, comparisons); each sweep is a pass
+    """
+    arr = arr.copy()
+    n = len(arr)
+    passes = 0
+    comparisons = 0
+    start, end = 0, n - 1  # Unsorted pairs are (j, j + 1) for start <= j < end
+    
+    while start < end:
+        # Forward pass
+        passes += 1
+        comparisons += end - start
+        if telemetry is None:
+            last_swap = -1
+            for j in range(start, end):
+                if arr[j] < arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    last_swap = j
+        else:
+            swaps, last_swap = _counted_pass(arr, start, end)
+            telemetry.record(swaps, last_swap)
+        if last_swap < 0:
+            break
+        end = last_swap
+        
+        if start >= end:
+            break
+        
+        # Backward pass
+        passes += 1
+        comparisons += end - start
+        if telemetry is None:
+            last_swap = -1
+            for j in range(end - 1, start - 1, -1):
+                if arr[j] < arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    last_swap = j
+        else:
+            swaps, last_swap = _counted_pass(arr, start, end, backward=True)
+            telemetry.record(swaps, last_swap)
+        if last_swap < 0:
+            break
+        start = last_swap + 1
+        
+        if progress is not None:
+            progress(n - 1 - (end - start), n - 1)
+    
+    return arr, passes, comparisons
+
+
+def _counted_pass(arr: List[int], start: int, end: int, backward: bool = False) -> Tuple[int, int]:
+    """
+    One descending bubble pass over the pairs (j, j + 1), start <= j < end.
+    Returns (swaps, last_swap_index), where the index is -1 without swaps.
+    """
+    swaps = 0
+    last_swap = -1
+    for j in (range(end - 1, start - 1, -1) if backward else range(start, end)):
+        if arr[j] < arr[j + 1]:
+            arr[j], arr[j + 1] = arr[j + 1], arr[j]
+            swaps += 1
+            last_swap = j
+    return swaps, last_swap
+
+
+# Name -> function, in the order the GUI presents them
+ALGORITHMS = {
+    "classic_bubble_sort": classic_bubble_sort,
+    "optimized_bubble_sort": optimized_bubble_sort,
+    "last_swap_bubble_sort": last_swap_bubble_sort,
+    "cocktail_shaker_sort": cocktail_shaker_sort,
+}
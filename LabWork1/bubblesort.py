@@ -1,9 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import os
+import sys
 import time
 from typing import List, Tuple
 import threading
 
+# The helpers shared by all three apps live in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bubble_algorithms
+
+from common import file_tasks, process_runner, sort_profiler
+from common.data_viewer import VirtualDataView
+from common.sort_visualizer import SortVisualizer
+from common.ui_queue import UIUpdateQueue
+
 class ModernSortingGUI:
     def __init__(self, root):
         self.root = root
@@ -15,6 +27,17 @@ class ModernSortingGUI:
         self.data = []
         self.last_sorted_data = None
         self.is_sorting = False
+        self.is_loading = False
+        self.load_cancel = None
+        self.is_saving = False
+        self.save_cancel = None
+        self.dataset_name = None
+        self.profile_mode = None  # Captured from the Profile toggles when a run starts
+        self.use_process = False  # Captured from the Separate process toggle
+        self.record_telemetry = False  # Captured from the Pass telemetry toggle
+        self.sort_process = None  # process_runner.ProcessSort while a child process sorts
+        self.stop_requested = False
+        self.telemetry = {}  # Variant key -> bubble_algorithms.PassTelemetry from the last comparison
         
         # Modern dark theme colors
         self.colors = {
@@ -34,6 +57,9 @@ class ModernSortingGUI:
         self.root.configure(bg=self.colors['bg'])
         self.setup_styles()
         self.create_widgets()
+        
+        # Worker threads update widgets only through this queue
+        self.ui = UIUpdateQueue(self.root)
     
     def setup_styles(self):
         style = ttk.Style()
@@ -127,12 +153,13 @@ class ModernSortingGUI:
         )
         self.file_label.pack(anchor=tk.W, padx=15, pady=(0, 12))
         
-        self.create_button(
+        self.load_button = self.create_button(
             load_section,
             "📁  Load Data File",
             self.load_file,
             self.colors['primary']
-        ).pack(fill=tk.X, padx=15, pady=(0, 15))
+        )
+        self.load_button.pack(fill=tk.X, padx=15, pady=(0, 15))
         
         # Algorithms section
         algo_section = self.create_section(parent, "Bubble Sort Variants", top_margin=15)
@@ -177,22 +204,102 @@ class ModernSortingGUI:
             anchor=tk.W
         ).pack(anchor=tk.W, padx=30, pady=(2, 8))
         
-        # Run both button
-        self.create_button(
+        # Last-Swap Bubble Sort
+        btn = self.create_button(
             algo_section,
-            "▶  Compare Both",
+            "Last-Swap Bubble Sort",
             lambda: self.run_sort(3),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        tk.Label(
+            algo_section,
+            text="Scan stops at the previous pass's last swap",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim'],
+            anchor=tk.W
+        ).pack(anchor=tk.W, padx=30, pady=(2, 8))
+        
+        # Cocktail Shaker Sort
+        btn = self.create_button(
+            algo_section,
+            "Cocktail Shaker Sort",
+            lambda: self.run_sort(4),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        tk.Label(
+            algo_section,
+            text="Alternating passes, moves turtles quickly",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim'],
+            anchor=tk.W
+        ).pack(anchor=tk.W, padx=30, pady=(2, 8))
+        
+        # Profiling toggles
+        self.profile_var = tk.BooleanVar(value=False)
+        self.sampling_var = tk.BooleanVar(value=False)
+        toggle_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        toggle_row.pack(fill=tk.X, padx=15, pady=(8, 0))
+        self.create_toggle(toggle_row, "Profile", self.profile_var).pack(side=tk.LEFT)
+        self.create_toggle(toggle_row, "Sampling (low overhead)", self.sampling_var).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Sort in a killable child process so the UI stays responsive
+        self.process_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Separate process (enables Stop)", self.process_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
+        # Per-pass telemetry of Compare All; counting swaps slows the passes, so it is off by default
+        self.telemetry_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Pass telemetry (slower passes)", self.telemetry_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
+        # Compare all variants button
+        self.create_button(
+            algo_section,
+            "▶  Compare All Variants",
+            lambda: self.run_sort(5),
             self.colors['accent']
-        ).pack(fill=tk.X, padx=15, pady=(12, 15))
+        ).pack(fill=tk.X, padx=15, pady=(12, 6))
+        
+        # Live bar visualiser
+        self.create_button(
+            algo_section,
+            "🎞  Visualize Sort",
+            self.open_visualizer,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(fill=tk.X, padx=15, pady=(0, 15))
         
         # Export section
         export_section = self.create_section(parent, "Export", top_margin=15)
         
-        self.create_button(
+        self.save_button = self.create_button(
             export_section,
             "💾  Save Sorted Data",
             self.download_sorted_data,
             self.colors['success']
+        )
+        self.save_button.pack(fill=tk.X, padx=15, pady=(0, 6))
+        
+        # Export progress, shown under the save button while a file is written
+        self.save_progress = ttk.Progressbar(
+            export_section,
+            mode='determinate',
+            maximum=100,
+            style="Modern.Horizontal.TProgressbar"
+        )
+        
+        self.create_button(
+            export_section,
+            "📈  Export Pass Telemetry (CSV)",
+            self.export_telemetry,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
         ).pack(fill=tk.X, padx=15, pady=(0, 15))
     
     def create_section(self, parent, title, top_margin=0):
@@ -236,6 +343,22 @@ class ModernSortingGUI:
         
         return btn
     
+    def create_toggle(self, parent, text, variable):
+        return tk.Checkbutton(
+            parent,
+            text=text,
+            variable=variable,
+            font=("Segoe UI", 9),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim'],
+            activebackground=self.colors['surface'],
+            activeforeground=self.colors['text'],
+            selectcolor=self.colors['surface_light'],
+            highlightthickness=0,
+            bd=0,
+            cursor="hand2"
+        )
+    
     def create_results_panel(self, parent):
         # Results header with progress
         header = tk.Frame(parent, bg=self.colors['surface'])
@@ -267,17 +390,25 @@ class ModernSortingGUI:
         # Spacer
         tk.Frame(right_container, bg=self.colors['surface'], width=10).pack(side=tk.LEFT)
         
-        # Clear button (30%)
+        # Stop and Clear buttons (30%)
         clear_btn_frame = tk.Frame(right_container, bg=self.colors['surface'])
         clear_btn_frame.pack(side=tk.LEFT)
         
+        self.create_button(
+            clear_btn_frame,
+            "⏹  Stop",
+            self.stop_sort,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(side=tk.LEFT, pady=6, padx=(0, 6))
+        
         self.create_button(
             clear_btn_frame,
             "🗑️  Clear",
             self.clear_results,
             self.colors['surface_light'],
             hover_color=self.colors['border']
-        ).pack(pady=6)
+        ).pack(side=tk.LEFT, pady=6)
         
         # Main results container with two columns
         results_container = tk.Frame(parent, bg=self.colors['bg'])
@@ -325,46 +456,47 @@ class ModernSortingGUI:
         self.stats_text.tag_config("warning", foreground=self.colors['warning'])
         self.stats_text.tag_config("dim", foreground=self.colors['text_dim'])
         
-        # Right column - Sorted Data (60%)
-        right_column = tk.Frame(results_container, bg=self.colors['bg'])
-        right_column.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        # Sorted data label
+        # Swaps-per-pass chart, filled by "Compare All Variants"
         tk.Label(
-            right_column,
-            text="Sorted Data Output",
+            left_column,
+            text="Swaps per Pass",
             font=("Segoe UI", 10, "bold"),
             bg=self.colors['bg'],
             fg=self.colors['text'],
             anchor=tk.W
-        ).pack(anchor=tk.W, pady=(0, 8))
+        ).pack(anchor=tk.W, pady=(10, 8))
         
-        # Sorted data text area
-        data_frame = tk.Frame(right_column, bg=self.colors['border'], bd=1)
-        data_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.data_text = scrolledtext.ScrolledText(
-            data_frame,
-            font=("Consolas", 10),
-            wrap=tk.WORD,
+        self.telemetry_canvas = tk.Canvas(
+            left_column,
+            height=130,
             bg=self.colors['surface'],
-            fg=self.colors['text'],
-            insertbackground=self.colors['primary'],
-            selectbackground=self.colors['primary'],
-            selectforeground=self.colors['text'],
-            relief=tk.FLAT,
-            bd=0,
-            padx=15,
-            pady=15,
-            state=tk.DISABLED
+            highlightthickness=1,
+            highlightbackground=self.colors['border']
         )
-        self.data_text.pack(fill=tk.BOTH, expand=True)
+        self.telemetry_canvas.pack(fill=tk.X)
+        
+        # Right column - Sorted Data (60%)
+        right_column = tk.Frame(results_container, bg=self.colors['bg'])
+        right_column.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        # Configure text tags for data output
-        self.data_text.tag_config("header", foreground=self.colors['primary'], font=("Consolas", 11, "bold"))
-        self.data_text.tag_config("dim", foreground=self.colors['text_dim'])
+        # Sorted data viewer (renders only the visible rows)
+        self.data_view = VirtualDataView(right_column, self.colors)
+        self.data_view.pack(fill=tk.BOTH, expand=True)
     
     def load_file(self):
+        if self.is_loading:
+            self.cancel_load()
+            return
+        
+        if self.is_saving:
+            messagebox.showinfo("Info", "Please wait for the export to finish.")
+            return
+        
+        # New data mid-run would change the dataset under Run All and take over the progress bar
+        if self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the sort to finish.")
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Select a text file",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
@@ -373,90 +505,101 @@ class ModernSortingGUI:
         if not file_path:
             return
         
+        # Parse on a worker; the load button doubles as "Cancel" meanwhile
+        self.is_loading = True
+        self.load_cancel = threading.Event()
+        self.load_button.config(text="✖  Cancel Loading")
+        self.progress.config(mode='determinate', maximum=100, value=0)
+        self.set_status(f"Loading {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(target=self._load_file_worker, args=(file_path, self.load_cancel))
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_load(self):
+        """Stop the file load in progress"""
+        if self.is_loading:
+            self.load_cancel.set()
+            self.set_status("Cancelling load...")
+    
+    def _load_file_worker(self, file_path: str, cancel_event):
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                self.data = [
-                    int(x.strip()) 
-                    for x in content.replace(',', ' ').split() 
-                    if x.strip().lstrip('-').isdigit()
-                ]
-                
-                if not self.data:
-                    messagebox.showerror("Error", "No valid numbers found in the file.")
-                    return
-                
-                # Update UI
-                filename = file_path.split('/')[-1]
-                self.file_label.config(
-                    text=f"✓ {filename}",
-                    fg=self.colors['success']
-                )
-                
-                self.data_count_label.config(text=f"{len(self.data):,} numbers loaded")
-                self.status_label.config(text="Data loaded successfully")
-                
-                self.append_result(
-                    f"Loaded {len(self.data):,} numbers from {filename}\n",
-                    "success"
-                )
-                self.append_result(
-                    f"Preview (first 20): {str(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n\n",
-                    "dim"
-                )
-                
+            numbers = file_tasks.parse_numbers_file(
+                file_path,
+                progress=lambda done, total: self.ui.call(self._set_task_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_load, "Loading cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error reading file: {e}")
-    
-    def classic_bubble_sort(self, arr: List[int]) -> Tuple[List[int], int]:
-        """
-        Classic Bubble Sort - Always performs n-1 passes
-        Sorts in DESCENDING order (largest to smallest)
-        Returns: (sorted_array, number_of_passes)
-        """
-        arr = arr.copy()
-        n = len(arr)
-        passes = 0
-        
-        # Always perform n-1 passes
-        for i in range(n - 1):
-            passes += 1
-            # Compare adjacent elements
-            for j in range(n - 1 - i):
-                # Changed comparison for descending order
-                if arr[j] < arr[j + 1]:
-                    # Swap if out of order
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-        
-        return arr, passes
-    
-    def optimized_bubble_sort(self, arr: List[int]) -> Tuple[List[int], int]:
-        """
-        Optimized Bubble Sort - Early exit if no swaps occur
-        Sorts in DESCENDING order (largest to smallest)
-        Returns: (sorted_array, number_of_passes)
-        """
-        arr = arr.copy()
-        n = len(arr)
-        passes = 0
-        
-        for i in range(n - 1):
-            passes += 1
-            swapped = False  # Flag to detect swaps
-            
-            for j in range(n - 1 - i):
-                # Changed comparison for descending order
-                if arr[j] < arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    swapped = True  # Mark that a swap occurred
-            
-            # If no swaps occurred, array is sorted - exit early
-            if not swapped:
-                break
+            self.ui.call(self._end_load, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error reading file: {e}")
+            return
+        
+        # Hand the parsed buffer to the UI thread in one step
+        self.ui.call(self._finish_load, file_path, numbers)
+    
+    def _set_task_progress(self, done: int, total: int):
+        self.progress.config(value=done * 100 / total if total else 100)
+    
+    def _end_load(self, status: str):
+        """Restore the loading controls (main thread)"""
+        self.is_loading = False
+        self.load_button.config(text="📁  Load Data File")
+        self.progress.config(mode='indeterminate', value=0)
+        self.set_status(status)
+    
+    def _finish_load(self, file_path: str, numbers: List[int]):
+        """Install freshly parsed data and refresh the preview (main thread)"""
+        if not numbers:
+            self._end_load("Ready to load data")
+            messagebox.showerror("Error", "No valid numbers found in the file.")
+            return
+        
+        self._end_load("Data loaded successfully")
+        self.data = numbers
+        
+        # Update UI
+        filename = file_path.split('/')[-1]
+        self.dataset_name = filename
+        self.file_label.config(
+            text=f"✓ {filename}",
+            fg=self.colors['success']
+        )
+        
+        self.data_count_label.config(text=f"{len(self.data):,} numbers loaded")
         
-        return arr, passes
+        self.append_result(
+            f"Loaded {len(self.data):,} numbers from {filename}\n",
+            "success"
+        )
+        self.append_result(
+            f"Preview (first 20): {str(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n\n",
+            "dim"
+        )
+    
+    def classic_bubble_sort(self, arr: List[int], telemetry=None) -> Tuple[List[int], int, int]:
+        """Classic Bubble Sort - always n-1 passes (see bubble_algorithms)"""
+        return bubble_algorithms.classic_bubble_sort(arr, telemetry=telemetry)
+    
+    def optimized_bubble_sort(self, arr: List[int], telemetry=None) -> Tuple[List[int], int, int]:
+        """Optimized Bubble Sort - early exit if no swaps occur (see bubble_algorithms)"""
+        return bubble_algorithms.optimized_bubble_sort(arr, telemetry=telemetry)
+    
+    def last_swap_bubble_sort(self, arr: List[int], telemetry=None) -> Tuple[List[int], int, int]:
+        """Last-Swap Bubble Sort - scan bound shrinks to the last swap (see bubble_algorithms)"""
+        return bubble_algorithms.last_swap_bubble_sort(arr, telemetry=telemetry)
+    
+    def cocktail_shaker_sort(self, arr: List[int], telemetry=None) -> Tuple[List[int], int, int]:
+        """Cocktail Shaker Sort - bidirectional passes (see bubble_algorithms)"""
+        return bubble_algorithms.cocktail_shaker_sort(arr, telemetry=telemetry)
     
     def run_sort(self, choice: int):
+        if self.is_loading:
+            messagebox.showinfo("Info", "Please wait for the file to finish loading.")
+            return
+        
         if not self.data:
             messagebox.showwarning("Warning", "Please load a data file first.")
             return
@@ -465,29 +608,38 @@ class ModernSortingGUI:
             messagebox.showinfo("Info", "Sorting is already in progress.")
             return
         
+        # Tk variables are only read on the main thread
+        if self.profile_var.get():
+            self.profile_mode = "sampling" if self.sampling_var.get() else "cprofile"
+        else:
+            self.profile_mode = None
+        self.use_process = self.process_var.get()
+        self.record_telemetry = self.telemetry_var.get()
+        self.stop_requested = False
+        
+        self.is_sorting = True
         thread = threading.Thread(target=self._execute_sort, args=(choice,))
         thread.daemon = True
         thread.start()
     
     def _execute_sort(self, choice: int):
-        self.is_sorting = True
-        self.progress.start(10)
+        self.ui.call(self.progress.start, 10)
         
         try:
-            if choice == 3:
-                self._compare_both()
+            if choice == 5:
+                self._compare_all()
             else:
                 algorithms = {
                     1: ("Classic Bubble Sort", self.classic_bubble_sort),
-                    2: ("Optimized Bubble Sort", self.optimized_bubble_sort)
+                    2: ("Optimized Bubble Sort", self.optimized_bubble_sort),
+                    3: ("Last-Swap Bubble Sort", self.last_swap_bubble_sort),
+                    4: ("Cocktail Shaker Sort", self.cocktail_shaker_sort)
                 }
                 
                 name, sort_func = algorithms[choice]
-                self.status_label.config(text=f"Running {name}...")
+                self.set_status(f"Running {name}...")
                 
-                start_time = time.time()
-                sorted_data, passes = sort_func(self.data)
-                elapsed_time = time.time() - start_time
+                (sorted_data, passes, comparisons), elapsed_time = self._timed_sort(name, sort_func)
                 
                 self.last_sorted_data = sorted_data
                 
@@ -495,119 +647,252 @@ class ModernSortingGUI:
                 self.append_result(f"\n{name}\n", "header")
                 self.append_result(f"Time: {elapsed_time:.6f} seconds\n", "success")
                 self.append_result(f"Passes: {passes} out of {len(self.data) - 1} maximum\n", "warning")
+                self.append_result(f"Comparisons: {comparisons:,}\n")
                 self.append_result(f"Dataset size: {len(sorted_data):,} numbers\n\n", "dim")
                 
                 # Sorted data column
-                self.clear_data_output()
-                self.append_data_output(f"{name}\n", "header")
-                self.append_data_output(f"Descending Order ({len(sorted_data):,} numbers)\n\n", "dim")
-                self.append_data_output(self._format_dataset(sorted_data))
+                self.show_sorted_data(name, sorted_data)
                 
-                self.status_label.config(text=f"{name} completed")
+                self.set_status(f"{name} completed")
                 
+        except process_runner.SortKilled:
+            self.append_result("\nSort stopped\n", "dim")
+            self.set_status("Sort stopped")
         except Exception as e:
-            messagebox.showerror("Error", f"Error during sorting: {e}")
-            self.status_label.config(text="Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error during sorting: {e}")
+            self.set_status("Error occurred")
         finally:
             self.is_sorting = False
-            self.progress.stop()
+            self.ui.call(self.progress.stop)
     
-    def _format_dataset(self, data: List[int], items_per_line: int = 10) -> str:
-        """Format the dataset for display with a specified number of items per line"""
-        lines = []
-        for i in range(0, len(data), items_per_line):
-            chunk = data[i:i + items_per_line]
-            lines.append(', '.join(map(str, chunk)))
-        return '\n'.join(lines)
+    def _timed_sort(self, name: str, sort_func, **kwargs):
+        """Run one sort on the current data, wrapped in the selected profiler if enabled"""
+        if self.use_process and not self.profile_mode:
+            return self._process_sort(sort_func, kwargs)
+        
+        if not self.profile_mode:
+            start_time = time.time()
+            result = sort_func(self.data, **kwargs)
+            return result, time.time() - start_time
+        
+        output_path = sort_profiler.profile_output_path(
+            name, self.dataset_name, len(self.data), self.profile_mode
+        )
+        result, elapsed_time, report = sort_profiler.run_profiled(
+            lambda data: sort_func(data, **kwargs), self.data, self.profile_mode, output_path
+        )
+        self.append_result("\n".join(report) + "\n", "dim")
+        return result, elapsed_time
+    
+    def _process_sort(self, sort_func, kwargs=None):
+        """Run sort_func in a child process (see process_runner), driving the progress bar"""
+        if self.stop_requested:
+            raise process_runner.SortKilled()
+        
+        self.sort_process = process_runner.ProcessSort(
+            bubble_algorithms.__name__, sort_func.__name__, self.data,
+            on_progress=lambda fraction: self.ui.call(self.progress.config, value=fraction * 100),
+            kwargs=kwargs
+        )
+        self.ui.call(self.progress.stop)
+        self.ui.call(self.progress.config, mode='determinate', value=0)
+        try:
+            sorted_data, elapsed_time, extra = self.sort_process.run()
+        finally:
+            self.sort_process = None
+            self.ui.call(self.progress.config, mode='indeterminate', value=0)
+            self.ui.call(self.progress.start, 10)
+        
+        result = (sorted_data,) + tuple(extra) if extra else sorted_data
+        return result, elapsed_time
     
-    def _compare_both(self):
-        self.status_label.config(text="Comparing both algorithms...")
+    def stop_sort(self):
+        """Kill the running sort (only possible in Separate process mode)"""
+        if not self.is_sorting:
+            return
+        
+        if not self.use_process:
+            messagebox.showinfo("Info", "Enable 'Separate process' before starting a sort to be able to stop it.")
+            return
+        
+        self.stop_requested = True
+        if self.sort_process is not None:
+            self.sort_process.kill()
+        self.set_status("Stopping...")
+    
+    def _compare_all(self):
+        self.set_status("Comparing all variants...")
         
         # Statistics column
         self.append_result("\n═══ Performance Comparison ═══\n", "header")
         self.append_result(f"Dataset size: {len(self.data):,} numbers\n\n", "dim")
         
-        # Run Classic Bubble Sort
-        self.append_result("Classic Bubble Sort:\n", "header")
-        start_time = time.time()
-        classic_sorted, classic_passes = self.classic_bubble_sort(self.data)
-        classic_time = time.time() - start_time
-        
-        self.append_result(f"  Time: {classic_time:.6f} seconds\n", "success")
-        self.append_result(f"  Passes: {classic_passes} (always n-1)\n\n")
-        
-        # Run Optimized Bubble Sort
-        self.append_result("Optimized Bubble Sort:\n", "header")
-        start_time = time.time()
-        optimized_sorted, optimized_passes = self.optimized_bubble_sort(self.data)
-        optimized_time = time.time() - start_time
-        
-        self.append_result(f"  Time: {optimized_time:.6f} seconds\n", "success")
-        self.append_result(f"  Passes: {optimized_passes} out of {len(self.data) - 1} maximum\n\n")
-        
-        # Analysis
-        self.append_result("Analysis:\n", "header")
-        
-        time_diff = classic_time - optimized_time
-        percent_diff = (time_diff / classic_time * 100) if classic_time > 0 else 0
-        passes_saved = classic_passes - optimized_passes
-        
-        if optimized_time < classic_time:
-            self.append_result(f"  ✓ Optimized was {abs(percent_diff):.2f}% faster\n", "success")
-            self.append_result(f"  ✓ Saved {time_diff:.6f} seconds\n", "success")
-        elif optimized_time > classic_time:
-            self.append_result(f"  • Classic was {abs(percent_diff):.2f}% faster\n", "warning")
-            self.append_result(f"  • Difference: {abs(time_diff):.6f} seconds\n")
-        else:
-            self.append_result(f"  • Both took the same time\n")
-        
-        self.append_result(f"  • Passes saved: {passes_saved}\n", "warning" if passes_saved > 0 else "")
-        
-        if passes_saved > 0:
-            self.append_result(f"  • Early exit occurred after {optimized_passes} passes\n", "success")
-        else:
-            self.append_result(f"  • No early exit (data required full sorting)\n")
+        variants = [
+            ("classic", "Classic Bubble Sort", self.classic_bubble_sort),
+            ("optimized", "Optimized Bubble Sort", self.optimized_bubble_sort),
+            ("last_swap", "Last-Swap Bubble Sort", self.last_swap_bubble_sort),
+            ("cocktail", "Cocktail Shaker Sort", self.cocktail_shaker_sort)
+        ]
+        max_passes = max(len(self.data) - 1, 0)
+        self.telemetry = {}
+        results = []
+        # The telemetry stays in this process, so it is not recorded for child process sorts
+        recording = self.record_telemetry and not self.use_process
+        if recording:
+            self.append_result("Pass telemetry on: times include counting the swaps of every pass\n\n", "dim")
+        
+        for key, name, sort_func in variants:
+            self.set_status(f"Running {name}...")
+            self.append_result(f"{name}:\n", "header")
+            kwargs = {}
+            if recording:
+                # Recorded by the timed run itself, into preallocated arrays
+                self.telemetry[key] = kwargs["telemetry"] = bubble_algorithms.PassTelemetry(max_passes)
+            (sorted_data, passes, comparisons), elapsed_time = self._timed_sort(name, sort_func, **kwargs)
+            results.append((name, elapsed_time, passes, comparisons))
+            
+            self.append_result(f"  Time: {elapsed_time:.6f} seconds\n", "success")
+            self.append_result(f"  Passes: {passes:,} out of {max_passes:,} maximum\n")
+            self.append_result(f"  Comparisons: {comparisons:,}\n\n")
+        
+        # Ranking
+        classic_time, classic_passes, classic_comparisons = results[0][1:]
+        self.append_result("Ranking (Fastest to Slowest):\n", "header")
+        for rank, (name, elapsed_time, passes, comparisons) in enumerate(sorted(results, key=lambda r: r[1]), 1):
+            self.append_result(f"  {rank}. {name}\n", "success" if rank == 1 else None)
+            self.append_result(f"     {elapsed_time:.6f}s · {passes:,} passes · {comparisons:,} comparisons\n", "dim")
+        
+        # Analysis against the classic baseline
+        self.append_result("\nAnalysis (vs Classic):\n", "header")
+        for name, elapsed_time, passes, comparisons in results[1:]:
+            percent_diff = ((classic_time - elapsed_time) / classic_time * 100) if classic_time > 0 else 0
+            saved = classic_comparisons - comparisons
+            self.append_result(f"  • {name}: ", "warning" if saved > 0 else None)
+            self.append_result(
+                f"{abs(percent_diff):.2f}% {'faster' if percent_diff >= 0 else 'slower'}, "
+                f"{classic_passes - passes:,} passes and {saved:,} comparisons saved\n"
+            )
+        
+        # Work the classic sort did after the data was already sorted
+        classic = self.telemetry.get("classic")
+        if classic is not None and classic.passes:
+            idle_passes, idle_time = classic.idle_passes()
+            total_time = classic.elapsed[classic.passes - 1]
+            share = (idle_time / total_time * 100) if total_time > 0 else 0
+            self.append_result(
+                f"  • Classic ran {idle_passes} passes ({share:.1f}% of its run) on already sorted data\n",
+                "warning" if idle_passes > 0 else None
+            )
+        self.ui.call(self.draw_telemetry)
         
         # Display complete sorted dataset in right column
-        self.last_sorted_data = optimized_sorted
-        self.clear_data_output()
-        self.append_data_output("Comparison Results\n", "header")
-        self.append_data_output(f"Descending Order ({len(optimized_sorted):,} numbers)\n\n", "dim")
-        self.append_data_output(self._format_dataset(optimized_sorted))
+        self.last_sorted_data = sorted_data
+        self.show_sorted_data("Comparison Results", sorted_data)
         
-        self.status_label.config(text="Comparison completed")
+        self.set_status("Comparison completed")
     
     def append_result(self, text: str, tag=None):
-        """Append to statistics text box"""
-        self.stats_text.config(state=tk.NORMAL)
-        if tag:
-            self.stats_text.insert(tk.END, text, tag)
-        else:
-            self.stats_text.insert(tk.END, text)
-        self.stats_text.see(tk.END)
-        self.stats_text.config(state=tk.DISABLED)
+        """Append to the statistics text box (safe from worker threads)"""
+        self.ui.append(self.stats_text, text, tag)
     
-    def append_data_output(self, text: str, tag=None):
-        """Append to sorted data output text box"""
-        self.data_text.config(state=tk.NORMAL)
-        if tag:
-            self.data_text.insert(tk.END, text, tag)
-        else:
-            self.data_text.insert(tk.END, text)
-        self.data_text.see(tk.END)
-        self.data_text.config(state=tk.DISABLED)
+    def set_status(self, text: str):
+        """Update the footer status (safe from worker threads)"""
+        self.ui.call(self.status_label.config, text=text)
+    
+    def show_sorted_data(self, title: str, data: List[int]):
+        """Show a sorted dataset in the virtualized output panel (safe from worker threads)"""
+        self.ui.call(self.data_view.show, data, title, f"Descending Order ({len(data):,} numbers)")
     
-    def clear_data_output(self):
-        """Clear the data output text area"""
-        self.data_text.config(state=tk.NORMAL)
-        self.data_text.delete(1.0, tk.END)
-        self.data_text.config(state=tk.DISABLED)
+    def draw_telemetry(self):
+        """Plot swaps per pass for each variant of the last comparison"""
+        canvas = self.telemetry_canvas
+        canvas.delete("all")
+        recorded = {name: record for name, record in self.telemetry.items() if record.passes}
+        if not recorded:
+            return
+        
+        width = max(canvas.winfo_width(), 2)
+        height = max(canvas.winfo_height(), 2)
+        max_passes = max(record.passes for record in recorded.values())
+        max_swaps = max(max(record.swaps[:record.passes]) for record in recorded.values()) or 1
+        colors = {
+            "classic": self.colors['warning'],
+            "optimized": self.colors['success'],
+            "last_swap": self.colors['primary'],
+            "cocktail": self.colors['accent']
+        }
+        
+        for offset, (name, record) in enumerate(recorded.items()):
+            color = colors.get(name, self.colors['primary'])
+            # One point per pixel column at most
+            step = -(-record.passes // width)
+            points = []
+            for i in range(0, record.passes, step):
+                points.append(i / max_passes * (width - 10) + 5)
+                points.append(height - 5 - record.swaps[i] / max_swaps * (height - 25))
+            if len(points) == 2:
+                points += points
+            canvas.create_line(*points, fill=color, width=2)
+            canvas.create_text(
+                8, 8 + offset * 14, text=f"{name} ({record.passes:,} passes)",
+                anchor=tk.NW, fill=color, font=("Segoe UI", 8)
+            )
+        
+        # Where the optimized sort stopped
+        optimized = recorded.get("optimized")
+        if optimized is not None and optimized.passes < max_passes:
+            x = optimized.passes / max_passes * (width - 10) + 5
+            canvas.create_line(x, 0, x, height, fill=self.colors['text_dim'], dash=(4, 2))
+    
+    def export_telemetry(self):
+        if not any(record.passes for record in self.telemetry.values()):
+            messagebox.showwarning("Warning", "No pass telemetry available. Tick \"Pass telemetry\" and run \"Compare All Variants\" first (without Separate process).")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile="pass_telemetry.csv"
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            bubble_algorithms.write_telemetry_csv(file_path, self.telemetry)
+            messagebox.showinfo("Success", "Pass telemetry exported successfully!")
+            self.set_status("Pass telemetry exported")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error saving file: {e}")
+    
+    def open_visualizer(self):
+        """Open the live visualiser on a copy of the current data"""
+        if self.is_loading:
+            messagebox.showinfo("Info", "Please wait for the file to finish loading.")
+            return
+        
+        if not self.data:
+            messagebox.showwarning("Warning", "Please load a data file first.")
+            return
+        
+        SortVisualizer(self.root, self.colors, self.data, {
+            "Optimized Bubble Sort": bubble_algorithms.optimized_bubble_sort,
+            "Classic Bubble Sort": bubble_algorithms.classic_bubble_sort,
+        })
     
     def download_sorted_data(self):
+        if self.is_saving:
+            self.cancel_save()
+            return
+        
         if self.last_sorted_data is None:
             messagebox.showwarning("Warning", "No sorted data available. Run a sorting algorithm first.")
             return
         
+        if self.is_loading or self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the current task to finish.")
+            return
+        
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
@@ -617,16 +902,56 @@ class ModernSortingGUI:
         if not file_path:
             return
         
+        # Write on a worker; the save button doubles as "Cancel" and the export
+        # has its own progress bar, leaving the main one to any sort started meanwhile
+        self.is_saving = True
+        self.save_cancel = threading.Event()
+        self.save_button.config(text="✖  Cancel Saving")
+        self.save_progress.config(value=0)
+        self.save_progress.pack(fill=tk.X, padx=15, pady=(0, 12), after=self.save_button)
+        self.set_status(f"Saving {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(
+            target=self._save_file_worker, args=(file_path, self.last_sorted_data, self.save_cancel)
+        )
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_save(self):
+        """Stop the export in progress; the partial file is discarded"""
+        if self.is_saving:
+            self.save_cancel.set()
+            self.set_status("Cancelling save...")
+    
+    def _save_file_worker(self, file_path: str, numbers: List[int], cancel_event):
         try:
-            with open(file_path, 'w') as file:
-                for num in self.last_sorted_data:
-                    file.write(f"{num}\n")
-            
-            messagebox.showinfo("Success", f"Saved {len(self.last_sorted_data):,} numbers successfully!")
-            self.status_label.config(text="Data exported successfully")
-            
+            file_tasks.write_numbers_file(
+                file_path,
+                numbers,
+                progress=lambda done, total: self.ui.call(self._set_save_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_save, "Saving cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving file: {e}")
+            self.ui.call(self._end_save, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error saving file: {e}")
+            return
+        
+        self.ui.call(self._end_save, "Data exported successfully")
+        self.ui.call(messagebox.showinfo, "Success", f"Saved {len(numbers):,} numbers successfully!")
+    
+    def _set_save_progress(self, done: int, total: int):
+        if self.is_saving:
+            self.save_progress.config(value=done * 100 / total if total else 100)
+    
+    def _end_save(self, status: str):
+        """Restore the export controls (main thread)"""
+        self.is_saving = False
+        self.save_button.config(text="💾  Save Sorted Data")
+        self.save_progress.pack_forget()
+        self.set_status(status)
     
     def clear_results(self):
         """Clear both results text areas"""
@@ -634,11 +959,11 @@ class ModernSortingGUI:
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.config(state=tk.DISABLED)
         
-        self.data_text.config(state=tk.NORMAL)
-        self.data_text.delete(1.0, tk.END)
-        self.data_text.config(state=tk.DISABLED)
+        self.data_view.clear()
+        self.telemetry = {}
+        self.telemetry_canvas.delete("all")
         
-        self.status_label.config(text="Results cleared")
+        self.set_status("Results cleared")
 
 
 def main():
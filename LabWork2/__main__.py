@@ -0,0 +1,126 @@
+"""
+Headless benchmark entry point for the Sorting Algorithm Analyzer.
+
+Runs the same bubble, insertion and merge sorts as the GUI without importing
+tkinter, so it works on display-less build servers. From the repository root:
+
+    python -m LabWork2 bench --dataset LabWork2/dataset.txt --sizes 1000,5000
+
+Timings are printed as JSON. "calibrate" picks the merge sort insertion
+cutoff for this machine and saves it for later runs; "networks" times the
+small-input sorting networks against insertion sort.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import List
+
+# Make the sibling modules importable for both "python -m LabWork2" and "python LabWork2"
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# ... and the helpers shared by all three apps, in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sort_algorithms
+
+from common import merge_tuning, sorting_networks
+
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset.txt")
+
+
+def parse_sizes(text: str) -> List[int]:
+    return [int(size.replace("_", "")) for size in text.split(",") if size.strip()]
+
+
+def run_bench(args) -> dict:
+    data = sort_algorithms.read_numbers(args.dataset)
+    if not data:
+        raise ValueError(f"No valid numbers found in '{args.dataset}'")
+    
+    results = []
+    for size in args.sizes or [len(data)]:
+        subset = data[:size]
+        for name in args.algorithms:
+            sort_func = sort_algorithms.ALGORITHMS[name]
+            times = []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                sort_func(subset)
+                times.append(time.perf_counter() - start_time)
+            results.append({
+                "algorithm": name,
+                "n": len(subset),
+                "time": statistics.median(times),
+                "times": times,
+            })
+    
+    return {
+        "dataset": os.path.abspath(args.dataset),
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def run_calibrate(args) -> int:
+    print(f"Calibrating the merge sort cutoff on {args.size:,} random numbers ({args.repeat} runs each)")
+    timings = merge_tuning.calibrate(sort_algorithms.merge_sort, size=args.size, repeat=args.repeat)
+    entry = merge_tuning.save_calibration(sort_algorithms.MERGE_CONFIG_PATH, timings, args.size)
+    print("\n".join(merge_tuning.report_lines(sort_algorithms.MERGE_CONFIG_PATH, timings)))
+    print(f"\nmerge_sort will use cutoff {entry['cutoff']} on this machine")
+    return 0
+
+
+def run_networks(args) -> int:
+    print(f"Sorting networks vs insertion sort ({args.batches:,} random inputs per size, best of {args.repeat})")
+    print(f"{'n':>3} {'comparators':>11} {'network':>10} {'insertion':>10} {'speedup':>8}")
+    for n, comparators, network_time, insertion_time in sorting_networks.benchmark(
+        sort_algorithms.insertion_sort, batches=args.batches, repeat=args.repeat
+    ):
+        verified = "" if sorting_networks.verify(sorting_networks.NETWORKS[n], n) else "  NOT VERIFIED"
+        print(f"{n:>3} {comparators:>11} {network_time / args.batches * 1e6:>8.2f}us "
+              f"{insertion_time / args.batches * 1e6:>8.2f}us {insertion_time / network_time:>7.2f}x{verified}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m LabWork2", description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    bench = subparsers.add_parser("bench", help="time the sorting algorithms and print JSON")
+    bench.add_argument("--dataset", default=DEFAULT_DATASET, help="path to the .txt data file")
+    bench.add_argument("--sizes", type=parse_sizes, default=None,
+                       help="comma-separated prefix sizes, e.g. 1000,5000 (default: whole file)")
+    bench.add_argument("--algorithms", nargs="+", choices=list(sort_algorithms.ALGORITHMS),
+                       default=list(sort_algorithms.ALGORITHMS))
+    bench.add_argument("--repeat", type=int, default=1, help="runs per algorithm and size (default: 1)")
+    
+    calibrate = subparsers.add_parser("calibrate", help="find and save the best merge sort cutoff for this machine")
+    calibrate.add_argument("--size", type=int, default=merge_tuning.CALIBRATION_SIZE,
+                           help=f"numbers sorted per run (default: {merge_tuning.CALIBRATION_SIZE})")
+    calibrate.add_argument("--repeat", type=int, default=5, help="runs per cutoff (default: 5)")
+    
+    networks = subparsers.add_parser("networks", help="time the sorting networks against insertion sort")
+    networks.add_argument("--batches", type=int, default=2000, help="random inputs per size (default: 2000)")
+    networks.add_argument("--repeat", type=int, default=5, help="runs per size (default: 5)")
+    
+    args = parser.parse_args(argv)
+    if args.command == "calibrate":
+        return run_calibrate(args)
+    if args.command == "networks":
+        return run_networks(args)
+    
+    try:
+        report = run_bench(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Checkpoint and resume for the long-running sorts.
+
+Runs the bubble, insertion and merge sorts of sort_algorithms themselves,
+through their checkpoint/start hooks. At safe points in their outer loops
+they hand the working array and their loop position to a saver: the next
+bubble pass, the next item insertion sort inserts, or the number of
+finished merge sort steps (sorted blocks and merges). Once `interval`
+seconds have passed since the last save, the saver writes both to a
+compact binary file: a fixed header followed by the array as raw 64-bit
+integers. The file is replaced atomically, so a crash mid-save keeps the
+previous checkpoint. resume() reloads it and continues from exactly that
+position (with the merge cutoff the sort started with), and the file is
+removed once the sort completes. Numbers beyond 64 bits do not fit the
+file, so such data is sorted without checkpoints.
+"""
+import os
+import struct
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+import sort_algorithms
+
+CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sort_checkpoint.bin")
+# Suggested interval; the GUI leaves checkpointing off until one is entered
+DEFAULT_INTERVAL = 30.0
+
+MAGIC = b"SDACKPT2"
+# Magic, algorithm name, item count, loop position, merge cutoff, seconds sorted so far
+_HEADER = struct.Struct("<8s24sQqqd")
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def fits(arr: List[int]) -> bool:
+    """Whether every number fits the 64-bit checkpoint file"""
+    return not arr or (_INT64_MIN <= min(arr) and max(arr) <= _INT64_MAX)
+
+
+def save(path: str, algorithm: str, arr: List[int], position: int, elapsed: float, cutoff: int = 0):
+    """Write a checkpoint through a temp file that replaces path"""
+    temp_path = path + ".part"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, algorithm.encode(), len(arr), position, cutoff, elapsed))
+            array('q', arr).tofile(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        # Never leave a half-written checkpoint behind
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load(path: str) -> Dict:
+    """The checkpoint in path: {"algorithm", "position", "cutoff", "elapsed", "data"}"""
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' is not a sort checkpoint")
+        _, name, n, position, cutoff, elapsed = _HEADER.unpack(header)
+        values = array('q')
+        try:
+            values.fromfile(file, n)
+        except EOFError:
+            raise ValueError(f"'{path}' is truncated") from None
+    return {
+        "algorithm": name.rstrip(b"\0").decode(),
+        "position": position,
+        "cutoff": cutoff,
+        "elapsed": elapsed,
+        "data": values.tolist(),
+    }
+
+
+def clear(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class _Saver:
+    """Saves a checkpoint whenever interval seconds have passed (never when interval is None)"""
+
+    def __init__(self, path: str, algorithm: str, interval: Optional[float], elapsed: float = 0.0,
+                 cutoff: int = 0):
+        self.path = path
+        self.algorithm = algorithm
+        self.interval = interval
+        self.cutoff = cutoff
+        self.previous = elapsed
+        self.started = self.last_save = time.perf_counter()
+        self.saves = 0
+
+    def elapsed(self) -> float:
+        """Seconds sorted so far, including earlier sessions"""
+        return self.previous + time.perf_counter() - self.started
+
+    def __call__(self, arr: List[int], position: int):
+        if self.interval is not None and time.perf_counter() - self.last_save >= self.interval:
+            save(self.path, self.algorithm, arr, position, self.elapsed(), self.cutoff)
+            self.last_save = time.perf_counter()
+            self.saves += 1
+
+
+# What the saved loop position counts, for messages
+POSITION_NAMES = {
+    "bubble_sort": "pass",
+    "insertion_sort": "item",
+    "merge_sort": "merge step",
+}
+
+RESUMABLE = {
+    "bubble_sort": sort_algorithms.bubble_sort,
+    "insertion_sort": sort_algorithms.insertion_sort,
+    "merge_sort": sort_algorithms.merge_sort,
+}
+
+
+def run(algorithm: str, arr: List[int], path: str = CHECKPOINT_PATH, interval: Optional[float] = DEFAULT_INTERVAL,
+        position: int = 0, elapsed: float = 0.0,
+        progress: Optional[Callable[[int, int], None]] = None,
+        cutoff: Optional[int] = None) -> Tuple[List[int], float, int]:
+    """
+    Sort a copy of arr (descending) with a resumable algorithm, checkpointing
+    to path every interval seconds. cutoff is merge_sort's (MERGE_CUTOFF by
+    default). Returns (sorted, total_seconds, saves); total_seconds includes
+    the time recorded in earlier sessions. Data that does not fit() is
+    sorted without checkpoints and leaves path alone.
+    """
+    if interval is not None and not fits(arr):
+        interval = None
+    if cutoff is None:
+        cutoff = sort_algorithms.MERGE_CUTOFF
+    options = {"cutoff": cutoff} if algorithm == "merge_sort" else {}
+    saver = _Saver(path, algorithm, interval, elapsed, cutoff)
+    result = RESUMABLE[algorithm](arr, progress, start=position, checkpoint=saver, **options)
+    elapsed_time = saver.elapsed()
+    if interval is not None:
+        clear(path)
+    return result, elapsed_time, saver.saves
+
+
+def resume(path: str = CHECKPOINT_PATH, interval: Optional[float] = DEFAULT_INTERVAL,
+           progress: Optional[Callable[[int, int], None]] = None) -> Tuple[Dict, List[int], float, int]:
+    """Continue the checkpointed sort: (checkpoint, sorted, total_seconds, saves)"""
+    state = load(path)
+    result, elapsed_time, saves = run(state["algorithm"], state["data"], path, interval,
+                                      state["position"], state["elapsed"], progress, state["cutoff"])
+    clear(path)
+    return state, result, elapsed_time, saves
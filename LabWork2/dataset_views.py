@@ -0,0 +1,56 @@
+"""
+Compact dataset storage with zero-copy size windows.
+
+The loaded numbers are kept once in an array('q') (8 bytes per number
+instead of a list of int objects). The size selector hands out memoryview
+windows on that buffer: a first-N prefix copies nothing, and neither does a
+stride sample whose step through the file is a whole number. Other stride
+samples and random samples gather their items into a new (compact) array.
+The sorts make their own mutable copy with list(arr), so a window is copied
+exactly once per run.
+"""
+import random
+from array import array
+from typing import List, Sequence
+
+FIRST_N = "First N"
+RANDOM_SAMPLE = "Random sample"
+STRIDE_SAMPLE = "Stride sample"
+SAMPLING_MODES = [FIRST_N, RANDOM_SAMPLE, STRIDE_SAMPLE]
+
+
+class DatasetBuffer:
+    def __init__(self, numbers: List[int]):
+        try:
+            self.values = array('q', numbers)
+            self.view = memoryview(self.values)
+        except OverflowError:
+            # Numbers beyond 64 bits cannot live in the compact buffer
+            self.values = list(numbers)
+            self.view = self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def window(self, size: int = None, mode: str = FIRST_N, seed: int = 0) -> Sequence[int]:
+        """size numbers chosen by mode (all of them when size is None or too large)"""
+        n = len(self.values)
+        if size is None or size >= n:
+            return self.view
+        if mode == STRIDE_SAMPLE:
+            # Evenly spaced items from the first number to the last
+            if size == 1:
+                return self.view[:1]
+            if (n - 1) % (size - 1) == 0:
+                return self.view[::(n - 1) // (size - 1)]
+            return self._gather((k * (n - 1)) // (size - 1) for k in range(size))
+        if mode == RANDOM_SAMPLE:
+            # Random subset, kept in file order and reproducible through seed
+            return self._gather(sorted(random.Random(seed).sample(range(n), size)))
+        return self.view[:size]
+
+    def _gather(self, indices) -> Sequence[int]:
+        """The items at indices, copied into a compact buffer when possible"""
+        if isinstance(self.values, array):
+            return memoryview(array('q', map(self.values.__getitem__, indices)))
+        return [self.values[i] for i in indices]
@@ -0,0 +1,124 @@
+"""
+Runtime prediction for the "Run All & Compare" flow.
+
+Before an algorithm runs on the full dataset it is timed on a small,
+order-preserving sample. That calibration gives a cost per unit of work,
+and a work model driven by the input's presortedness (its share of inverted
+pairs) scales it up to the full size.
+"""
+import math
+import random
+import time
+from typing import Callable, Dict, List
+
+CALIBRATION_SIZE = 1000
+INVERSION_SAMPLES = 20000
+# Keep re-running tiny calibrations until at least this much time was measured
+MIN_CALIBRATION_TIME = 0.02
+
+
+def presortedness(data: List[int], samples: int = INVERSION_SAMPLES, seed: int = 0) -> Dict:
+    """
+    Measure how far the data is from descending order.
+    The inversion ratio is the share of pairs i < j with data[i] < data[j],
+    exact for small inputs and estimated from random pairs otherwise.
+    """
+    n = len(data)
+    pairs = n * (n - 1) // 2
+    if n < 2:
+        return {"n": n, "inversion_ratio": 0.0, "inversions": 0}
+
+    if pairs <= samples:
+        inversions = sum(
+            1 for i in range(n) for j in range(i + 1, n) if data[i] < data[j]
+        )
+        ratio = inversions / pairs
+    else:
+        rng = random.Random(seed)
+        hits = compared = 0
+        for _ in range(samples):
+            i = rng.randrange(n)
+            j = rng.randrange(n)
+            if i == j:
+                continue
+            if i > j:
+                i, j = j, i
+            compared += 1
+            if data[i] < data[j]:
+                hits += 1
+        # Draws of the same index are not pairs, so they do not count
+        ratio = hits / compared if compared else 0.0
+        inversions = int(ratio * pairs)
+
+    return {"n": n, "inversion_ratio": ratio, "inversions": inversions}
+
+
+def _work(model: str, n: int, ratio: float) -> float:
+    """Abstract work units for an algorithm on n items with the given inversion ratio"""
+    pairs = n * (n - 1) / 2
+    inversions = ratio * pairs
+    if model == "bubble_sort":
+        # Early exit makes nearly sorted input cheap; random input needs ~all passes
+        comparisons = min(pairs, n + 2 * inversions)
+        return comparisons + inversions
+    if model == "insertion_sort":
+        return n + inversions
+    if model == "shell_sort":
+        # Measured growth with the Ciura gaps on random input
+        return n ** 1.25
+    return n * math.log2(max(n, 2))
+
+
+def order_preserving_sample(data: List[int], size: int, seed: int = 0) -> List[int]:
+    """Random subset of the data kept in its original order"""
+    if size >= len(data):
+        return list(data)
+    indices = sorted(random.Random(seed).sample(range(len(data)), size))
+    return [data[i] for i in indices]
+
+
+def calibrate(sort_func: Callable, sample: List[int]) -> float:
+    """Best time of sort_func on the sample, repeating very short runs"""
+    best = float("inf")
+    spent = 0.0
+    for _ in range(5):
+        start_time = time.perf_counter()
+        sort_func(sample)
+        elapsed_time = time.perf_counter() - start_time
+        best = min(best, elapsed_time)
+        spent += elapsed_time
+        if spent >= MIN_CALIBRATION_TIME:
+            break
+    return best
+
+
+def estimate_runtime(model: str, sort_func: Callable, data: List[int], profile: Dict,
+                     sample_size: int = CALIBRATION_SIZE) -> float:
+    """
+    Predict the seconds sort_func needs on data.
+    model is the algorithm's name ("bubble_sort", "insertion_sort" or
+    "merge_sort"); profile is presortedness(data).
+    """
+    n = len(data)
+    sample = order_preserving_sample(data, sample_size)
+    sample_time = calibrate(sort_func, sample)
+    if len(sample) == n:
+        return sample_time
+
+    sample_work = _work(model, len(sample), presortedness(sample)["inversion_ratio"])
+    if sample_work <= 0:
+        return sample_time
+    return sample_time / sample_work * _work(model, n, profile["inversion_ratio"])
+
+
+def format_duration(seconds: float) -> str:
+    """Human readable duration, e.g. '4h 12m', '3m 05s', '12.3s' or '85ms'"""
+    if seconds >= 86400:
+        return f"{int(seconds // 86400)}d {int(seconds % 86400 // 3600)}h"
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h {int(seconds % 3600 // 60)}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
+    if seconds >= 1:
+        return f"{seconds:.1f}s"
+    return f"{seconds * 1000:.0f}ms"
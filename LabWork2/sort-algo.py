@@ -1,9 +1,38 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import os
+import sys
 import time
 from typing import List
 import threading
 
+# The helpers shared by all three apps live in common/ at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import checkpoint
+import dataset_views
+import runtime_estimator
+import sort_algorithms
+
+from common import data_profile, file_tasks, process_runner, sort_profiler, sort_verifier
+from common.data_viewer import VirtualDataView
+from common.sort_visualizer import SortVisualizer
+from common.ui_queue import UIUpdateQueue
+
+# Ranking marks; only the top three get one
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+# Shell Sort gap selector entry that runs every sequence side by side
+COMPARE_ALL_GAPS = "Compare all"
+# Complexity shown for each engine the Auto button can pick (k = value range, d = digits, r = runs)
+AUTO_COMPLEXITY = {
+    "counting_sort": "O(n + k)",
+    "natural_merge_sort": "O(n log r)",
+    "radix_sort": "O(d·n)",
+    "introsort": "O(n log n)",
+}
+# Single-run buttons that can checkpoint, by run_sort choice
+CHECKPOINTED = {1: "bubble_sort", 2: "insertion_sort", 3: "merge_sort"}
+
 class ModernSortingGUI:
     def __init__(self, root):
         self.root = root
@@ -13,9 +42,24 @@ class ModernSortingGUI:
         
         # Data storage
         self.data = []
-        self.full_data = []  # Store the complete loaded dataset
+        self.full_data = dataset_views.DatasetBuffer([])  # The complete loaded dataset, stored compactly
         self.last_sorted_data = None
+        self.last_counts = None  # Distinct + counts result, exported as value,count lines
         self.is_sorting = False
+        self.is_loading = False
+        self.load_cancel = None
+        self.is_saving = False
+        self.save_cancel = None
+        self.dataset_name = None
+        self.full_profile = None  # data_profile.analyze() of the whole file
+        self.data_profile = None  # ... and of the window being sorted
+        self.profile_mode = None  # Captured from the Profile toggles when a run starts
+        self.use_process = False  # Captured from the Separate process toggle
+        self.trace_memory = False  # Captured from the Peak memory toggle
+        self.sort_process = None  # process_runner.ProcessSort while a child process sorts
+        self.stop_requested = False
+        self.time_budget = 0.0  # Seconds per algorithm in "Run All"; 0 means no limit
+        self.checkpoint_interval = None  # Seconds between checkpoints of single runs; None when off
         
         # Modern dark theme colors
         self.colors = {
@@ -36,6 +80,11 @@ class ModernSortingGUI:
         self.root.configure(bg=self.colors['bg'])
         self.setup_styles()
         self.create_widgets()
+        
+        # Worker threads update widgets only through this queue
+        self.ui = UIUpdateQueue(self.root)
+        
+        self._announce_checkpoint()
     
     def setup_styles(self):
         style = ttk.Style()
@@ -138,12 +187,13 @@ class ModernSortingGUI:
         )
         self.file_label.pack(anchor=tk.W, padx=15, pady=(0, 12))
         
-        self.create_button(
+        self.load_button = self.create_button(
             load_section,
             "📁  Load Data File",
             self.load_file,
             self.colors['primary']
-        ).pack(fill=tk.X, padx=15, pady=(0, 12))
+        )
+        self.load_button.pack(fill=tk.X, padx=15, pady=(0, 12))
         
         # Dataset size selector with improved styling
         tk.Label(
@@ -174,6 +224,19 @@ class ModernSortingGUI:
         self.size_dropdown.pack(fill=tk.X, padx=8, pady=8)
         self.size_dropdown.bind("<<ComboboxSelected>>", self.on_size_change)
         
+        # How the N numbers are picked from the file
+        self.window_mode_var = tk.StringVar(value=dataset_views.FIRST_N)
+        self.sampling_dropdown = ttk.Combobox(
+            dropdown_frame,
+            textvariable=self.window_mode_var,
+            values=dataset_views.SAMPLING_MODES,
+            state="readonly",
+            font=("Segoe UI", 10),
+            width=25
+        )
+        self.sampling_dropdown.pack(fill=tk.X, padx=8, pady=(0, 8))
+        self.sampling_dropdown.bind("<<ComboboxSelected>>", self.on_size_change)
+        
         # Algorithms section
         algo_section = self.create_section(parent, "Sorting Algorithms", top_margin=15)
         
@@ -204,23 +267,177 @@ class ModernSortingGUI:
         )
         btn.pack(fill=tk.X, padx=15, pady=3)
         
+        btn = self.create_button(
+            algo_section,
+            "Shell Sort",
+            lambda: self.run_sort(5),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        btn = self.create_button(
+            algo_section,
+            "Introsort",
+            lambda: self.run_sort(6),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        btn = self.create_button(
+            algo_section,
+            "Heap Sort",
+            lambda: self.run_sort(9),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        btn = self.create_button(
+            algo_section,
+            "⚡  Auto (best for this data)",
+            lambda: self.run_sort(7),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        btn = self.create_button(
+            algo_section,
+            "Σ  Distinct + counts",
+            lambda: self.run_sort(8),
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        )
+        btn.pack(fill=tk.X, padx=15, pady=3)
+        
+        # Gap sequence for the Shell Sort button
+        gaps_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        gaps_row.pack(fill=tk.X, padx=15, pady=(4, 0))
+        tk.Label(
+            gaps_row,
+            text="Shell gaps",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim']
+        ).pack(side=tk.LEFT)
+        self.gaps_var = tk.StringVar(value=COMPARE_ALL_GAPS)
+        ttk.Combobox(
+            gaps_row,
+            textvariable=self.gaps_var,
+            values=[COMPARE_ALL_GAPS] + [name.title() for name in sort_algorithms.GAP_SEQUENCES],
+            state="readonly",
+            font=("Segoe UI", 9),
+            width=14
+        ).pack(side=tk.RIGHT)
+        
+        # Profiling toggles
+        self.profile_var = tk.BooleanVar(value=False)
+        self.sampling_var = tk.BooleanVar(value=False)
+        toggle_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        toggle_row.pack(fill=tk.X, padx=15, pady=(8, 0))
+        self.create_toggle(toggle_row, "Profile", self.profile_var).pack(side=tk.LEFT)
+        self.create_toggle(toggle_row, "Sampling (low overhead)", self.sampling_var).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Sort in a killable child process so the UI stays responsive
+        self.process_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Separate process (enables Stop)", self.process_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
+        # Peak memory tracing after Run All; tracemalloc slows the sorts down, so it is off by default
+        self.memory_var = tk.BooleanVar(value=False)
+        self.create_toggle(algo_section, "Peak memory after Run All", self.memory_var).pack(anchor=tk.W, padx=15, pady=(4, 0))
+        
+        # Time budget for "Run All": slower predicted algorithms are skipped
+        budget_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        budget_row.pack(fill=tk.X, padx=15, pady=(6, 0))
+        tk.Label(
+            budget_row,
+            text="Run All budget per algorithm (s, 0 = none)",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim']
+        ).pack(side=tk.LEFT)
+        self.budget_var = tk.StringVar(value="60")
+        tk.Entry(
+            budget_row,
+            textvariable=self.budget_var,
+            font=("Segoe UI", 9),
+            width=6,
+            bg=self.colors['surface_light'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text'],
+            relief=tk.FLAT,
+            justify=tk.RIGHT
+        ).pack(side=tk.RIGHT)
+        
+        # Checkpoint interval for single bubble, insertion and merge sort runs; off until one is entered
+        checkpoint_row = tk.Frame(algo_section, bg=self.colors['surface'])
+        checkpoint_row.pack(fill=tk.X, padx=15, pady=(6, 0))
+        tk.Label(
+            checkpoint_row,
+            text="Checkpoint every (s, 0 = off)",
+            font=("Segoe UI", 8),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim']
+        ).pack(side=tk.LEFT)
+        self.checkpoint_var = tk.StringVar(value="0")
+        tk.Entry(
+            checkpoint_row,
+            textvariable=self.checkpoint_var,
+            font=("Segoe UI", 9),
+            width=6,
+            bg=self.colors['surface_light'],
+            fg=self.colors['text'],
+            insertbackground=self.colors['text'],
+            relief=tk.FLAT,
+            justify=tk.RIGHT
+        ).pack(side=tk.RIGHT)
+        
         # Run all button
         self.create_button(
             algo_section,
             "▶  Run All & Compare",
             lambda: self.run_sort(4),
             self.colors['accent']
-        ).pack(fill=tk.X, padx=15, pady=(12, 15))
+        ).pack(fill=tk.X, padx=15, pady=(12, 6))
+        
+        # Continue a checkpointed sort after a crash or restart
+        self.create_button(
+            algo_section,
+            "⟲  Resume from Checkpoint",
+            self.resume_sort,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(fill=tk.X, padx=15, pady=(0, 6))
+        
+        # Live bar visualiser
+        self.create_button(
+            algo_section,
+            "🎞  Visualize Sort",
+            self.open_visualizer,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(fill=tk.X, padx=15, pady=(0, 15))
         
         # Export section
         export_section = self.create_section(parent, "Export", top_margin=15)
         
-        self.create_button(
+        self.save_button = self.create_button(
             export_section,
             "💾  Save Sorted Data",
             self.download_sorted_data,
             self.colors['success']
-        ).pack(fill=tk.X, padx=15, pady=(0, 15))
+        )
+        self.save_button.pack(fill=tk.X, padx=15, pady=(0, 15))
+        
+        # Export progress, shown under the save button while a file is written
+        self.save_progress = ttk.Progressbar(
+            export_section,
+            mode='determinate',
+            maximum=100,
+            style="Modern.Horizontal.TProgressbar"
+        )
     
     def create_section(self, parent, title, top_margin=0):
         section = tk.Frame(parent, bg=self.colors['surface'], relief=tk.FLAT)
@@ -263,6 +480,22 @@ class ModernSortingGUI:
         
         return btn
     
+    def create_toggle(self, parent, text, variable):
+        return tk.Checkbutton(
+            parent,
+            text=text,
+            variable=variable,
+            font=("Segoe UI", 9),
+            bg=self.colors['surface'],
+            fg=self.colors['text_dim'],
+            activebackground=self.colors['surface'],
+            activeforeground=self.colors['text'],
+            selectcolor=self.colors['surface_light'],
+            highlightthickness=0,
+            bd=0,
+            cursor="hand2"
+        )
+    
     def create_results_panel(self, parent):
         # Results header with progress
         header = tk.Frame(parent, bg=self.colors['surface'])
@@ -294,17 +527,25 @@ class ModernSortingGUI:
         # Spacer
         tk.Frame(right_container, bg=self.colors['surface'], width=10).pack(side=tk.LEFT)
         
-        # Clear button (30%)
+        # Stop and Clear buttons (30%)
         clear_btn_frame = tk.Frame(right_container, bg=self.colors['surface'])
         clear_btn_frame.pack(side=tk.LEFT)
         
+        self.create_button(
+            clear_btn_frame,
+            "⏹  Stop",
+            self.stop_sort,
+            self.colors['surface_light'],
+            hover_color=self.colors['border']
+        ).pack(side=tk.LEFT, pady=6, padx=(0, 6))
+        
         self.create_button(
             clear_btn_frame,
             "🗑️  Clear",
             self.clear_results,
             self.colors['surface_light'],
             hover_color=self.colors['border']
-        ).pack(pady=6)
+        ).pack(side=tk.LEFT, pady=6)
         
         # Main results container with two columns
         results_container = tk.Frame(parent, bg=self.colors['bg'])
@@ -357,42 +598,24 @@ class ModernSortingGUI:
         right_column = tk.Frame(results_container, bg=self.colors['bg'])
         right_column.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        # Sorted data label
-        tk.Label(
-            right_column,
-            text="Sorted Data Output",
-            font=("Segoe UI", 10, "bold"),
-            bg=self.colors['bg'],
-            fg=self.colors['text'],
-            anchor=tk.W
-        ).pack(anchor=tk.W, pady=(0, 8))
+        # Sorted data viewer (renders only the visible rows)
+        self.data_view = VirtualDataView(right_column, self.colors)
+        self.data_view.pack(fill=tk.BOTH, expand=True)
+    
+    def load_file(self):
+        if self.is_loading:
+            self.cancel_load()
+            return
         
-        # Sorted data text area
-        data_frame = tk.Frame(right_column, bg=self.colors['border'], bd=1)
-        data_frame.pack(fill=tk.BOTH, expand=True)
+        if self.is_saving:
+            messagebox.showinfo("Info", "Please wait for the export to finish.")
+            return
         
-        self.data_text = scrolledtext.ScrolledText(
-            data_frame,
-            font=("Consolas", 10),
-            wrap=tk.WORD,
-            bg=self.colors['surface'],
-            fg=self.colors['text'],
-            insertbackground=self.colors['primary'],
-            selectbackground=self.colors['primary'],
-            selectforeground=self.colors['text'],
-            relief=tk.FLAT,
-            bd=0,
-            padx=15,
-            pady=15,
-            state=tk.DISABLED
-        )
-        self.data_text.pack(fill=tk.BOTH, expand=True)
+        # New data mid-run would change the dataset under Run All and take over the progress bar
+        if self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the sort to finish.")
+            return
         
-        # Configure text tags for data output
-        self.data_text.tag_config("header", foreground=self.colors['primary'], font=("Consolas", 11, "bold"))
-        self.data_text.tag_config("dim", foreground=self.colors['text_dim'])
-    
-    def load_file(self):
         file_path = filedialog.askopenfilename(
             title="Select a text file",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
@@ -401,47 +624,92 @@ class ModernSortingGUI:
         if not file_path:
             return
         
+        # Parse on a worker; the load button doubles as "Cancel" meanwhile
+        self.is_loading = True
+        self.load_cancel = threading.Event()
+        self.load_button.config(text="✖  Cancel Loading")
+        self.progress.config(mode='determinate', maximum=100, value=0)
+        self.set_status(f"Loading {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(target=self._load_file_worker, args=(file_path, self.load_cancel))
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_load(self):
+        """Stop the file load in progress"""
+        if self.is_loading:
+            self.load_cancel.set()
+            self.set_status("Cancelling load...")
+    
+    def _load_file_worker(self, file_path: str, cancel_event):
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
-                self.full_data = [
-                    int(x.strip()) 
-                    for x in content.replace(',', ' ').split() 
-                    if x.strip().lstrip('-').isdigit()
-                ]
-                
-                if not self.full_data:
-                    messagebox.showerror("Error", "No valid numbers found in the file.")
-                    return
-                
-                # Apply size filter
-                self.apply_size_filter()
-                
-                # Update UI
-                filename = file_path.split('/')[-1]
-                self.file_label.config(
-                    text=f"✓ {filename}",
-                    fg=self.colors['success']
-                )
-                
-                self.update_data_count_label()
-                self.status_label.config(text="Data loaded successfully")
-                
-                self.append_result(
-                    f"Loaded {len(self.full_data):,} numbers from {filename}\n",
-                    "success"
-                )
-                self.append_result(
-                    f"Using {len(self.data):,} numbers for sorting\n",
-                    "dim"
-                )
-                self.append_result(
-                    f"Preview (first 20): {str(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n\n",
-                    "dim"
-                )
-                
+            numbers = file_tasks.parse_numbers_file(
+                file_path,
+                progress=lambda done, total: self.ui.call(self._set_task_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_load, "Loading cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error reading file: {e}")
+            self.ui.call(self._end_load, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error reading file: {e}")
+            return
+        
+        # Profile the data here too, off the UI thread
+        self.set_status("Analyzing data...")
+        profile = data_profile.analyze(numbers)
+        
+        # Hand the parsed buffer to the UI thread in one step
+        self.ui.call(self._finish_load, file_path, numbers, profile)
+    
+    def _set_task_progress(self, done: int, total: int):
+        self.progress.config(value=done * 100 / total if total else 100)
+    
+    def _end_load(self, status: str):
+        """Restore the loading controls (main thread)"""
+        self.is_loading = False
+        self.load_button.config(text="📁  Load Data File")
+        self.progress.config(mode='indeterminate', value=0)
+        self.set_status(status)
+    
+    def _finish_load(self, file_path: str, numbers: List[int], profile: dict):
+        """Install freshly parsed data and refresh the preview (main thread)"""
+        if not numbers:
+            self._end_load("Ready to load data")
+            messagebox.showerror("Error", "No valid numbers found in the file.")
+            return
+        
+        self._end_load("Data loaded successfully")
+        self.full_data = dataset_views.DatasetBuffer(numbers)
+        self.full_profile = profile
+        
+        # Apply size filter
+        self.apply_size_filter()
+        
+        # Update UI
+        filename = file_path.split('/')[-1]
+        self.dataset_name = filename
+        self.file_label.config(
+            text=f"✓ {filename}",
+            fg=self.colors['success']
+        )
+        
+        self.update_data_count_label()
+        
+        self.append_result(
+            f"Loaded {len(self.full_data):,} numbers from {filename}\n",
+            "success"
+        )
+        self.append_result(
+            f"Using {len(self.data):,} numbers for sorting\n",
+            "dim"
+        )
+        self.append_result(
+            f"Preview (first 20): {list(self.data[:20])}{'...' if len(self.data) > 20 else ''}\n",
+            "dim"
+        )
+        self._show_profile()
     
     def on_size_change(self, event=None):
         """Handle dataset size selection change"""
@@ -454,33 +722,61 @@ class ModernSortingGUI:
         self.update_data_count_label()
         
         self.append_result(
-            f"\nDataset size changed to: {self.size_var.get()}\n",
+            f"\nDataset size changed to: {self.size_var.get()} ({self.window_mode_var.get()})\n",
             "success"
         )
         self.append_result(
-            f"Using {len(self.data):,} numbers for sorting\n\n",
+            f"Using {len(self.data):,} numbers for sorting\n",
             "dim"
         )
-        self.status_label.config(text=f"Dataset size set to {self.size_var.get()}")
+        self._show_profile()
+        self.set_status(f"Dataset size set to {self.size_var.get()}")
     
     def apply_size_filter(self):
-        """Apply the selected dataset size filter"""
+        """Apply the selected dataset size filter (a zero-copy window for First N and Stride)"""
         size_str = self.size_var.get()
         
         if size_str == "All":
-            self.data = self.full_data.copy()
+            size = None
         else:
             # Parse the size (remove commas)
             size = int(size_str.replace(",", ""))
             
-            if len(self.full_data) >= size:
-                self.data = self.full_data[:size]
-            else:
-                self.data = self.full_data.copy()
+            if len(self.full_data) < size:
                 messagebox.showinfo(
                     "Info", 
                     f"File contains only {len(self.full_data):,} numbers. Using all available data."
                 )
+        
+        self.data = self.full_data.window(size, self.window_mode_var.get())
+        # The whole file was profiled while loading; a smaller window needs its own
+        # profile, which counts inversions exactly up to 50k items, so off the UI thread
+        if len(self.data) == len(self.full_data):
+            self.data_profile = self.full_profile
+        else:
+            self.data_profile = None
+            thread = threading.Thread(target=self._profile_window_worker, args=(self.data,))
+            thread.daemon = True
+            thread.start()
+    
+    def _profile_window_worker(self, window):
+        profile = data_profile.analyze(window)
+        self.ui.call(self._finish_profile, window, profile)
+    
+    def _finish_profile(self, window, profile: dict):
+        """Install the profile of a window (main thread) unless the window changed meanwhile"""
+        if self.data is not window:
+            return
+        if self.data_profile is None:
+            self.data_profile = profile
+        self._show_profile()
+    
+    def _show_profile(self):
+        """Print the profile of the current window, once it is known"""
+        if self.data_profile is not None:
+            self.append_result("\n".join(data_profile.format_profile(self.data_profile)) + "\n\n", "dim")
+        else:
+            self.append_result("Analyzing the window...\n\n", "dim")
     
     def update_data_count_label(self):
         """Update the data count label with current dataset info"""
@@ -488,79 +784,38 @@ class ModernSortingGUI:
             self.data_count_label.config(text=f"{len(self.data):,} numbers loaded")
         else:
             self.data_count_label.config(
-                text=f"{len(self.data):,} of {len(self.full_data):,} numbers"
+                text=f"{len(self.data):,} of {len(self.full_data):,} numbers ({self.window_mode_var.get()})"
             )
     
     def bubble_sort(self, arr: List[int]) -> List[int]:
-        """
-        Bubble Sort - O(n²)
-        Classic exchange sort with optimized early exit
-        Sorts in DESCENDING order
-        """
-        arr = arr.copy()
-        n = len(arr)
-        for i in range(n - 1):
-            swapped = False
-            for j in range(n - 1 - i):
-                if arr[j] < arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    swapped = True
-            if not swapped:
-                break
-        return arr
+        """Bubble Sort - O(n²) with early exit (see sort_algorithms)"""
+        return sort_algorithms.bubble_sort(arr)
     
     def insertion_sort(self, arr: List[int]) -> List[int]:
-        """
-        Insertion Sort - O(n²)
-        Builds the final sorted array one item at a time
-        Sorts in DESCENDING order
-        """
-        arr = arr.copy()
-        for i in range(1, len(arr)):
-            key = arr[i]
-            j = i - 1
-            # Changed comparison for descending order
-            while j >= 0 and arr[j] < key:
-                arr[j + 1] = arr[j]
-                j -= 1
-            arr[j + 1] = key
-        return arr
+        """Insertion Sort - O(n²) (see sort_algorithms)"""
+        return sort_algorithms.insertion_sort(arr)
     
     def merge_sort(self, arr: List[int]) -> List[int]:
-        """
-        Merge Sort - O(n log n)
-        Divide and conquer algorithm
-        Sorts in DESCENDING order
-        """
-        arr = arr.copy()
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = self.merge_sort(arr[:mid])
-        right = self.merge_sort(arr[mid:])
-        
-        return self._merge(left, right)
-    
-    def _merge(self, left: List[int], right: List[int]) -> List[int]:
-        """Merge two sorted arrays in descending order"""
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            # Changed comparison for descending order
-            if left[i] >= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+        """Merge Sort - O(n log n) (see sort_algorithms)"""
+        return sort_algorithms.merge_sort(arr)
+    
+    def shell_sort(self, arr: List[int], gaps: str = "ciura") -> List[int]:
+        """Shell Sort - about O(n^1.25) with Ciura gaps, in place (see sort_algorithms)"""
+        return sort_algorithms.shell_sort(arr, gaps=gaps)
+    
+    def introsort(self, arr: List[int]) -> List[int]:
+        """Introsort - O(n log n) 3-way quicksort with heap sort fallback (see sort_algorithms)"""
+        return sort_algorithms.introsort(arr)
+    
+    def heap_sort(self, arr: List[int]) -> List[int]:
+        """Heap Sort - O(n log n) (see sort_algorithms)"""
+        return sort_algorithms.heap_sort(arr)
     
     def run_sort(self, choice: int):
+        if self.is_loading:
+            messagebox.showinfo("Info", "Please wait for the file to finish loading.")
+            return
+        
         if not self.data:
             messagebox.showwarning("Warning", "Please load a data file first.")
             return
@@ -569,30 +824,76 @@ class ModernSortingGUI:
             messagebox.showinfo("Info", "Sorting is already in progress.")
             return
         
+        # Tk variables are only read on the main thread
+        if self.profile_var.get():
+            self.profile_mode = "sampling" if self.sampling_var.get() else "cprofile"
+        else:
+            self.profile_mode = None
+        self.use_process = self.process_var.get()
+        self.trace_memory = self.memory_var.get()
+        self.gap_choice = self.gaps_var.get()
+        self.stop_requested = False
+        
+        try:
+            self.time_budget = max(float(self.budget_var.get() or 0), 0.0)
+        except ValueError:
+            messagebox.showwarning("Warning", "Time budget must be a number of seconds.")
+            return
+        
+        if not self._read_checkpoint_interval():
+            return
+        
+        # A new checkpointed run would replace the checkpoint of an interrupted one
+        if self._checkpoints(choice) and os.path.exists(checkpoint.CHECKPOINT_PATH):
+            if not messagebox.askyesno(
+                "Replace checkpoint?",
+                "A checkpoint of an interrupted sort exists, and this run would overwrite it.\n\n"
+                "Choose No and click \"Resume from Checkpoint\" to continue the earlier sort instead. "
+                "Discard it and start this sort?"
+            ):
+                return
+        
+        self.is_sorting = True
         thread = threading.Thread(target=self._execute_sort, args=(choice,))
         thread.daemon = True
         thread.start()
     
     def _execute_sort(self, choice: int):
-        self.is_sorting = True
-        self.progress.start(10)
+        self.ui.call(self.progress.start, 10)
         
         try:
             if choice == 4:
                 self._run_all_sorts()
+            elif choice == 5:
+                self._run_shell_sorts()
+            elif choice == 8:
+                self._run_distinct_counts()
             else:
                 algorithms = {
                     1: ("Bubble Sort", self.bubble_sort, "O(n²)"),
                     2: ("Insertion Sort", self.insertion_sort, "O(n²)"),
-                    3: ("Merge Sort", self.merge_sort, "O(n log n)")
+                    3: ("Merge Sort", self.merge_sort, "O(n log n)"),
+                    6: ("Introsort", self.introsort, "O(n log n)"),
+                    9: ("Heap Sort", self.heap_sort, "O(n log n)")
                 }
                 
-                name, sort_func, complexity = algorithms[choice]
-                self.status_label.config(text=f"Running {name}...")
+                if choice == 7:
+                    name, sort_func, complexity = self._auto_algorithm()
+                else:
+                    name, sort_func, complexity = algorithms[choice]
+                self.set_status(f"Running {name}...")
                 
-                start_time = time.time()
-                sorted_data = sort_func(self.data)
-                elapsed_time = time.time() - start_time
+                checkpointed = self._checkpoints(choice)
+                if checkpointed and not checkpoint.fits(self.data):
+                    self.append_result("\nCheckpointing off: numbers beyond 64 bits do not fit the checkpoint file\n", "dim")
+                    checkpointed = False
+                saves = None
+                if checkpointed:
+                    sorted_data, elapsed_time, saves = checkpoint.run(
+                        CHECKPOINTED[choice], self.data, interval=self.checkpoint_interval
+                    )
+                else:
+                    sorted_data, elapsed_time = self._timed_sort(name, sort_func)
                 
                 self.last_sorted_data = sorted_data
                 
@@ -600,141 +901,478 @@ class ModernSortingGUI:
                 self.append_result(f"\n{name}\n", "header")
                 self.append_result(f"Complexity: {complexity}\n", "dim")
                 self.append_result(f"Time: {elapsed_time:.6f} seconds\n", "success")
-                self.append_result(f"Dataset size: {len(sorted_data):,} numbers\n\n", "dim")
+                self.append_result(f"Dataset size: {len(sorted_data):,} numbers\n", "dim")
+                if saves is not None:
+                    self.append_result(
+                        f"Checkpointed every {self.checkpoint_interval:g}s ({saves} saved)\n",
+                        "dim"
+                    )
+                self.append_result("\n")
                 
                 # Sorted data column
-                self.clear_data_output()
-                self.append_data_output(f"{name}\n", "header")
-                self.append_data_output(f"Descending Order ({len(sorted_data):,} numbers)\n\n", "dim")
-                self.append_data_output(self._format_dataset(sorted_data))
+                self.show_sorted_data(name, sorted_data)
                 
-                self.status_label.config(text=f"{name} completed")
+                self.set_status(f"{name} completed")
                 
+        except process_runner.SortKilled:
+            self.append_result("\nSort stopped\n", "dim")
+            self.set_status("Sort stopped")
         except Exception as e:
-            messagebox.showerror("Error", f"Error during sorting: {e}")
-            self.status_label.config(text="Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error during sorting: {e}")
+            self.set_status("Error occurred")
         finally:
             self.is_sorting = False
-            self.progress.stop()
+            self.ui.call(self.progress.stop)
+    
+    def _auto_algorithm(self):
+        """(name, sort_func, complexity) of the engine data_profile recommends for the current window"""
+        if self.data_profile is None:
+            # Auto was pressed before the window's profile came in
+            self.set_status("Analyzing data...")
+            self.data_profile = data_profile.analyze(self.data)
+        algorithm, reason = data_profile.recommend(self.data_profile)
+        name = algorithm.replace("_", " ").title()
+        self.append_result(f"\nAuto picked {name}: {reason}\n", "dim")
+        return f"Auto ({name})", sort_algorithms.ALGORITHMS[algorithm], AUTO_COMPLEXITY[algorithm]
     
-    def _format_dataset(self, data: List[int], items_per_line: int = 10) -> str:
-        """Format the dataset for display with a specified number of items per line"""
-        lines = []
-        for i in range(0, len(data), items_per_line):
-            chunk = data[i:i + items_per_line]
-            lines.append(', '.join(map(str, chunk)))
-        return '\n'.join(lines)
+    def _timed_sort(self, name: str, sort_func, **kwargs):
+        """Run one sort on the current data, wrapped in the selected profiler if enabled"""
+        if self.use_process and not self.profile_mode:
+            return self._process_sort(sort_func, kwargs)
+        
+        if not self.profile_mode:
+            start_time = time.time()
+            result = sort_func(self.data, **kwargs)
+            return result, time.time() - start_time
+        
+        output_path = sort_profiler.profile_output_path(
+            name, self.dataset_name, len(self.data), self.profile_mode
+        )
+        result, elapsed_time, report = sort_profiler.run_profiled(
+            lambda data: sort_func(data, **kwargs), self.data, self.profile_mode, output_path
+        )
+        self.append_result("\n".join(report) + "\n", "dim")
+        return result, elapsed_time
+    
+    def _process_sort(self, sort_func, kwargs=None):
+        """Run sort_func in a child process (see process_runner), driving the progress bar"""
+        if self.stop_requested:
+            raise process_runner.SortKilled()
+        
+        self.sort_process = process_runner.ProcessSort(
+            sort_algorithms.__name__, sort_func.__name__, self.data,
+            on_progress=lambda fraction: self.ui.call(self.progress.config, value=fraction * 100),
+            kwargs=kwargs
+        )
+        self.ui.call(self.progress.stop)
+        self.ui.call(self.progress.config, mode='determinate', value=0)
+        try:
+            sorted_data, elapsed_time, extra = self.sort_process.run()
+        finally:
+            self.sort_process = None
+            self.ui.call(self.progress.config, mode='indeterminate', value=0)
+            self.ui.call(self.progress.start, 10)
+        
+        result = (sorted_data,) + tuple(extra) if extra else sorted_data
+        return result, elapsed_time
+    
+    def stop_sort(self):
+        """Kill the running sort (only possible in Separate process mode)"""
+        if not self.is_sorting:
+            return
+        
+        if not self.use_process:
+            messagebox.showinfo("Info", "Enable 'Separate process' before starting a sort to be able to stop it.")
+            return
+        
+        self.stop_requested = True
+        if self.sort_process is not None:
+            self.sort_process.kill()
+        self.set_status("Stopping...")
     
     def _run_all_sorts(self):
-        self.status_label.config(text="Running all algorithms...")
+        self.set_status("Running all algorithms...")
         
         algorithms = [
             ("Bubble Sort", self.bubble_sort, "O(n²)"),
             ("Insertion Sort", self.insertion_sort, "O(n²)"),
-            ("Merge Sort", self.merge_sort, "O(n log n)")
+            ("Merge Sort", self.merge_sort, "O(n log n)"),
+            ("Shell Sort (Ciura)", self.shell_sort, "O(n^1.25)"),
+            ("Introsort", self.introsort, "O(n log n)"),
+            ("Heap Sort", self.heap_sort, "O(n log n)")
         ]
         
         results = []
+        skipped = []
+        sorted_data = None
+        # Fingerprint the input once; every output is checked against it
+        expected = sort_verifier.fingerprint(self.data)
         
         # Statistics column
         self.append_result("\n═══ Performance Comparison ═══\n", "header")
-        self.append_result(f"Dataset size: {len(self.data):,} numbers\n\n", "dim")
+        self.append_result(f"Dataset size: {len(self.data):,} numbers\n", "dim")
+        
+        # Only predict when the data is larger than the calibration sample
+        predict = self.time_budget > 0 and len(self.data) > runtime_estimator.CALIBRATION_SIZE
+        if predict:
+            self.set_status("Measuring presortedness...")
+            profile = runtime_estimator.presortedness(self.data)
+            self.append_result(
+                f"Presortedness: ~{profile['inversion_ratio']:.1%} pairs inverted\n",
+                "dim"
+            )
+            self.append_result(
+                f"Budget: {runtime_estimator.format_duration(self.time_budget)} per algorithm\n",
+                "dim"
+            )
+        self.append_result("\n")
         
         for name, sort_func, complexity in algorithms:
-            start_time = time.time()
-            sorted_data = sort_func(self.data)
-            elapsed_time = time.time() - start_time
-            results.append((name, elapsed_time, complexity))
-            
             # Color code based on complexity
             if "O(n²)" in complexity:
                 tag = "warning"
             else:
                 tag = "success"
             
+            if predict:
+                self.set_status(f"Estimating {name}...")
+                estimate = runtime_estimator.estimate_runtime(
+                    sort_func.__name__, sort_func, self.data, profile
+                )
+                if estimate > self.time_budget:
+                    skipped.append((name, estimate, complexity))
+                    self.append_result(f"{name} ({complexity}):\n", tag)
+                    self.append_result(
+                        f"  Skipped (est. {runtime_estimator.format_duration(estimate)})\n\n", "danger"
+                    )
+                    continue
+            
+            self.set_status(f"Running {name}...")
+            sorted_data, elapsed_time = self._timed_sort(name, sort_func)
+            results.append((name, elapsed_time, complexity))
+            
             self.append_result(f"{name} ({complexity}):\n", tag)
-            self.append_result(f"  Time: {elapsed_time:.6f} seconds\n\n")
+            self.append_result(f"  Time: {elapsed_time:.6f} seconds\n")
+            if predict:
+                self.append_result(
+                    f"  Predicted: {runtime_estimator.format_duration(estimate)}\n", "dim"
+                )
+            self._append_verification(name, sorted_data, expected)
+            self.append_result("\n")
         
-        # Rank by time
+        # Rank by time; skipped algorithms go last, by estimate
         results.sort(key=lambda x: x[1])
+        skipped.sort(key=lambda x: x[1])
         
         self.append_result("═══ Ranking (Fastest to Slowest) ═══\n", "header")
         for rank, (name, elapsed_time, complexity) in enumerate(results, 1):
-            medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉"
+            medal = MEDALS.get(rank, "  ")
             self.append_result(f"{medal} {rank}. {name}\n")
             self.append_result(f"   {elapsed_time:.6f}s ({complexity})\n\n", "dim")
+        for name, estimate, complexity in skipped:
+            self.append_result(f"⏭ {name}\n")
+            self.append_result(
+                f"   skipped (est. {runtime_estimator.format_duration(estimate)}) ({complexity})\n\n", "danger"
+            )
         
-        # Performance analysis
-        self.append_result("═══ Performance Gap Analysis ═══\n", "header")
-        fastest = results[0]
-        slowest = results[-1]
+        if not results:
+            self.set_status("All algorithms exceeded the time budget")
+            return
         
-        speedup = slowest[1] / fastest[1] if fastest[1] > 0 else 0
+        # Performance analysis
+        if len(results) > 1:
+            self.append_result("═══ Performance Gap Analysis ═══\n", "header")
+            fastest = results[0]
+            slowest = results[-1]
+            
+            speedup = slowest[1] / fastest[1] if fastest[1] > 0 else 0
+            
+            self.append_result(f"Fastest: {fastest[0]}\n", "success")
+            self.append_result(f"Slowest: {slowest[0]}\n", "danger")
+            self.append_result(f"\nSpeedup: {speedup:.2f}x faster\n", "warning")
+            self.append_result(f"Time difference: {slowest[1] - fastest[1]:.6f}s\n\n", "dim")
         
-        self.append_result(f"Fastest: {fastest[0]}\n", "success")
-        self.append_result(f"Slowest: {slowest[0]}\n", "danger")
-        self.append_result(f"\nSpeedup: {speedup:.2f}x faster\n", "warning")
-        self.append_result(f"Time difference: {slowest[1] - fastest[1]:.6f}s\n\n", "dim")
+        if self.trace_memory:
+            self._memory_comparison()
         
         # Display complete sorted dataset in right column
         self.last_sorted_data = sorted_data
-        self.clear_data_output()
-        self.append_data_output("Comparison Complete\n", "header")
-        self.append_data_output(f"Descending Order ({len(sorted_data):,} numbers)\n\n", "dim")
-        self.append_data_output(self._format_dataset(sorted_data))
+        self.show_sorted_data("Comparison Complete", sorted_data)
         
-        self.status_label.config(text="All algorithms completed")
-    
-    def append_result(self, text: str, tag=None):
-        """Append to statistics text box"""
-        self.stats_text.config(state=tk.NORMAL)
-        if tag:
-            self.stats_text.insert(tk.END, text, tag)
+        if skipped:
+            self.set_status(f"Completed; {len(skipped)} skipped over the time budget")
         else:
-            self.stats_text.insert(tk.END, text)
-        self.stats_text.see(tk.END)
-        self.stats_text.config(state=tk.DISABLED)
+            self.set_status("All algorithms completed")
     
-    def append_data_output(self, text: str, tag=None):
-        """Append to sorted data output text box"""
-        self.data_text.config(state=tk.NORMAL)
-        if tag:
-            self.data_text.insert(tk.END, text, tag)
+    def _append_verification(self, name: str, sorted_data: List[int], expected):
+        """Check an output in linear time and report the result and its cost"""
+        self.set_status(f"Verifying {name}...")
+        verification = sort_verifier.verify(sorted_data, expected)
+        self.append_result(f"  {sort_verifier.describe(verification)}\n", "dim" if verification["ok"] else "danger")
+    
+    def _memory_comparison(self):
+        """Peak memory of in-place Heap Sort against Merge Sort, traced on a prefix of the data"""
+        sample = self.data[:sort_profiler.MEMORY_SAMPLE]
+        self.set_status("Measuring peak memory...")
+        self.append_result(f"═══ Peak Memory (first {len(sample):,} numbers) ═══\n", "header")
+        for name, sort_func, in_place in [
+            ("Heap Sort (in place)", sort_algorithms.heap_sort_in_place, True),
+            ("Merge Sort", self.merge_sort, False),
+        ]:
+            peak, auxiliary = sort_profiler.measure_peak_memory(sort_func, sample, in_place)
+            self.append_result(f"{name}:\n")
+            self.append_result(f"  Peak: {sort_profiler.format_bytes(peak)}\n")
+            self.append_result(f"  Beyond the output list: {sort_profiler.format_bytes(auxiliary)}\n", "dim")
+        self.append_result("\n")
+    
+    def _run_shell_sorts(self):
+        """Shell Sort with the selected gap sequence, or every sequence side by side"""
+        if self.gap_choice == COMPARE_ALL_GAPS:
+            sequences = list(sort_algorithms.GAP_SEQUENCES)
         else:
-            self.data_text.insert(tk.END, text)
-        self.data_text.see(tk.END)
-        self.data_text.config(state=tk.DISABLED)
+            sequences = [self.gap_choice.lower()]
+        
+        results = []
+        
+        # Statistics column
+        self.append_result("\n═══ Shell Sort Gap Sequences ═══\n", "header")
+        self.append_result(f"Dataset size: {len(self.data):,} numbers\n", "dim")
+        self.append_result("In place, no extra memory\n\n", "dim")
+        
+        for gaps in sequences:
+            name = f"Shell Sort ({gaps.title()})"
+            self.set_status(f"Running {name}...")
+            (sorted_data, comparisons), elapsed_time = self._timed_sort(
+                name, sort_algorithms.counted_shell_sort, gaps=gaps
+            )
+            results.append((name, elapsed_time, comparisons))
+            
+            gap_list = sort_algorithms.GAP_SEQUENCES[gaps](len(self.data))
+            self.append_result(f"{name}:\n", "success")
+            self.append_result(f"  Time: {elapsed_time:.6f} seconds\n")
+            self.append_result(f"  Comparisons: {comparisons:,}\n")
+            self.append_result(
+                f"  Gaps ({len(gap_list)}): {', '.join(map(str, gap_list[:6]))}"
+                f"{', ...' if len(gap_list) > 6 else ''}\n\n", "dim"
+            )
+        
+        if len(results) > 1:
+            results.sort(key=lambda x: x[1])
+            self.append_result("═══ Ranking (Fastest to Slowest) ═══\n", "header")
+            for rank, (name, elapsed_time, comparisons) in enumerate(results, 1):
+                medal = MEDALS.get(rank, "  ")
+                self.append_result(f"{medal} {rank}. {name}\n")
+                self.append_result(f"   {elapsed_time:.6f}s, {comparisons:,} comparisons\n\n", "dim")
+        
+        # Sorted data column
+        self.last_sorted_data = sorted_data
+        self.show_sorted_data(results[0][0] if len(results) == 1 else "Shell Sort", sorted_data)
+        
+        self.set_status("Shell Sort completed")
+    
+    def _run_distinct_counts(self):
+        """Distinct values with their frequencies, without sorting the full list"""
+        self.set_status("Counting distinct values...")
+        start_time = time.time()
+        pairs = sort_algorithms.distinct_counts(self.data)
+        elapsed_time = time.time() - start_time
+        
+        self.last_sorted_data = pairs
+        self.last_counts = pairs
+        
+        self.append_result("\nDistinct + Counts\n", "header")
+        self.append_result(f"Time: {elapsed_time:.6f} seconds\n", "success")
+        self.append_result(
+            f"Distinct values: {len(pairs):,} of {len(self.data):,} numbers "
+            f"({len(pairs) / len(self.data):.1%} of the full sorted list)\n\n",
+            "dim"
+        )
+        self.ui.call(
+            self.data_view.show, pairs, "Distinct + Counts",
+            f"(value, count) in descending order ({len(pairs):,} distinct values)"
+        )
+        
+        self.set_status("Distinct + counts completed")
+    
+    def append_result(self, text: str, tag=None):
+        """Append to the statistics text box (safe from worker threads)"""
+        self.ui.append(self.stats_text, text, tag)
+    
+    def set_status(self, text: str):
+        """Update the footer status (safe from worker threads)"""
+        self.ui.call(self.status_label.config, text=text)
+    
+    def show_sorted_data(self, title: str, data: List[int]):
+        """Show a sorted dataset in the virtualized output panel (safe from worker threads)"""
+        self.ui.call(self.data_view.show, data, title, f"Descending Order ({len(data):,} numbers)")
+    
+    def _read_checkpoint_interval(self) -> bool:
+        """Capture the checkpoint interval (main thread); False if it is not a number"""
+        try:
+            interval = max(float(self.checkpoint_var.get() or 0), 0.0)
+        except ValueError:
+            messagebox.showwarning("Warning", "Checkpoint interval must be a number of seconds.")
+            return False
+        self.checkpoint_interval = interval or None
+        return True
+    
+    def _checkpoints(self, choice: int) -> bool:
+        """Whether this single run checkpoints (it runs in the worker thread, so not with the process or profiler modes)"""
+        return choice in CHECKPOINTED and bool(self.checkpoint_interval) and not (self.use_process or self.profile_mode)
+    
+    def _announce_checkpoint(self):
+        """Point out a checkpoint left by an interrupted run"""
+        if not os.path.exists(checkpoint.CHECKPOINT_PATH):
+            return
+        try:
+            state = checkpoint.load(checkpoint.CHECKPOINT_PATH)
+        except (OSError, ValueError):
+            return
+        name = state["algorithm"].replace("_", " ").title()
+        self.append_result(
+            f"Found a checkpoint of an interrupted {name} ({len(state['data']):,} numbers, "
+            f"{checkpoint.POSITION_NAMES[state['algorithm']]} {state['position']:,}). "
+            f"Click \"Resume from Checkpoint\" to continue it.\n\n",
+            "dim"
+        )
+    
+    def resume_sort(self):
+        """Continue the checkpointed sort where it stopped"""
+        if self.is_loading or self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the current task to finish.")
+            return
+        
+        if not os.path.exists(checkpoint.CHECKPOINT_PATH):
+            messagebox.showinfo("Info", "There is no checkpoint to resume.")
+            return
+        
+        if not self._read_checkpoint_interval():
+            return
+        
+        self.is_sorting = True
+        thread = threading.Thread(target=self._execute_resume)
+        thread.daemon = True
+        thread.start()
     
-    def clear_data_output(self):
-        """Clear the data output text area"""
-        self.data_text.config(state=tk.NORMAL)
-        self.data_text.delete(1.0, tk.END)
-        self.data_text.config(state=tk.DISABLED)
+    def _execute_resume(self):
+        self.ui.call(self.progress.start, 10)
+        self.set_status("Resuming from checkpoint...")
+        
+        try:
+            state, sorted_data, elapsed_time, saves = checkpoint.resume(interval=self.checkpoint_interval)
+            name = state["algorithm"].replace("_", " ").title()
+            
+            self.last_sorted_data = sorted_data
+            
+            self.append_result(f"\n{name} (resumed)\n", "header")
+            self.append_result(
+                f"Resumed at {checkpoint.POSITION_NAMES[state['algorithm']]} {state['position']:,} "
+                f"after {state['elapsed']:.1f}s of earlier work\n",
+                "dim"
+            )
+            self.append_result(f"Time: {elapsed_time:.6f} seconds (in total)\n", "success")
+            self.append_result(f"Dataset size: {len(sorted_data):,} numbers\n\n", "dim")
+            
+            self.show_sorted_data(f"{name} (resumed)", sorted_data)
+            self.set_status(f"{name} completed")
+        except Exception as e:
+            self.ui.call(messagebox.showerror, "Error", f"Error resuming the checkpoint: {e}")
+            self.set_status("Error occurred")
+        finally:
+            self.is_sorting = False
+            self.ui.call(self.progress.stop)
+    
+    def open_visualizer(self):
+        """Open the live visualiser on a copy of the current data"""
+        if self.is_loading:
+            messagebox.showinfo("Info", "Please wait for the file to finish loading.")
+            return
+        
+        if not self.data:
+            messagebox.showwarning("Warning", "Please load a data file first.")
+            return
+        
+        SortVisualizer(self.root, self.colors, self.data, {
+            "Optimized Bubble Sort": sort_algorithms.bubble_sort,
+            "Insertion Sort": sort_algorithms.insertion_sort,
+            "Merge Sort": sort_algorithms.merge_sort,
+        })
     
     def download_sorted_data(self):
+        if self.is_saving:
+            self.cancel_save()
+            return
+        
         if self.last_sorted_data is None:
             messagebox.showwarning("Warning", "No sorted data available. Run a sorting algorithm first.")
             return
         
+        if self.is_loading or self.is_sorting:
+            messagebox.showinfo("Info", "Please wait for the current task to finish.")
+            return
+        
+        # A Distinct + counts result (until the next sort replaces it) is saved as value,count lines
+        counts = self.last_sorted_data is self.last_counts
         file_path = filedialog.asksaveasfilename(
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialfile="sorted_data.txt"
+            defaultextension=".csv" if counts else ".txt",
+            filetypes=[("CSV files", "*.csv") if counts else ("Text files", "*.txt"), ("All files", "*.*")],
+            initialfile="distinct_counts.csv" if counts else "sorted_data.txt"
         )
         
         if not file_path:
             return
         
+        # Write on a worker; the save button doubles as "Cancel" and the export
+        # has its own progress bar, leaving the main one to any sort started meanwhile
+        self.is_saving = True
+        self.save_cancel = threading.Event()
+        self.save_button.config(text="✖  Cancel Saving")
+        self.save_progress.config(value=0)
+        self.save_progress.pack(fill=tk.X, padx=15, pady=(0, 12), after=self.save_button)
+        self.set_status(f"Saving {file_path.split('/')[-1]}...")
+        
+        thread = threading.Thread(
+            target=self._save_file_worker, args=(file_path, self.last_sorted_data, self.save_cancel, counts)
+        )
+        thread.daemon = True
+        thread.start()
+    
+    def cancel_save(self):
+        """Stop the export in progress; the partial file is discarded"""
+        if self.is_saving:
+            self.save_cancel.set()
+            self.set_status("Cancelling save...")
+    
+    def _save_file_worker(self, file_path: str, numbers: List[int], cancel_event, counts: bool = False):
+        write = file_tasks.write_counts_file if counts else file_tasks.write_numbers_file
         try:
-            with open(file_path, 'w') as file:
-                for num in self.last_sorted_data:
-                    file.write(f"{num}\n")
-            
-            messagebox.showinfo("Success", f"Saved {len(self.last_sorted_data):,} numbers successfully!")
-            self.status_label.config(text="Data exported successfully")
-            
+            write(
+                file_path,
+                numbers,
+                progress=lambda done, total: self.ui.call(self._set_save_progress, done, total),
+                cancel_event=cancel_event
+            )
+        except file_tasks.TaskCancelled:
+            self.ui.call(self._end_save, "Saving cancelled")
+            return
         except Exception as e:
-            messagebox.showerror("Error", f"Error saving file: {e}")
+            self.ui.call(self._end_save, "Error occurred")
+            self.ui.call(messagebox.showerror, "Error", f"Error saving file: {e}")
+            return
+        
+        self.ui.call(self._end_save, "Data exported successfully")
+        self.ui.call(messagebox.showinfo, "Success", f"Saved {len(numbers):,} {'distinct values' if counts else 'numbers'} successfully!")
+    
+    def _set_save_progress(self, done: int, total: int):
+        if self.is_saving:
+            self.save_progress.config(value=done * 100 / total if total else 100)
+    
+    def _end_save(self, status: str):
+        """Restore the export controls (main thread)"""
+        self.is_saving = False
+        self.save_button.config(text="💾  Save Sorted Data")
+        self.save_progress.pack_forget()
+        self.set_status(status)
     
     def clear_results(self):
         """Clear both results text areas"""
@@ -742,11 +1380,9 @@ class ModernSortingGUI:
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.config(state=tk.DISABLED)
         
-        self.data_text.config(state=tk.NORMAL)
-        self.data_text.delete(1.0, tk.END)
-        self.data_text.config(state=tk.DISABLED)
+        self.data_view.clear()
         
-        self.status_label.config(text="Results cleared")
+        self.set_status("Results cleared")
 
 
 def main():
@@ -0,0 +1,508 @@
+"""
+Sorting algorithms compared by the Sorting Algorithm Analyzer.
+
+Kept free of tkinter so the same code can run headless (see __main__.py).
+All algorithms sort in DESCENDING order and return a new list; the input
+may be any sequence, including a memoryview window from dataset_views.
+The optional progress(done, total) callback is called from the outer loop,
+which lets process_runner report progress from a separate process.
+Bubble, insertion and merge sort also take a step(values, lo, hi) callback
+that sort_visualizer uses to watch them: after each outer step values is
+the live working list (so nothing is copied) and lo..hi is the range that
+step worked on. They can also be stopped and resumed (see checkpoint.py):
+checkpoint(arr, position) is called at the safe points of the outer loop
+with the working list and the loop position to continue from, and
+start=position picks the sort up there on the saved list.
+"""
+import os
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+
+from common import merge_tuning, sorting_networks
+
+# Per-machine config written by the calibrate command
+MERGE_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), merge_tuning.CONFIG_NAME)
+# merge_sort hands lists of this size or smaller to a sorting network or insertion sort
+MERGE_CUTOFF = merge_tuning.load_cutoff(MERGE_CONFIG_PATH)
+# counting_sort refuses value ranges this wide (its count loop walks every value)
+COUNTING_MAX_RANGE = 1 << 24
+# Digit width of radix_sort: 2048 buckets per pass
+RADIX_BITS = 11
+
+
+def read_numbers(file_path: str) -> List[int]:
+    """Parse every integer token (spaces, commas or newlines) from a text file"""
+    with open(file_path, 'r') as file:
+        content = file.read()
+    return [
+        int(x.strip())
+        for x in content.replace(',', ' ').split()
+        if x.strip().lstrip('-').isdigit()
+    ]
+
+
+def bubble_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                step: Optional[Callable[[List[int], int, int], None]] = None,
+                start: int = 0, checkpoint: Optional[Callable[[List[int], int], None]] = None) -> List[int]:
+    """
+    Bubble Sort - O(n²)
+    Classic exchange sort with optimized early exit
+    Sorts in DESCENDING order
+    """
+    arr = list(arr)
+    n = len(arr)
+    # A checkpoint position is the next pass
+    for i in range(start, n - 1):
+        if checkpoint is not None:
+            checkpoint(arr, i)
+        swapped = False
+        for j in range(n - 1 - i):
+            if arr[j] < arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        if step is not None:
+            step(arr, 0, n - i)
+        if not swapped:
+            break
+        if progress is not None:
+            progress(i + 1, n - 1)
+    return arr
+
+
+def insertion_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                   step: Optional[Callable[[List[int], int, int], None]] = None,
+                   start: int = 0, checkpoint: Optional[Callable[[List[int], int], None]] = None) -> List[int]:
+    """
+    Insertion Sort - O(n²)
+    Builds the final sorted array one item at a time
+    Sorts in DESCENDING order
+    """
+    arr = list(arr)
+    _gapped_insertion(arr, 1, progress, step, start, checkpoint)
+    return arr
+
+
+def _gapped_insertion(arr: List[int], gap: int, progress: Optional[Callable[[int, int], None]] = None,
+                      step: Optional[Callable[[List[int], int, int], None]] = None,
+                      start: int = 0, checkpoint: Optional[Callable[[List[int], int], None]] = None) -> int:
+    """
+    In-place insertion sort of every gap-th item (gap 1 is plain insertion sort).
+    Returns the number of comparisons made.
+    """
+    n = len(arr)
+    comparisons = 0
+    # A checkpoint position is the next item to insert, offered every 1024 items
+    for i in range(max(start, gap), n):
+        if checkpoint is not None and i & 1023 == 0:
+            checkpoint(arr, i)
+        key = arr[i]
+        j = i - gap
+        # Changed comparison for descending order
+        while j >= 0 and arr[j] < key:
+            arr[j + gap] = arr[j]
+            j -= gap
+        arr[j + gap] = key
+        # One comparison per shift, plus the one that stopped the scan
+        comparisons += (i - j) // gap - 1 + (j >= 0)
+        # Work grows with i, so report the share of i² done
+        if progress is not None and i & 1023 == 0:
+            progress(i * i, n * n)
+        if step is not None:
+            step(arr, 0, i + 1)
+    return comparisons
+
+
+def shell_gaps(n: int) -> List[int]:
+    """Shell (1959): n/2, n/4, ..., 1"""
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps or [1]
+
+
+def knuth_gaps(n: int) -> List[int]:
+    """Knuth (1973): 1, 4, 13, 40, ... (3h + 1) up to n/3"""
+    gaps = [1]
+    while gaps[-1] * 3 + 1 < n // 3:
+        gaps.append(gaps[-1] * 3 + 1)
+    return gaps[::-1]
+
+
+def sedgewick_gaps(n: int) -> List[int]:
+    """Sedgewick (1986): 1, 8, 23, 77, 281, ... (4^k + 3·2^(k-1) + 1)"""
+    gaps = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps[::-1]
+
+
+def ciura_gaps(n: int) -> List[int]:
+    """Ciura (2001): 1, 4, 10, 23, 57, ..., 1750, then ×2.25"""
+    gaps = [1]
+    for gap in (4, 10, 23, 57, 132, 301, 701, 1750):
+        if gap >= n:
+            return gaps[::-1]
+        gaps.append(gap)
+    while int(gaps[-1] * 2.25) < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return gaps[::-1]
+
+
+# Gap sequence name -> generator (largest gap first, always ending in 1)
+GAP_SEQUENCES = {
+    "shell": shell_gaps,
+    "knuth": knuth_gaps,
+    "sedgewick": sedgewick_gaps,
+    "ciura": ciura_gaps,
+}
+
+
+def shell_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+               gaps: str = "ciura") -> List[int]:
+    """
+    Shell Sort - about O(n^1.3) with good gaps
+    Insertion sort over shrinking gaps, in place with no extra memory
+    Sorts in DESCENDING order
+    """
+    return counted_shell_sort(arr, progress, gaps)[0]
+
+
+def counted_shell_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+                       gaps: str = "ciura") -> Tuple[List[int], int]:
+    """Shell sort that also returns its comparison count: (sorted_array, comparisons)"""
+    arr = list(arr)
+    sequence = GAP_SEQUENCES[gaps](len(arr))
+    comparisons = 0
+    for done, gap in enumerate(sequence, 1):
+        comparisons += _gapped_insertion(arr, gap)
+        if progress is not None:
+            progress(done, len(sequence))
+    return arr, comparisons
+
+
+def merge_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None,
+               cutoff: Optional[int] = None,
+               step: Optional[Callable[[List[int], int, int], None]] = None,
+               start: int = 0, checkpoint: Optional[Callable[[List[int], int], None]] = None) -> List[int]:
+    """
+    Merge Sort - O(n log n)
+    Divide and conquer algorithm; lists at or below the cutoff
+    (MERGE_CUTOFF by default) are finished with a sorting network
+    (up to 16 items) or insertion sort
+    Sorts in DESCENDING order
+    """
+    if cutoff is None:
+        cutoff = MERGE_CUTOFF
+    arr = list(arr)
+    _merge_sort_range(arr, 0, len(arr), max(cutoff, 1), progress, step, start, checkpoint, 0)
+    return arr
+
+
+def _merge_sort_range(arr: List[int], lo: int, hi: int, cutoff: int,
+                      progress: Optional[Callable[[int, int], None]],
+                      step: Optional[Callable[[List[int], int, int], None]],
+                      start: int, checkpoint: Optional[Callable[[List[int], int], None]], done: int) -> int:
+    """
+    Merge sort arr[lo:hi] in place. Each finished block or merge is one
+    step, counted in post-order: done steps came before this range, and
+    steps below start were finished before a checkpoint, so only the walk
+    repeats them. Returns done plus the steps of this range (the checkpoint
+    position after it).
+    """
+    if hi - lo > cutoff:
+        mid = lo + (hi - lo) // 2
+        done = _merge_sort_range(arr, lo, mid, cutoff, None, step, start, checkpoint, done)
+        if progress is not None:
+            progress(1, 2)
+        done = _merge_sort_range(arr, mid, hi, cutoff, None, step, start, checkpoint, done)
+        if done >= start:
+            arr[lo:hi] = _merge(arr[lo:mid], arr[mid:hi])
+    elif done >= start:
+        if hi - lo <= sorting_networks.MAX_SIZE:
+            sorting_networks.sort_range(arr, lo, hi)
+        else:
+            block = arr[lo:hi]
+            _gapped_insertion(block, 1)
+            arr[lo:hi] = block
+    if done >= start:
+        if step is not None:
+            step(arr, lo, hi)
+        if checkpoint is not None:
+            checkpoint(arr, done + 1)
+    return done + 1
+
+
+def _merge(left: List[int], right: List[int]) -> List[int]:
+    """Merge two sorted arrays in descending order"""
+    result = []
+    i = j = 0
+    
+    while i < len(left) and j < len(right):
+        # Changed comparison for descending order
+        if left[i] >= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+    
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+# Partitions at or below this size are finished by a sorting network
+NETWORK_CUTOFF = sorting_networks.MAX_SIZE
+# Partitions above this size take a ninther (median of three medians) pivot
+NINTHER_THRESHOLD = 128
+
+
+def introsort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    Introsort - O(n log n) worst case
+    3-way quicksort with median-of-three/ninther pivots, a heap sort
+    fallback when recursion gets too deep and sorting networks for the
+    partitions of 16 items or fewer
+    Sorts in DESCENDING order
+    """
+    arr = list(arr)
+    n = len(arr)
+    _introsort_range(arr, 0, n, 2 * n.bit_length(), progress)
+    return arr
+
+
+def _introsort_range(arr: List[int], lo: int, hi: int, depth_limit: int,
+                     progress: Optional[Callable[[int, int], None]] = None):
+    """Partition arr[lo:hi] down to sorting network size, heap sorting any range that recurses too deep"""
+    n = hi - lo
+    settled = 0
+    steps = 0
+    stack = [(lo, hi, depth_limit)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= NETWORK_CUTOFF:
+            sorting_networks.sort_range(arr, lo, hi)
+            settled += hi - lo
+            continue
+        if depth == 0:
+            # Too many unbalanced partitions: heap sort keeps this range O(n log n)
+            _heap_sort_range(arr, lo, hi)
+            settled += hi - lo
+            continue
+
+        lt, gt = _partition3(arr, lo, hi, _choose_pivot(arr, lo, hi))
+        settled += gt - lt
+        stack.append((gt, hi, depth - 1))
+        stack.append((lo, lt, depth - 1))
+
+        steps += 1
+        if progress is not None and steps & 1023 == 0:
+            progress(settled, n)
+
+
+def _choose_pivot(arr: List[int], lo: int, hi: int) -> int:
+    """Median of three, or Tukey's ninther on large partitions"""
+    mid = (lo + hi) // 2
+    last = hi - 1
+    if hi - lo > NINTHER_THRESHOLD:
+        step = (hi - lo) // 8
+        return _median3(
+            _median3(arr[lo], arr[lo + step], arr[lo + 2 * step]),
+            _median3(arr[mid - step], arr[mid], arr[mid + step]),
+            _median3(arr[last - 2 * step], arr[last - step], arr[last])
+        )
+    return _median3(arr[lo], arr[mid], arr[last])
+
+
+def _median3(a: int, b: int, c: int) -> int:
+    """Median of three values"""
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _partition3(arr: List[int], lo: int, hi: int, pivot: int) -> Tuple[int, int]:
+    """
+    Dutch flag partition of arr[lo:hi] for descending order:
+    arr[lo:lt] > pivot, arr[lt:gt] == pivot, arr[gt:hi] < pivot.
+    Returns (lt, gt); a run of equal keys is settled in one pass.
+    """
+    lt = i = lo
+    gt = hi - 1
+    while i <= gt:
+        value = arr[i]
+        if value > pivot:
+            arr[i] = arr[lt]
+            arr[lt] = value
+            lt += 1
+            i += 1
+        elif value < pivot:
+            arr[i] = arr[gt]
+            arr[gt] = value
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt + 1
+
+
+def heap_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    Heap Sort - O(n log n) worst case
+    Bottom-up heap sort on a min-heap, run on a copy (see heap_sort_in_place)
+    Sorts in DESCENDING order
+    """
+    arr = list(arr)
+    heap_sort_in_place(arr, progress)
+    return arr
+
+
+def heap_sort_in_place(arr: List[int], progress: Optional[Callable[[int, int], None]] = None):
+    """Heap sort of arr itself, with O(1) auxiliary memory (sorts in DESCENDING order)"""
+    _heap_sort_range(arr, 0, len(arr), progress)
+
+
+def _heap_sort_range(arr: List[int], lo: int, hi: int,
+                     progress: Optional[Callable[[int, int], None]] = None):
+    """In-place heap sort of arr[lo:hi] into descending order using a min-heap"""
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        # The smallest item goes to the back of the shrinking heap
+        smallest = arr[lo]
+        arr[lo] = arr[lo + end]
+        arr[lo + end] = smallest
+        _sift_down(arr, lo, 0, end)
+        if progress is not None and end & 1023 == 0:
+            progress(size - end, size)
+
+
+def _sift_down(arr: List[int], lo: int, root: int, size: int):
+    """
+    Restore the min-heap below root in arr[lo:lo + size], bottom-up: the
+    hole walks down to a leaf along the smaller children (one comparison
+    per level), then the item climbs back to its place. Values are moved
+    into the hole one at a time, so no swap tuples are built.
+    """
+    item = arr[lo + root]
+    start = root
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child + 1] < arr[lo + child]:
+            child += 1
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    while root > start:
+        parent = (root - 1) >> 1
+        if arr[lo + parent] <= item:
+            break
+        arr[lo + root] = arr[lo + parent]
+        root = parent
+    arr[lo + root] = item
+
+
+def counting_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    Counting sort - O(n + k) for integers spanning k values
+    Sorts in DESCENDING order
+    """
+    if not arr:
+        return []
+    counts = Counter(arr)
+    lo = min(counts)
+    hi = max(counts)
+    if hi - lo >= COUNTING_MAX_RANGE:
+        raise ValueError(f"counting sort needs a value range below {COUNTING_MAX_RANGE:,}, got {hi - lo + 1:,}")
+    result = []
+    for value in range(hi, lo - 1, -1):
+        count = counts.get(value)
+        if count:
+            result += [value] * count
+        if progress is not None and value & 0xFFFF == 0:
+            progress(hi - value, hi - lo + 1)
+    return result
+
+
+def radix_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    LSD radix sort - RADIX_BITS per pass, offset by the minimum so negatives work
+    Sorts in DESCENDING order
+    """
+    if len(arr) < 2:
+        return list(arr)
+    lo = min(arr)
+    span = max(arr) - lo
+    shifts = range(0, max(span.bit_length(), 1), RADIX_BITS)
+    mask = (1 << RADIX_BITS) - 1
+    for done, shift in enumerate(shifts):
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for value in arr:
+            buckets[((value - lo) >> shift) & mask].append(value)
+        # Each pass is stable, so concatenating high buckets first keeps the order descending
+        arr = [value for bucket in reversed(buckets) for value in bucket]
+        if progress is not None:
+            progress(done + 1, len(shifts))
+    return arr
+
+
+def natural_merge_sort(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[int]:
+    """
+    Natural merge sort - merges the existing descending runs pairwise
+    Sorts in DESCENDING order
+    """
+    runs = _descending_runs(arr)
+    total = len(runs)
+    while len(runs) > 1:
+        merged = [_merge(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+        if progress is not None:
+            progress(total - len(runs), total - 1)
+    return runs[0] if runs else []
+
+
+def _descending_runs(arr: List[int]) -> List[List[int]]:
+    """Split arr into its maximal non-increasing runs"""
+    runs = []
+    start = 0
+    for i in range(1, len(arr)):
+        if arr[i - 1] < arr[i]:
+            runs.append(list(arr[start:i]))
+            start = i
+    if arr:
+        runs.append(list(arr[start:]))
+    return runs
+
+
+def distinct_counts(arr: List[int], progress: Optional[Callable[[int, int], None]] = None) -> List[Tuple[int, int]]:
+    """
+    Distinct + counts - O(n + d log d) for d distinct values
+    One counting pass, then only the distinct keys are sorted
+    Returns (value, count) pairs in DESCENDING order of value
+    """
+    counts = Counter(arr)
+    return [(value, counts[value]) for value in introsort(list(counts), progress)]
+
+
+# Name -> function, in the order the GUI presents them
+ALGORITHMS = {
+    "bubble_sort": bubble_sort,
+    "insertion_sort": insertion_sort,
+    "merge_sort": merge_sort,
+    "shell_sort": shell_sort,
+    "introsort": introsort,
+    "heap_sort": heap_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "natural_merge_sort": natural_merge_sort,
+}
@@ -0,0 +1,6 @@
+"""
+Helpers shared by the Activities, LabWork1 and LabWork2 apps.
+
+Each app's entry point puts the repository root on sys.path, so the
+modules here are imported as e.g. "from common import file_tasks".
+"""
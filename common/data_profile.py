@@ -0,0 +1,129 @@
+"""
+Presortedness profile of a loaded dataset and the engine it favours.
+
+analyze() runs once right after a file is loaded. It makes one pass for
+the descending runs and one for the value range and duplicates, then
+counts inversions exactly with a merge count (O(n log n)) on inputs up to
+EXACT_INVERSIONS_LIMIT and estimates them from random pairs beyond that.
+recommend() turns the profile into the algorithm the "Auto" action runs.
+"""
+import random
+from itertools import islice
+from typing import Dict, List, Sequence, Tuple
+
+EXACT_INVERSIONS_LIMIT = 50000
+INVERSION_SAMPLES = 20000
+# Counting sort pays off while its count loop is no longer than the data
+COUNTING_MIN_RANGE = 1 << 16
+# Average run length at which natural merge sort beats the general engines
+NEARLY_SORTED_RUN_LENGTH = 64
+# Radix sort stays well ahead of introsort up to four 11-bit passes
+RADIX_MAX_BITS = 44
+
+
+def analyze(data: Sequence[int], samples: int = INVERSION_SAMPLES, seed: int = 0) -> Dict:
+    """
+    Runs are maximal descending (non-increasing) stretches and an inversion
+    is a pair i < j with data[i] < data[j], i.e. one out of descending order.
+    """
+    n = len(data)
+    if n == 0:
+        return {"n": 0, "runs": 0, "longest_run": 0, "inversions": 0, "inversion_ratio": 0.0,
+                "exact": True, "distinct": 0, "duplicate_ratio": 0.0, "min": None, "max": None}
+
+    runs = 1
+    longest = 0
+    start = 0
+    previous = data[0]
+    for i, value in enumerate(islice(data, 1, None), 1):
+        if previous < value:
+            runs += 1
+            longest = max(longest, i - start)
+            start = i
+        previous = value
+    longest = max(longest, n - start)
+
+    distinct = len(set(data))
+    pairs = n * (n - 1) // 2
+    if n <= EXACT_INVERSIONS_LIMIT:
+        inversions = count_inversions(data)
+        ratio = inversions / pairs if pairs else 0.0
+        exact = True
+    else:
+        ratio = _sampled_inversion_ratio(data, samples, seed)
+        inversions = int(ratio * pairs)
+        exact = False
+
+    return {"n": n, "runs": runs, "longest_run": longest, "inversions": inversions,
+            "inversion_ratio": ratio, "exact": exact, "distinct": distinct,
+            "duplicate_ratio": 1 - distinct / n, "min": min(data), "max": max(data)}
+
+
+def count_inversions(data: Sequence[int]) -> int:
+    """Exact inversion count: every item taken from the right half during a merge passes the rest of the left"""
+    arr = list(data)
+    n = len(arr)
+    inversions = 0
+    width = 1
+    while width < n:
+        merged = []
+        for lo in range(0, n, 2 * width):
+            left = arr[lo:lo + width]
+            right = arr[lo + width:lo + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if left[i] >= right[j]:
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    merged.append(right[j])
+                    j += 1
+                    inversions += len(left) - i
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        arr = merged
+        width *= 2
+    return inversions
+
+
+def _sampled_inversion_ratio(data: Sequence[int], samples: int, seed: int) -> float:
+    rng = random.Random(seed)
+    n = len(data)
+    hits = 0
+    for _ in range(samples):
+        i, j = sorted(rng.sample(range(n), 2))
+        if data[i] < data[j]:
+            hits += 1
+    return hits / samples
+
+
+def recommend(profile: Dict) -> Tuple[str, str]:
+    """(algorithm name, reason) of the engine expected to be fastest for the profile"""
+    n = profile["n"]
+    if n < 2 or profile["runs"] == 1:
+        return "natural_merge_sort", "already in descending order"
+
+    span = profile["max"] - profile["min"] + 1
+    if span <= max(2 * n, COUNTING_MIN_RANGE):
+        return "counting_sort", f"small integer range, {span:,} possible values"
+    if n / profile["runs"] >= NEARLY_SORTED_RUN_LENGTH:
+        return "natural_merge_sort", f"nearly sorted, {profile['runs']:,} descending runs"
+    if span.bit_length() <= RADIX_MAX_BITS:
+        return "radix_sort", f"integer range fits in {span.bit_length()} bits"
+    return "introsort", "wide value range and no useful order"
+
+
+def format_profile(profile: Dict) -> List[str]:
+    """Preview lines describing the profile"""
+    n = profile["n"]
+    if n == 0:
+        return ["No data"]
+    inversions = f"{profile['inversions']:,}" if profile["exact"] else f"~{profile['inversions']:,} (sampled)"
+    algorithm, reason = recommend(profile)
+    return [
+        f"Descending runs: {profile['runs']:,} (longest {profile['longest_run']:,})",
+        f"Inversions: {inversions}, {profile['inversion_ratio']:.1%} of all pairs",
+        f"Duplicates: {profile['duplicate_ratio']:.1%} ({profile['distinct']:,} distinct values)",
+        f"Value range: {profile['min']:,} to {profile['max']:,}",
+        f"Auto would pick: {algorithm.replace('_', ' ').title()} ({reason})",
+    ]
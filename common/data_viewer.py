@@ -0,0 +1,209 @@
+"""
+Virtualized viewer for large sorted datasets.
+
+Only the rows that fit in the window are formatted and inserted into the
+Text widget; scrolling (scrollbar, mouse wheel or jump-to-index) re-renders
+that window. Display cost therefore depends on the widget height, not on
+the size of the dataset.
+"""
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class VirtualDataView(tk.Frame):
+    def __init__(self, parent, colors, title="Sorted Data Output", items_per_line=10, font=("Consolas", 10)):
+        super().__init__(parent, bg=colors['bg'])
+        self.colors = colors
+        self.items_per_line = items_per_line
+        self.data = []
+        self.top_row = 0
+        self.visible_rows = 20
+        self.highlight_index = None
+        self.line_height = tkfont.Font(font=font).metrics("linespace")
+
+        # Title and jump-to-index controls
+        header = tk.Frame(self, bg=colors['bg'])
+        header.pack(fill=tk.X, pady=(0, 8))
+
+        tk.Label(
+            header,
+            text=title,
+            font=("Segoe UI", 10, "bold"),
+            bg=colors['bg'],
+            fg=colors['text'],
+            anchor=tk.W
+        ).pack(side=tk.LEFT)
+
+        tk.Button(
+            header,
+            text="Go",
+            command=self.jump_to_entry,
+            font=("Segoe UI", 9),
+            bg=colors['surface_light'],
+            fg=colors['text'],
+            activebackground=colors['border'],
+            activeforeground=colors['text'],
+            relief=tk.FLAT,
+            bd=0,
+            padx=10,
+            cursor="hand2"
+        ).pack(side=tk.RIGHT)
+
+        self.jump_var = tk.StringVar()
+        jump_entry = tk.Entry(
+            header,
+            textvariable=self.jump_var,
+            font=("Segoe UI", 9),
+            width=10,
+            bg=colors['surface_light'],
+            fg=colors['text'],
+            insertbackground=colors['text'],
+            relief=tk.FLAT
+        )
+        jump_entry.pack(side=tk.RIGHT, padx=(0, 6))
+        jump_entry.bind("<Return>", lambda e: self.jump_to_entry())
+
+        tk.Label(
+            header,
+            text="Jump to index",
+            font=("Segoe UI", 8),
+            bg=colors['bg'],
+            fg=colors['text_dim']
+        ).pack(side=tk.RIGHT, padx=(0, 6))
+
+        # Caption (algorithm name and size) above the rows
+        caption = tk.Frame(self, bg=colors['surface'])
+        caption.pack(fill=tk.X)
+        self.title_label = tk.Label(
+            caption,
+            text="",
+            font=("Consolas", 11, "bold"),
+            bg=colors['surface'],
+            fg=colors['primary'],
+            anchor=tk.W
+        )
+        self.title_label.pack(anchor=tk.W, padx=15, pady=(10, 0))
+        self.subtitle_label = tk.Label(
+            caption,
+            text="",
+            font=font,
+            bg=colors['surface'],
+            fg=colors['text_dim'],
+            anchor=tk.W
+        )
+        self.subtitle_label.pack(anchor=tk.W, padx=15, pady=(0, 4))
+
+        body = tk.Frame(self, bg=colors['border'], bd=1)
+        body.pack(fill=tk.BOTH, expand=True)
+
+        self.scrollbar = tk.Scrollbar(body, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.text = tk.Text(
+            body,
+            font=font,
+            wrap=tk.NONE,
+            bg=colors['surface'],
+            fg=colors['text'],
+            selectbackground=colors['primary'],
+            selectforeground=colors['text'],
+            relief=tk.FLAT,
+            bd=0,
+            padx=15,
+            pady=10,
+            state=tk.DISABLED,
+            cursor="arrow"
+        )
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.tag_config("index", foreground=colors['text_dim'])
+        self.text.tag_config("highlight", background=colors['surface_light'])
+
+        self.text.bind("<Configure>", self.on_resize)
+        self.text.bind("<MouseWheel>", self.on_mousewheel)
+        self.text.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.text.bind("<Prior>", lambda e: self.scroll_rows(-self.visible_rows))
+        self.text.bind("<Next>", lambda e: self.scroll_rows(self.visible_rows))
+        self.text.bind("<Home>", lambda e: self.scroll_to_row(0))
+        self.text.bind("<End>", lambda e: self.scroll_to_row(self.total_rows()))
+
+    def show(self, data, title="", subtitle=""):
+        """Display a dataset; only a reference is kept, nothing is formatted up front"""
+        self.data = data
+        self.top_row = 0
+        self.highlight_index = None
+        self.title_label.config(text=title)
+        self.subtitle_label.config(text=subtitle)
+        self.render()
+
+    def clear(self):
+        self.show([])
+
+    def total_rows(self) -> int:
+        return (len(self.data) + self.items_per_line - 1) // self.items_per_line
+
+    def scroll_to_row(self, row: int):
+        max_top = max(self.total_rows() - self.visible_rows, 0)
+        self.top_row = min(max(row, 0), max_top)
+        self.render()
+
+    def scroll_rows(self, delta: int):
+        self.scroll_to_row(self.top_row + delta)
+        return "break"
+
+    def jump_to_index(self, index: int):
+        """Scroll so the row holding data[index] is at the top, and highlight it"""
+        if not self.data:
+            return
+        index = min(max(index, 0), len(self.data) - 1)
+        self.highlight_index = index
+        self.scroll_to_row(index // self.items_per_line)
+
+    def jump_to_entry(self):
+        try:
+            index = int(self.jump_var.get().replace(",", "").strip())
+        except ValueError:
+            return
+        self.jump_to_index(index)
+
+    def on_scrollbar(self, *args):
+        total = self.total_rows()
+        if args[0] == "moveto":
+            self.scroll_to_row(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_rows(int(args[1]) * step)
+
+    def on_mousewheel(self, event):
+        return self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        visible_rows = max((event.height - 20) // self.line_height, 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.scroll_to_row(self.top_row)
+
+    def render(self):
+        """Format and insert only the rows currently in view"""
+        per_line = self.items_per_line
+        total = self.total_rows()
+        last_row = min(self.top_row + self.visible_rows, total)
+        index_width = len(f"{max(len(self.data) - 1, 0):,}")
+
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        for row in range(self.top_row, last_row):
+            start = row * per_line
+            chunk = self.data[start:start + per_line]
+            line = ", ".join(map(str, chunk))
+            self.text.insert(tk.END, f"{start:>{index_width},}  ", "index")
+            if self.highlight_index is not None and start <= self.highlight_index < start + per_line:
+                self.text.insert(tk.END, line + "\n", "highlight")
+            else:
+                self.text.insert(tk.END, line + "\n")
+        self.text.config(state=tk.DISABLED)
+
+        if total:
+            self.scrollbar.set(self.top_row / total, last_row / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
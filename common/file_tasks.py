@@ -0,0 +1,109 @@
+"""
+File work that the GUIs run on background threads.
+
+These helpers never touch Tk: they report progress through a callback and
+stop early when a threading.Event is set, raising TaskCancelled.
+"""
+import codecs
+import os
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+CHUNK_SIZE = 1 << 20  # 1 MiB per read
+WRITE_CHUNK_ITEMS = 1 << 16  # Numbers formatted per write
+
+
+class TaskCancelled(Exception):
+    """Raised when a background file task is cancelled"""
+
+
+def _is_int_token(token: str) -> bool:
+    digits = token[1:] if token.startswith('-') else token
+    return digits.isascii() and digits.isdigit()
+
+
+def iter_number_chunks(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[List[int], int]]:
+    """
+    Yield (numbers, bytes_read) for each chunk of a text file: every integer
+    token (spaces, commas or newlines) completed in that chunk. Only one
+    chunk is held in memory at a time.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    bytes_read = 0
+    leftover = ''
+
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            final = not chunk
+            text = leftover + decoder.decode(chunk, final=final)
+            tokens = text.replace(',', ' ').split()
+
+            # A token touching the end of the chunk may continue in the next one
+            leftover = ''
+            if not final and tokens and not text[-1].isspace() and text[-1] != ',':
+                leftover = tokens.pop()
+
+            bytes_read += len(chunk)
+            yield [int(token) for token in tokens if _is_int_token(token)], bytes_read
+
+            if final:
+                break
+
+
+def parse_numbers_file(file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                       cancel_event=None, chunk_size: int = CHUNK_SIZE) -> List[int]:
+    """
+    Parse every integer token (spaces, commas or newlines) from a text file.
+    The file is read in chunks; progress(bytes_read, total_bytes) is called
+    after each one.
+    """
+    total = os.path.getsize(file_path)
+    numbers = []
+
+    for chunk_numbers, bytes_read in iter_number_chunks(file_path, chunk_size):
+        if cancel_event is not None and cancel_event.is_set():
+            raise TaskCancelled()
+
+        numbers.extend(chunk_numbers)
+        if progress is not None:
+            progress(bytes_read, total)
+
+    return numbers
+
+
+def write_numbers_file(file_path: str, numbers: Sequence[int], progress: Optional[Callable[[int, int], None]] = None,
+                       cancel_event=None, chunk_items: int = WRITE_CHUNK_ITEMS, formatter: Callable = str):
+    """
+    Write one number per line (formatter(item), str by default), chunk by
+    chunk, through a buffered temp file next to file_path that replaces it
+    atomically at the end. The target is never left half-written: on cancel
+    or error the temp file is removed. progress(numbers_written, total) is
+    called after each chunk.
+    """
+    total = len(numbers)
+    folder, name = os.path.split(os.path.abspath(file_path))
+    temp_path = os.path.join(folder, f".{name}.part")
+
+    try:
+        with open(temp_path, 'w', buffering=CHUNK_SIZE) as file:
+            for start in range(0, total, chunk_items):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise TaskCancelled()
+
+                chunk = numbers[start:start + chunk_items]
+                file.write("\n".join(map(formatter, chunk)))
+                file.write("\n")
+
+                if progress is not None:
+                    progress(min(start + chunk_items, total), total)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_counts_file(file_path: str, pairs: Sequence[Tuple[int, int]], progress: Optional[Callable[[int, int], None]] = None,
+                      cancel_event=None):
+    """Write (value, count) pairs as 'value,count' lines, like write_numbers_file"""
+    write_numbers_file(file_path, pairs, progress=progress, cancel_event=cancel_event, formatter="%d,%d".__mod__)
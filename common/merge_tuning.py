@@ -0,0 +1,123 @@
+"""
+Per-machine small-list cutoff for the hybrid merge sort.
+
+merge_sort hands lists at or below the cutoff to a sorting network (up to
+sorting_networks.MAX_SIZE items) or insertion sort (above that) instead of
+recursing all the way down to single items. The best cutoff depends on the
+interpreter and the CPU, so calibrate() times candidate cutoffs on this host
+and save_calibration() stores the winner in a small JSON config keyed by
+machine. The algorithm modules read their config once at import.
+"""
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+CONFIG_NAME = "merge_cutoff.json"
+# Used until the host has been calibrated
+DEFAULT_CUTOFF = 16
+CANDIDATES = (1, 4, 8, 12, 16, 24, 32, 48, 64)
+CALIBRATION_SIZE = 20000
+
+
+def cpu_name() -> str:
+    """Best-effort CPU model string for the current host"""
+    try:
+        with open("/proc/cpuinfo", "r") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine() or "unknown"
+
+
+def machine_key() -> str:
+    """Host, CPU and interpreter; a calibrated cutoff is only reused on the same combination"""
+    return f"{platform.node()} | {cpu_name()} | {platform.python_implementation()} {platform.python_version()}"
+
+
+def load_config(path: str) -> Dict:
+    try:
+        with open(path, "r") as file:
+            config = json.load(file)
+    except (OSError, ValueError):
+        return {"machines": {}}
+    if not isinstance(config.get("machines"), dict):
+        config["machines"] = {}
+    return config
+
+
+def load_cutoff(path: str) -> int:
+    """The cutoff calibrated for this machine, or DEFAULT_CUTOFF"""
+    entry = load_config(path)["machines"].get(machine_key())
+    try:
+        return max(int(entry["cutoff"]), 1)
+    except (TypeError, KeyError, ValueError):
+        return DEFAULT_CUTOFF
+
+
+def calibrate(merge_sort: Callable, size: int = CALIBRATION_SIZE, candidates=CANDIDATES,
+              repeat: int = 5, seed: int = 0) -> Dict[int, float]:
+    """
+    Median time of merge_sort(data, cutoff=c) for each candidate on random data.
+    The candidates are interleaved within each round so drift in machine load
+    affects all of them alike.
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+    times = {cutoff: [] for cutoff in candidates}
+    for _ in range(repeat):
+        for cutoff in candidates:
+            start_time = time.perf_counter()
+            merge_sort(data, cutoff=cutoff)
+            times[cutoff].append(time.perf_counter() - start_time)
+    return {cutoff: statistics.median(samples) for cutoff, samples in times.items()}
+
+
+def save_calibration(path: str, timings: Dict[int, float], size: int) -> Dict:
+    """Store the fastest cutoff for this machine (other machines are kept) and return its entry"""
+    best = min(timings, key=timings.get)
+    entry = {
+        "cutoff": best,
+        "host": platform.node(),
+        "cpu": cpu_name(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "calibrated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "size": size,
+        "timings": {str(cutoff): timings[cutoff] for cutoff in sorted(timings)},
+    }
+    config = load_config(path)
+    config["machines"][machine_key()] = entry
+
+    # Write through a temp file so an interrupted save keeps the old config
+    temp_path = path + ".part"
+    with open(temp_path, "w") as file:
+        json.dump(config, file, indent=2)
+    os.replace(temp_path, path)
+    return entry
+
+
+def report_lines(path: str, timings: Dict[int, float]) -> List[str]:
+    """Timing table for this run, then the cutoff recorded for every machine in the config"""
+    best = min(timings, key=timings.get)
+    baseline = timings.get(1)
+    lines = [f"{'cutoff':>6} {'median':>12}"]
+    for cutoff in sorted(timings):
+        line = f"{cutoff:>6} {timings[cutoff]:>11.6f}s"
+        if baseline and cutoff != 1:
+            line += f"  {baseline / timings[cutoff]:.2f}x vs no cutoff"
+        if cutoff == best:
+            line += "  <- best"
+        lines.append(line)
+
+    lines.append("")
+    lines.append(f"Cutoffs in {path}:")
+    current = machine_key()
+    for key, entry in sorted(load_config(path)["machines"].items()):
+        marker = "*" if key == current else " "
+        lines.append(f" {marker} {entry.get('cutoff', '?'):>3}  {key}  ({entry.get('calibrated', 'unknown date')})")
+    return lines
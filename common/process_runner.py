@@ -0,0 +1,151 @@
+"""
+Process-isolated sort execution.
+
+A pure-Python sort holds the GIL for its whole run, which starves the Tk
+main loop even when the sort runs on a thread. ProcessSort runs the
+algorithm in a child process instead: the input is passed through shared
+memory, progress and the result stream back over a pipe, and the child can
+be killed at any time.
+"""
+import importlib
+import multiprocessing
+import time
+from array import array
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional
+
+# Minimum seconds between progress messages from the child
+PROGRESS_INTERVAL = 0.05
+
+
+class SortKilled(Exception):
+    """Raised when the child process was killed before finishing"""
+
+
+def _child_main(conn, module_name: str, func_name: str, shm_name: Optional[str], n: int, payload, kwargs: Dict):
+    """Entry point of the sorting process"""
+    shm = None
+    try:
+        sort_func = getattr(importlib.import_module(module_name), func_name)
+
+        if shm_name is not None:
+            # Spawned children share the parent's resource tracker, which unlinks on exit
+            shm = shared_memory.SharedMemory(name=shm_name)
+            values = shm.buf.cast('q')
+            data = values[:n].tolist()
+        else:
+            data = payload
+
+        last_report = [0.0]
+
+        def report(done, total):
+            now = time.perf_counter()
+            if now - last_report[0] >= PROGRESS_INTERVAL:
+                last_report[0] = now
+                conn.send(("progress", done / total if total else 1.0))
+
+        start_time = time.perf_counter()
+        result = sort_func(data, progress=report, **kwargs)
+        elapsed_time = time.perf_counter() - start_time
+
+        # Variants returning (sorted_array, extra...) keep the extras
+        if isinstance(result, tuple):
+            sorted_data, extra = result[0], result[1:]
+        else:
+            sorted_data, extra = result, ()
+
+        if shm is not None:
+            values[:n] = array('q', sorted_data)
+            values.release()
+            conn.send(("done", elapsed_time, extra, None))
+        else:
+            conn.send(("done", elapsed_time, extra, sorted_data))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        if shm is not None:
+            shm.close()
+        conn.close()
+
+
+class ProcessSort:
+    """Run module_name.func_name(data, **kwargs) in a child process"""
+
+    def __init__(self, module_name: str, func_name: str, data: List[int],
+                 on_progress: Optional[Callable[[float], None]] = None, kwargs: Optional[Dict] = None):
+        self.module_name = module_name
+        self.func_name = func_name
+        self.data = data
+        self.kwargs = kwargs or {}
+        self.on_progress = on_progress
+        self.process = None
+        self.killed = False
+
+    def run(self):
+        """
+        Block until the child finishes (call from a worker thread).
+        Returns: (sorted_array, elapsed_seconds, extra_results)
+        """
+        n = len(self.data)
+        shm = None
+        payload = None
+        try:
+            values = array('q', self.data)
+        except OverflowError:
+            # Values beyond 64 bits travel through the pipe instead
+            payload = list(self.data)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(n, 1) * values.itemsize)
+            shm.buf[:n * values.itemsize] = values.tobytes()
+
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_child_main,
+            args=(child_conn, self.module_name, self.func_name, shm.name if shm else None, n, payload, self.kwargs),
+            daemon=True
+        )
+
+        try:
+            self.process.start()
+            child_conn.close()
+
+            while True:
+                if self.killed:
+                    raise SortKilled()
+                if not parent_conn.poll(0.1):
+                    if not self.process.is_alive() and not parent_conn.poll():
+                        raise SortKilled() if self.killed else RuntimeError("Sort process exited unexpectedly")
+                    continue
+                try:
+                    message = parent_conn.recv()
+                except EOFError:
+                    raise SortKilled() if self.killed else RuntimeError("Sort process exited unexpectedly")
+
+                if message[0] == "progress":
+                    if self.on_progress is not None:
+                        self.on_progress(message[1])
+                elif message[0] == "error":
+                    raise RuntimeError(message[1])
+                else:
+                    _, elapsed_time, extra, sorted_data = message
+                    if sorted_data is None:
+                        view = shm.buf.cast('q')
+                        sorted_data = view[:n].tolist()
+                        view.release()
+                    return sorted_data, elapsed_time, extra
+        finally:
+            parent_conn.close()
+            if self.process.pid is not None:
+                if self.process.is_alive():
+                    self.process.terminate()
+                self.process.join()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def kill(self):
+        """Terminate the child; run() raises SortKilled"""
+        self.killed = True
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
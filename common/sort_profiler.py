@@ -0,0 +1,190 @@
+"""
+Profiling hooks for sorting runs.
+
+Two modes are available:
+- "cprofile": deterministic profiling with cProfile, dumped to a .pstats file
+- "sampling": a background thread samples the sorting thread's stack at a
+  fixed interval, which keeps the overhead low on very long runs
+
+measure_peak_memory traces a sort's allocations with tracemalloc.
+"""
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable, List, Tuple
+
+PROFILE_DIR = "profiles"
+PROFILE_MODES = ("cprofile", "sampling")
+# tracemalloc slows a sort down several times, so memory is measured on a prefix
+MEMORY_SAMPLE = 50000
+
+
+def profile_output_path(algorithm: str, dataset: str, n: int, mode: str = "cprofile") -> str:
+    """Build a file name that is unique per algorithm, dataset and size"""
+    def slug(text):
+        return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_").lower() or "data"
+
+    dataset = os.path.splitext(os.path.basename(dataset or "data"))[0]
+    extension = ".pstats" if mode == "cprofile" else ".samples.txt"
+    return os.path.join(PROFILE_DIR, f"{slug(algorithm)}_{slug(dataset)}_{n}{extension}")
+
+
+def _label(filename: str, lineno: int, func: str) -> str:
+    return f"{func} ({os.path.basename(filename)}:{lineno})"
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling one thread's stack from a helper thread"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = 0
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self._target = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling the calling thread"""
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None or self._stop.is_set():
+                # The target has already left the profiled call
+                continue
+
+            self.samples += 1
+            code = frame.f_code
+            self.self_counts[(code.co_filename, code.co_firstlineno, code.co_name)] += 1
+
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if key not in seen:
+                    seen.add(key)
+                    self.total_counts[key] += 1
+                frame = frame.f_back
+
+    def top(self, limit: int = 10) -> List[Tuple[str, float, float]]:
+        """Hottest functions as (label, self share, total share)"""
+        if not self.samples:
+            return []
+        return [
+            (_label(*key), count / self.samples, self.total_counts[key] / self.samples)
+            for key, count in self.self_counts.most_common(limit)
+        ]
+
+    def dump(self, path: str, limit: int = 50):
+        with open(path, "w") as file:
+            file.write(f"{self.samples} samples every {self.interval * 1000:.1f} ms\n")
+            file.write(f"{'self':>7} {'total':>7}  function\n")
+            for label, self_share, total_share in self.top(limit):
+                file.write(f"{self_share:>7.1%} {total_share:>7.1%}  {label}\n")
+
+
+def top_functions(profiler: cProfile.Profile, limit: int = 10) -> List[Tuple[str, int, float, float]]:
+    """Hottest functions of a cProfile run as (label, calls, own time, cumulative time)"""
+    stats = pstats.Stats(profiler)
+    rows = [
+        (_label(*key), nc, tt, ct)
+        for key, (cc, nc, tt, ct, callers) in stats.stats.items()
+        if "_lsprof.Profiler" not in key[2]
+    ]
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:limit]
+
+
+def run_profiled(sort_func: Callable, data, mode: str, output_path: str, limit: int = 8):
+    """
+    Run sort_func(data) under the requested profiler.
+    Returns: (sort_result, elapsed_seconds, report_lines)
+    """
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    if mode == "sampling":
+        sampler = SamplingProfiler()
+        sampler.start()
+        start_time = time.perf_counter()
+        try:
+            result = sort_func(data)
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            sampler.stop()
+
+        sampler.dump(output_path)
+        lines = [f"Sampling profile ({sampler.samples} samples) -> {output_path}"]
+        lines += [
+            f"  {self_share:6.1%} self {total_share:6.1%} total  {label}"
+            for label, self_share, total_share in sampler.top(limit)
+        ]
+        return result, elapsed_time, lines
+
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    profiler.enable()
+    try:
+        result = sort_func(data)
+    finally:
+        profiler.disable()
+        elapsed_time = time.perf_counter() - start_time
+
+    profiler.dump_stats(output_path)
+    lines = [f"cProfile -> {output_path}"]
+    lines += [
+        f"  {tt:.4f}s own {ct:.4f}s cum {nc:>9,} calls  {label}"
+        for label, nc, tt, ct in top_functions(profiler, limit)
+    ]
+    return result, elapsed_time, lines
+
+
+def measure_peak_memory(sort_func: Callable, data, in_place: bool = False) -> Tuple[int, int]:
+    """
+    Run sort_func(data) under tracemalloc. With in_place, sort_func sorts
+    the list it is given and returns nothing.
+    Returns: (peak_bytes, auxiliary_bytes), where the auxiliary part is the
+    peak minus the returned list itself (all of it for in-place sorts)
+    """
+    # Materialize views (e.g. a memoryview window) first, so building int
+    # objects from them is not counted against the sort
+    data = list(data)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = sort_func(data)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    if in_place:
+        return peak, peak
+    return peak, max(peak - sys.getsizeof(result), 0)
+
+
+def format_bytes(size: int) -> str:
+    """Human readable byte count (e.g. '1.5 MiB')"""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
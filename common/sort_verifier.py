@@ -0,0 +1,125 @@
+"""
+Linear-time check that a sort's output is correct, without re-sorting.
+
+Output is correct when it is in descending order and is a permutation of
+the input. Order is checked with one pairwise pass. The permutation check
+compares multiset fingerprints: the item count plus the sum, mod 2^64, of
+a hash of every item. The hash multiplies by a 64-bit odd constant and
+folds the high bits back in with an xor-shift. A plain sum of values (or
+any hash that is linear in the value, like Python's own int hash) lets
+offsetting changes such as [1, 4] -> [2, 3] through; the xor breaks that.
+Sums do not depend on order, so the input is fingerprinted once and every
+output is compared with it.
+
+Both passes run on independent chunks whose results combine by addition,
+plus a check at each chunk boundary. For arrays of PARALLEL_THRESHOLD
+items or more on a multi-core machine, the chunks go to a process pool as
+compact int64 arrays.
+"""
+import multiprocessing
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from operator import and_, ge, mul, rshift, xor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PARALLEL_THRESHOLD = 1 << 21
+CHUNK_ITEMS = 1 << 18
+MASK = (1 << 64) - 1
+_MULTIPLIER = 0x9E3779B97F4A7C15  # 2^64 / golden ratio, odd
+
+_pool = None
+
+
+def _scan(chunk: Sequence[int], check_order: bool) -> Tuple[int, int, bool]:
+    """(count, hash sum, descending) of one chunk"""
+    descending = not check_order or all(map(ge, chunk, islice(chunk, 1, None)))
+    mixed = list(map(and_, map(mul, chunk, repeat(_MULTIPLIER)), repeat(MASK)))
+    total = sum(map(xor, mixed, map(rshift, mixed, repeat(29))))
+    return len(chunk), total & MASK, descending
+
+
+def _scan_job(job: Tuple[array, bool]) -> Tuple[int, int, bool]:
+    return _scan(*job)
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Spawned workers are safe to start from the GUI's worker threads
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _chunks(data: Sequence[int]) -> List[Tuple[int, int]]:
+    """(start, end) bounds of consecutive CHUNK_ITEMS-sized chunks"""
+    return [(start, min(start + CHUNK_ITEMS, len(data))) for start in range(0, len(data), CHUNK_ITEMS)]
+
+
+def _scan_all(data: Sequence[int], check_order: bool, parallel: Optional[bool] = None) -> Tuple[int, int, bool]:
+    n = len(data)
+    if parallel is None:
+        parallel = n >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
+    if not parallel:
+        return _scan(data, check_order)
+
+    try:
+        jobs = [(array('q', data[start:end]), check_order) for start, end in _chunks(data)]
+    except OverflowError:
+        # Beyond 64 bits the compact chunks are impossible; scan in-process instead
+        return _scan(data, check_order)
+    count = total = 0
+    descending = True
+    for chunk_count, chunk_sum, chunk_descending in _executor().map(_scan_job, jobs):
+        count += chunk_count
+        total += chunk_sum
+        descending = descending and chunk_descending
+    if check_order:
+        # Chunks were checked separately, so also check across each boundary
+        descending = descending and all(data[end - 1] >= data[end] for _, end in _chunks(data)[:-1])
+    return count, total & MASK, descending
+
+
+def fingerprint(data: Sequence[int], parallel: Optional[bool] = None) -> Tuple[int, int]:
+    """Order-independent multiset fingerprint: (count, sum of item hashes mod 2^64)"""
+    count, total, _ = _scan_all(data, False, parallel)
+    return count, total
+
+
+def first_ascent(data: Sequence[int]) -> Optional[int]:
+    """Index of the first item that is larger than the one before it"""
+    for i in range(1, len(data)):
+        if data[i - 1] < data[i]:
+            return i
+    return None
+
+
+def verify(output: Sequence[int], expected: Tuple[int, int], parallel: Optional[bool] = None) -> Dict:
+    """
+    Check output against the input's fingerprint(). Returns {"ok",
+    "descending", "permutation", "first_ascent", "seconds"}.
+    """
+    start_time = time.perf_counter()
+    count, total, descending = _scan_all(output, True, parallel)
+    return {
+        "ok": descending and (count, total) == tuple(expected),
+        "descending": descending,
+        "permutation": (count, total) == tuple(expected),
+        "first_ascent": None if descending else first_ascent(output),
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+def describe(result: Dict) -> str:
+    """One-line summary of a verify() result"""
+    cost = f"{result['seconds'] * 1000:.1f}ms"
+    if result["ok"]:
+        return f"Verified: descending and a permutation of the input ({cost})"
+    problems = []
+    if not result["descending"]:
+        problems.append(f"not descending at index {result['first_ascent']:,}")
+    if not result["permutation"]:
+        problems.append("not a permutation of the input")
+    return f"VERIFICATION FAILED: {', '.join(problems)} ({cost})"
@@ -0,0 +1,241 @@
+"""
+Live sort visualiser.
+
+The real sort implementations run unchanged; they only take a step
+callback that, once per outer iteration, hands over the working list and
+the range that iteration worked on (see sort_algorithms/bubble_algorithms).
+SortState.step adopts that live working list itself, so watching barely
+slows the sort down. The window samples that list at a capped frame rate: each
+frame takes one strided slice (one value per pixel column, so 100k items
+cost the same as a few hundred) and redraws only the columns that changed
+since the previous frame, in the swap colour. The algorithm never waits for
+the UI.
+"""
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List
+
+DEFAULT_FPS = 30
+
+
+class SortStopped(Exception):
+    """Raised from SortState.step to end a sort the user stopped"""
+
+
+class SortState:
+    """Mirror of the working array plus the range of the latest step"""
+
+    def __init__(self, data: List[int]):
+        self.arr = list(data)
+        self.steps = 0
+        self.active = None  # (lo, hi) range the latest step worked on
+        self.elapsed = 0.0
+        self.done = False
+        self.stop = False
+
+    def step(self, values: List[int], lo: int, hi: int):
+        """step callback for the sorts: values is the live working list, so nothing is copied"""
+        if self.stop:
+            raise SortStopped()
+        self.arr = values
+        self.steps += 1
+        self.active = (lo, hi)
+
+
+class SortVisualizer(tk.Toplevel):
+    def __init__(self, parent, colors, data: List[int], algorithms: Dict[str, Callable], fps: int = DEFAULT_FPS):
+        """algorithms maps a label to a sort function that accepts step="""
+        super().__init__(parent, bg=colors['bg'])
+        self.title("Sort Visualizer")
+        self.geometry("900x480")
+        self.colors = colors
+        self.data = data
+        self.algorithms = algorithms
+        self.state = None
+        self.started = 0.0
+        self.after_id = None
+        self.layout = None
+        self.items = []
+        self.previous = []
+        self.highlighted = set()
+        self.vmin = min(data)
+        self.span = (max(data) - self.vmin) or 1
+
+        # Controls
+        controls = tk.Frame(self, bg=colors['surface'])
+        controls.pack(fill=tk.X)
+
+        self.algorithm_var = tk.StringVar(value=next(iter(algorithms)))
+        ttk.Combobox(
+            controls,
+            textvariable=self.algorithm_var,
+            values=list(algorithms),
+            state="readonly",
+            font=("Segoe UI", 10),
+            width=24
+        ).pack(side=tk.LEFT, padx=(15, 10), pady=10)
+
+        tk.Label(
+            controls,
+            text="Max FPS",
+            font=("Segoe UI", 9),
+            bg=colors['surface'],
+            fg=colors['text_dim']
+        ).pack(side=tk.LEFT)
+        self.fps_var = tk.StringVar(value=str(fps))
+        tk.Entry(
+            controls,
+            textvariable=self.fps_var,
+            font=("Segoe UI", 9),
+            width=5,
+            bg=colors['surface_light'],
+            fg=colors['text'],
+            insertbackground=colors['text'],
+            relief=tk.FLAT
+        ).pack(side=tk.LEFT, padx=(6, 10))
+
+        tk.Button(
+            controls,
+            text="▶  Start",
+            command=self.start,
+            font=("Segoe UI", 9),
+            bg=colors['primary'],
+            fg=colors['text'],
+            activebackground=colors['primary_hover'],
+            activeforeground=colors['text'],
+            relief=tk.FLAT,
+            bd=0,
+            padx=14,
+            pady=4,
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+
+        self.status_label = tk.Label(
+            controls,
+            text=f"{len(data):,} numbers - press Start",
+            font=("Segoe UI", 9),
+            bg=colors['surface'],
+            fg=colors['text_dim'],
+            anchor=tk.W
+        )
+        self.status_label.pack(side=tk.LEFT, padx=15, fill=tk.X, expand=True)
+
+        self.canvas = tk.Canvas(self, bg=colors['surface'], highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+    def start(self):
+        """(Re)start the selected algorithm on a fresh copy of the data"""
+        try:
+            fps = max(int(self.fps_var.get()), 1)
+        except ValueError:
+            fps = DEFAULT_FPS
+        self.interval = max(1000 // fps, 1)
+
+        self.stop()
+        self.state = SortState(self.data)
+        self.layout = None
+        self.started = time.perf_counter()
+        threading.Thread(
+            target=self._run, args=(self.algorithms[self.algorithm_var.get()], self.state), daemon=True
+        ).start()
+        self._frame()
+
+    def _run(self, sort_func, state: SortState):
+        start_time = time.perf_counter()
+        try:
+            sort_func(state.arr, step=state.step)
+        except SortStopped:
+            pass
+        state.elapsed = time.perf_counter() - start_time
+        state.done = True
+
+    def stop(self):
+        if self.state is not None:
+            self.state.stop = True
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+
+    def close(self):
+        self.stop()
+        self.destroy()
+
+    def _frame(self):
+        self.after_id = None
+        state = self.state
+        self.render(state)
+
+        if state.done:
+            outcome = "stopped" if state.stop else "done"
+            self.status_label.config(
+                text=f"{outcome} - {state.steps:,} steps in {state.elapsed:.3f}s"
+            )
+            return
+
+        self.status_label.config(
+            text=f"Step {state.steps:,} - {time.perf_counter() - self.started:.1f}s"
+        )
+        self.after_id = self.after(self.interval, self._frame)
+
+    def render(self, state: SortState):
+        """Draw one frame from a strided snapshot of the working array"""
+        canvas = self.canvas
+        width = max(canvas.winfo_width(), 2)
+        height = max(canvas.winfo_height(), 2)
+        n = len(state.arr)
+        if n == 0:
+            return
+
+        # One value per pixel column at most
+        step = -(-n // min(n, width))
+        snapshot = state.arr[::step]
+        columns = len(snapshot)
+        bar_width = width / columns
+
+        if self.layout != (columns, width, height):
+            self.layout = (columns, width, height)
+            canvas.delete("all")
+            self.items = [
+                canvas.create_line(
+                    (c + 0.5) * bar_width, height, (c + 0.5) * bar_width, height,
+                    width=max(bar_width - 1, 1), fill=self.colors['primary']
+                )
+                for c in range(columns)
+            ]
+            self.previous = [None] * columns
+            self.highlighted = set()
+            self.boundary_item = canvas.create_line(0, 0, 0, height, fill=self.colors['warning'], dash=(4, 2))
+            self.active_item = canvas.create_line(0, height - 2, 0, height - 2, fill=self.colors['success'], width=3)
+
+        # Redraw only the bars whose value changed; those are the swaps
+        scale = (height - 4) / self.span
+        changed = set()
+        for c, value in enumerate(snapshot):
+            if value != self.previous[c]:
+                self.previous[c] = value
+                x = (c + 0.5) * bar_width
+                canvas.coords(self.items[c], x, height, x, height - 2 - (value - self.vmin) * scale)
+                changed.add(c)
+
+        if not state.done:
+            for c in changed - self.highlighted:
+                canvas.itemconfig(self.items[c], fill=self.colors['accent'])
+        else:
+            changed = set()
+        for c in self.highlighted - changed:
+            canvas.itemconfig(self.items[c], fill=self.colors['primary'])
+        self.highlighted = changed
+
+        # The range of the latest step (bubble pass, sorted prefix, merge) and its end
+        if state.active is not None and not state.done:
+            lo, hi = state.active
+            x = hi / step * bar_width
+            canvas.coords(self.boundary_item, x, 0, x, height)
+            canvas.coords(self.active_item, lo / step * bar_width, height - 2, x, height - 2)
+        else:
+            canvas.coords(self.boundary_item, -10, 0, -10, height)
+            canvas.coords(self.active_item, -10, height - 2, -10, height - 2)
@@ -0,0 +1,148 @@
+"""
+Sorting networks for 2 to 16 items.
+
+A network is a fixed list of compare-exchange steps (i, j) with i < j that
+leave the larger value at i, so the output is in DESCENDING order. Sizes
+2-13 use the smallest known networks (35, 39 and 45 comparators for
+11-13). Sizes 14 and 15 are the 60-comparator 16-input network with its
+last wires removed, which also matches the smallest known (51 and 56).
+
+Each network is compiled to straight-line code at import: the items are
+loaded into locals, compare-exchanged with no loop or index arithmetic,
+and stored back. That is much cheaper in Python than insertion sort's
+branchy inner loop, so merge sort and introsort use them as their base
+case. verify() checks a network with the 0-1 principle.
+"""
+import random
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+MAX_SIZE = 16
+
+Network = Tuple[Tuple[int, int], ...]
+
+_NETWORK_16 = (
+    (0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10),
+    (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12),
+    (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15),
+    (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15),
+    (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14),
+    (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14),
+    (2, 4), (3, 6), (9, 12), (11, 13),
+    (3, 5), (6, 8), (7, 9), (10, 12),
+    (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+    (6, 7), (8, 9),
+)
+
+# Size -> compare-exchange steps
+NETWORKS: Dict[int, Network] = {
+    2: ((0, 1),),
+    3: ((0, 2), (0, 1), (1, 2)),
+    4: ((0, 2), (1, 3), (0, 1), (2, 3), (1, 2)),
+    5: ((0, 3), (1, 4), (0, 2), (1, 3), (0, 1), (2, 4), (1, 2), (3, 4), (2, 3)),
+    6: ((0, 5), (1, 3), (2, 4), (1, 2), (3, 4), (0, 3), (2, 5), (0, 1), (2, 3), (4, 5), (1, 2), (3, 4)),
+    7: ((0, 6), (2, 3), (4, 5), (0, 2), (1, 4), (3, 6), (0, 1), (2, 5), (3, 4), (1, 2), (4, 6), (2, 3),
+        (4, 5), (1, 2), (3, 4), (5, 6)),
+    8: ((0, 2), (1, 3), (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7), (0, 1), (2, 3), (4, 5), (6, 7),
+        (2, 4), (3, 5), (1, 4), (3, 6), (1, 2), (3, 4), (5, 6)),
+    9: ((0, 3), (1, 7), (2, 5), (4, 8), (0, 7), (2, 4), (3, 8), (5, 6), (0, 2), (1, 3), (4, 5), (7, 8),
+        (1, 4), (3, 6), (5, 7), (0, 1), (2, 4), (3, 5), (6, 8), (2, 3), (4, 5), (6, 7), (1, 2), (3, 4),
+        (5, 6)),
+    10: ((4, 9), (3, 8), (2, 7), (1, 6), (0, 5), (1, 4), (6, 9), (0, 3), (5, 8), (0, 2), (3, 6), (7, 9),
+         (0, 1), (2, 4), (5, 7), (8, 9), (1, 2), (4, 6), (7, 8), (3, 5), (2, 5), (6, 8), (1, 3), (4, 7),
+         (2, 3), (6, 7), (3, 4), (5, 6), (4, 5)),
+    11: ((0, 9), (1, 6), (2, 4), (3, 7), (5, 8), (0, 1), (3, 5), (4, 10), (6, 9), (7, 8), (1, 3), (2, 5),
+         (4, 7), (8, 10), (0, 4), (1, 2), (3, 7), (5, 9), (6, 8), (0, 1), (2, 6), (4, 5), (7, 8), (9, 10),
+         (2, 4), (3, 6), (5, 7), (8, 9), (1, 2), (3, 4), (5, 6), (7, 8), (2, 3), (4, 5), (6, 7)),
+    12: ((0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9), (0, 1), (2, 5), (3, 4), (6, 9), (7, 8), (10, 11),
+         (0, 2), (1, 6), (5, 10), (9, 11), (0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10), (1, 4), (3, 5),
+         (6, 8), (7, 10), (1, 3), (2, 5), (6, 9), (8, 10), (2, 3), (4, 5), (6, 7), (8, 9), (4, 6), (5, 7),
+         (3, 4), (5, 6), (7, 8)),
+    13: ((0, 12), (1, 10), (2, 9), (3, 7), (5, 11), (6, 8), (1, 6), (2, 3), (4, 11), (7, 9), (8, 10),
+         (0, 4), (1, 2), (3, 6), (7, 8), (9, 10), (11, 12), (4, 6), (5, 9), (8, 11), (10, 12), (0, 5),
+         (3, 8), (4, 7), (6, 11), (9, 10), (0, 1), (2, 5), (6, 9), (7, 8), (10, 11), (1, 3), (2, 4), (5, 6),
+         (9, 10), (1, 2), (3, 4), (5, 7), (6, 8), (2, 3), (4, 5), (6, 7), (8, 9), (3, 4), (5, 6)),
+    16: _NETWORK_16,
+}
+
+# The smallest item of a descending network never leaves the last wire, so
+# dropping that wire's comparators leaves a valid network one size down
+for _size in range(15, 13, -1):
+    NETWORKS[_size] = tuple((i, j) for i, j in NETWORKS[_size + 1] if j < _size)
+
+
+def verify(network: Sequence[Tuple[int, int]], n: int) -> bool:
+    """
+    0-1 principle: a network sorts every input iff it sorts all 2^n inputs
+    of zeros and ones. All of them are checked at once by giving each wire
+    an integer whose bit x is that wire's value in input x; a
+    compare-exchange is then an OR (larger) and an AND (smaller).
+    """
+    count = 1 << n
+    wires = []
+    for k in range(n):
+        # Bit x is set when bit k of x is set: runs of 2^k ones and zeros
+        block = ((1 << (1 << k)) - 1) << (1 << k)
+        wire = 0
+        for start in range(0, count, 1 << (k + 1)):
+            wire |= block << start
+        wires.append(wire)
+
+    for i, j in network:
+        wires[i], wires[j] = wires[i] | wires[j], wires[i] & wires[j]
+
+    # Descending: wherever a wire holds 1, the wire before it must too
+    return all(wires[k + 1] & ~wires[k] == 0 for k in range(n - 1))
+
+
+def _compile(n: int, network: Network) -> Callable[[List[int], int], None]:
+    names = ", ".join(f"x{k}" for k in range(n))
+    lines = [f"def sort{n}(arr, lo):", f"    {names} = arr[lo:lo + {n}]"]
+    lines += [f"    if x{i} < x{j}: x{i}, x{j} = x{j}, x{i}" for i, j in network]
+    lines.append(f"    arr[lo:lo + {n}] = {names}")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"sort{n}"]
+
+
+_SORTERS = {n: _compile(n, network) for n, network in NETWORKS.items()}
+
+
+def sort_range(arr: List[int], lo: int, hi: int):
+    """Sort arr[lo:hi] in place, descending (at most MAX_SIZE items)"""
+    n = hi - lo
+    if n > 1:
+        _SORTERS[n](arr, lo)
+
+
+def network_sort(arr: Sequence[int]) -> List[int]:
+    """Fast path for tiny inputs: a sorted (descending) copy of at most MAX_SIZE items"""
+    if len(arr) > MAX_SIZE:
+        raise ValueError(f"sorting networks cover at most {MAX_SIZE} items, got {len(arr)}")
+    arr = list(arr)
+    sort_range(arr, 0, len(arr))
+    return arr
+
+
+def benchmark(insertion_sort: Callable[[List[int]], List[int]], sizes=range(2, MAX_SIZE + 1),
+              batches: int = 2000, repeat: int = 5, seed: int = 0) -> List[Tuple[int, int, float, float]]:
+    """
+    Time the network against insertion_sort on batches of random inputs.
+    Returns (size, comparators, network_seconds, insertion_seconds) per size,
+    each the best of repeat runs over the whole batch.
+    """
+    rng = random.Random(seed)
+    results = []
+    for n in sizes:
+        inputs = [[rng.randint(-10 ** 6, 10 ** 6) for _ in range(n)] for _ in range(batches)]
+        best = {}
+        for name, sort_func in (("network", network_sort), ("insertion", insertion_sort)):
+            times = []
+            for _ in range(repeat):
+                start_time = time.perf_counter()
+                for data in inputs:
+                    sort_func(data)
+                times.append(time.perf_counter() - start_time)
+            best[name] = min(times)
+        results.append((n, len(NETWORKS[n]), best["network"], best["insertion"]))
+    return results
@@ -0,0 +1,60 @@
+"""
+Thread-safe, batched UI update pipeline.
+
+Tk widgets may only be touched from the main thread. Worker threads post
+updates to a queue instead, and the Tk main loop drains it with root.after
+at a fixed frame rate. Consecutive text appends to the same widget are
+coalesced into a single insert, so heavy output costs one widget update
+per frame rather than one per line.
+"""
+import queue
+import tkinter as tk
+import traceback
+
+
+class UIUpdateQueue:
+    def __init__(self, root, fps: int = 30):
+        self.root = root
+        self.interval = max(int(1000 / fps), 1)
+        self._queue = queue.SimpleQueue()
+        self.root.after(self.interval, self._drain)
+
+    def append(self, widget, text: str, tag=None):
+        """Append text to a read-only Text widget"""
+        self._queue.put(("append", widget, text, tag))
+
+    def call(self, func, *args, **kwargs):
+        """Run func(*args, **kwargs) on the Tk main thread"""
+        self._queue.put(("call", func, args, kwargs))
+
+    def _drain(self):
+        pending = []
+        try:
+            while True:
+                pending.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        i = 0
+        while i < len(pending):
+            kind, target = pending[i][0], pending[i][1]
+            try:
+                if kind == "append":
+                    # Merge the run of appends to this widget into one insert
+                    chunks = []
+                    while i < len(pending) and pending[i][0] == "append" and pending[i][1] is target:
+                        _, _, text, tag = pending[i]
+                        chunks.extend((text, tag or ()))
+                        i += 1
+                    target.config(state=tk.NORMAL)
+                    target.insert(tk.END, *chunks)
+                    target.see(tk.END)
+                    target.config(state=tk.DISABLED)
+                else:
+                    _, func, args, kwargs = pending[i]
+                    i += 1
+                    func(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+
+        self.root.after(self.interval, self._drain)
@@ -0,0 +1,141 @@
+"""
+Shared fixtures for the sorting test suite.
+
+Every implementation in the repository is loaded by file path, since the
+scripts live in separate folders and some have hyphenated names. The GUI
+classes are instantiated without running __init__, so no display is needed.
+"""
+import importlib.util
+import os
+import random
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The shared helpers are imported as the common package, as the apps do
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def load_script(relative_path: str):
+    """Import a repository script (e.g. 'LabWork2/sort-algo.py') as a module"""
+    path = os.path.join(REPO_ROOT, relative_path)
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+    module_name = "sda_" + relative_path.replace("/", "_").replace("-", "_")[:-3].lower()
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def bare_instance(cls):
+    """Instance of a GUI/analyzer class with no widgets (skips __init__)"""
+    return cls.__new__(cls)
+
+
+class RecordingUI:
+    """Stands in for a bare GUI's UIUpdateQueue: drops widget calls and keeps the appended text"""
+
+    def __init__(self):
+        self.lines = []
+
+    def call(self, func, *args, **kwargs):
+        pass
+
+    def append(self, widget, text, tag=None):
+        assert tag is None or tag, "empty tags are passed as None"
+        self.lines.append(text)
+
+    def text(self) -> str:
+        return "".join(self.lines)
+
+
+def _discard_passes(sort_func):
+    """Adapt a (sorted_array, passes, comparisons) sort to return only the array"""
+    def wrapper(arr):
+        return sort_func(arr)[0]
+    wrapper.__name__ = sort_func.__name__
+    return wrapper
+
+
+def _with_gaps(sort_func, gaps):
+    """Bind a Shell sort to one gap sequence"""
+    def wrapper(arr):
+        return sort_func(arr, gaps=gaps)
+    wrapper.__name__ = f"{sort_func.__name__}_{gaps}"
+    return wrapper
+
+
+def _with_cutoff(sort_func, cutoff):
+    """Bind a hybrid merge sort to one insertion cutoff"""
+    def wrapper(arr):
+        return sort_func(arr, cutoff=cutoff)
+    wrapper.__name__ = f"{sort_func.__name__}_cutoff_{cutoff}"
+    return wrapper
+
+
+def collect_implementations():
+    """(id, sort_func) for every sorting implementation in the repository"""
+    implementations = []
+
+    cli = bare_instance(load_script("Activities/sorting-cli.py").SortingAnalyzer)
+    activities_gui = bare_instance(load_script("Activities/sorting-gui.py").ModernSortingGUI)
+    lab1_gui = bare_instance(load_script("LabWork1/bubblesort.py").ModernSortingGUI)
+    lab2_gui = bare_instance(load_script("LabWork2/sort-algo.py").ModernSortingGUI)
+    sorting_algorithms = load_script("Activities/sorting_algorithms.py")
+    bubble_algorithms = load_script("LabWork1/bubble_algorithms.py")
+    sort_algorithms = load_script("LabWork2/sort_algorithms.py")
+
+    for owner, prefix in [(cli, "activities-cli"), (activities_gui, "activities-gui"), (lab2_gui, "lab2-gui")]:
+        for name in ("bubble_sort", "insertion_sort", "merge_sort", "shell_sort", "introsort", "heap_sort"):
+            implementations.append((f"{prefix}.{name}", getattr(owner, name)))
+
+    for name, sort_func in sorting_algorithms.ALGORITHMS.items():
+        implementations.append((f"activities.{name}", sort_func))
+    for name, sort_func in sort_algorithms.ALGORITHMS.items():
+        implementations.append((f"lab2.{name}", sort_func))
+    for prefix, module in [("activities", sorting_algorithms), ("lab2", sort_algorithms)]:
+        for gaps in module.GAP_SEQUENCES:
+            implementations.append((f"{prefix}.shell_sort[{gaps}]", _with_gaps(module.shell_sort, gaps)))
+        # Cutoff 1 is the plain merge sort that recurses down to single items
+        for cutoff in (1, 32):
+            implementations.append((f"{prefix}.merge_sort[cutoff={cutoff}]", _with_cutoff(module.merge_sort, cutoff)))
+
+    for name in ("classic_bubble_sort", "optimized_bubble_sort", "last_swap_bubble_sort", "cocktail_shaker_sort"):
+        implementations.append((f"lab1-gui.{name}", _discard_passes(getattr(lab1_gui, name))))
+    for name, sort_func in bubble_algorithms.ALGORITHMS.items():
+        implementations.append((f"lab1.{name}", _discard_passes(sort_func)))
+
+    return implementations
+
+
+IMPLEMENTATIONS = collect_implementations()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="run the benchmark tier (slow)")
+    parser.addoption("--benchmark-sizes", default="500,1000,2000",
+                     help="comma-separated input sizes for the benchmark tier")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark tier; run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def rng():
+    return random.Random(20240101)
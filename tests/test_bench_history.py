@@ -0,0 +1,91 @@
+"""Benchmark history: the JSON lines file, the regression test and the CLI around them."""
+import pytest
+
+from conftest import load_script
+
+
+def _record(bench_history, algorithm, times, data=(3, 2, 1)):
+    return bench_history.make_record(algorithm, list(data), times)
+
+
+def test_history_round_trip(tmp_path):
+    bench_history = load_script("Activities/bench_history.py")
+    path = str(tmp_path / "history.jsonl")
+    first = [_record(bench_history, "Merge Sort", [0.2, 0.1, 0.3])]
+    second = [_record(bench_history, "Merge Sort", [0.4]), _record(bench_history, "Heap Sort", [0.5])]
+
+    bench_history.append_records(path, first)
+    bench_history.append_records(path, second)
+    records = bench_history.load_records(path)
+    assert [r["algorithm"] for r in records] == ["Merge Sort", "Merge Sort", "Heap Sort"]
+    assert records[0]["median"] == 0.2 and records[0]["times"] == [0.2, 0.1, 0.3]
+    assert records[0]["fingerprint"] == bench_history.fingerprint([3, 2, 1]) != bench_history.fingerprint([1, 2, 3])
+    # The latest record of each algorithm and dataset wins
+    latest = bench_history.latest_by_key(records)
+    assert latest[("Merge Sort", 3, records[0]["fingerprint"])]["median"] == 0.4
+
+    with open(path, "a") as file:
+        file.write("{not json\n")
+    with pytest.raises(ValueError, match=":4:"):
+        bench_history.load_records(path)
+    with pytest.raises(FileNotFoundError):
+        bench_history.load_records(str(tmp_path / "missing.jsonl"))
+
+
+def test_compare_statuses():
+    bench_history = load_script("Activities/bench_history.py")
+    base = [
+        _record(bench_history, "Slower", [1.00, 1.01, 1.02, 1.03]),
+        _record(bench_history, "Faster", [1.00, 1.01, 1.02, 1.03]),
+        _record(bench_history, "Same", [1.00, 1.01, 1.02, 1.03]),
+        _record(bench_history, "Few", [1.00, 1.01, 1.02]),
+    ]
+    current = [
+        _record(bench_history, "Slower", [1.50, 1.51, 1.52, 1.53]),
+        _record(bench_history, "Faster", [0.50, 0.51, 0.52, 0.53]),
+        _record(bench_history, "Same", [1.005, 1.015, 1.025, 1.035]),
+        _record(bench_history, "Few", [2.00, 2.01, 2.02]),
+        _record(bench_history, "Added", [1.0]),
+    ]
+    results = {entry["algorithm"]: entry for entry in bench_history.compare(base, current)}
+    assert results["Slower"]["status"] == "REGRESSION" and results["Slower"]["p_value"] < 0.05
+    assert results["Faster"]["status"] == "faster"
+    assert results["Same"]["status"] == "ok"
+    assert results["Added"]["status"] == "new" and results["Added"]["baseline"] is None
+    # 3 against 3 can never reach p < 0.05, however large the slowdown
+    assert bench_history.smallest_p_value(3, 3) == 0.05
+    assert results["Few"]["status"] == "insufficient samples"
+
+    # 4 against 4 (smallest p 1/70) cannot reach a stricter alpha either
+    strict = {entry["algorithm"]: entry for entry in bench_history.compare(base, current, alpha=0.01)}
+    assert strict["Slower"]["status"] == "insufficient samples"
+
+
+def test_compare_exit_code(tmp_path, capsys):
+    cli = load_script("Activities/sorting-cli.py")
+    bench_history = cli.bench_history
+    baseline, history = str(tmp_path / "baseline.jsonl"), str(tmp_path / "history.jsonl")
+    bench_history.append_records(baseline, [_record(bench_history, "Merge Sort", [1.0, 1.01, 1.02, 1.03, 1.04])])
+
+    bench_history.append_records(history, [_record(bench_history, "Merge Sort", [1.0, 1.01, 1.02, 1.03, 1.04])])
+    assert cli.run_compare(cli.parse_args(["compare", baseline, "--history", history])) == 0
+
+    bench_history.append_records(history, [_record(bench_history, "Merge Sort", [2.0, 2.01, 2.02, 2.03, 2.04])])
+    assert cli.run_compare(cli.parse_args(["compare", baseline, "--history", history])) == 1
+    assert "1 significant regression(s) detected" in capsys.readouterr().out
+
+    missing = str(tmp_path / "missing.jsonl")
+    assert cli.run_compare(cli.parse_args(["compare", missing, "--history", history])) == 2
+
+
+def test_cli_history_options():
+    cli = load_script("Activities/sorting-cli.py")
+    # The interactive recorder and the subcommands' history files are separate options
+    args = cli.parse_args(["--record", "run_all.jsonl", "bench", "data.txt"])
+    assert args.record == "run_all.jsonl" and args.history == cli.bench_history.DEFAULT_HISTORY_FILE
+    assert cli.parse_args([]).record is None
+
+    for argv in (["bench", "data.txt", "--repeat", "0"], ["calibrate", "--repeat", "-1"]):
+        with pytest.raises(SystemExit):
+            cli.parse_args(argv)
+    assert cli.parse_args(["bench", "data.txt", "--repeat", "4"]).repeat == 4
@@ -0,0 +1,53 @@
+"""LabWork2 checkpointing: crash partway, resume from the file, same output."""
+import pytest
+
+from conftest import load_script
+
+@pytest.mark.parametrize("algorithm", ["bubble_sort", "insertion_sort", "merge_sort"])
+def test_checkpoint_resume(algorithm, tmp_path, rng, monkeypatch):
+    checkpoint = load_script("LabWork2/checkpoint.py")
+    path = str(tmp_path / "sort.ckpt")
+    data = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(3000)]
+
+    class Crash(Exception):
+        pass
+
+    saved = []
+    real_save = checkpoint.save
+
+    def crash_after_second(*args):
+        real_save(*args)
+        saved.append(args[3])
+        if len(saved) == 2:
+            raise Crash()
+
+    # Checkpoint at every safe point, then stop partway as if the machine went down
+    monkeypatch.setattr(checkpoint, "save", crash_after_second)
+    with pytest.raises(Crash):
+        checkpoint.run(algorithm, data, path, interval=0, cutoff=40)
+    monkeypatch.undo()
+    state = checkpoint.load(path)
+    assert state["algorithm"] == algorithm and state["position"] == saved[-1] > 0
+    assert state["cutoff"] == 40
+
+    _, result, elapsed_time, _ = checkpoint.resume(path, interval=None)
+    assert result == sorted(data, reverse=True)
+    assert elapsed_time >= state["elapsed"]
+    assert not (tmp_path / "sort.ckpt").exists()
+
+
+def test_checkpoint_skips_wide_numbers(tmp_path):
+    checkpoint = load_script("LabWork2/checkpoint.py")
+    path = str(tmp_path / "sort.ckpt")
+    data = [2 ** 70, 1, 3] * 300
+    assert not checkpoint.fits(data) and checkpoint.fits([2 ** 63 - 1, -2 ** 63])
+
+    # Sorted without checkpoints; an existing checkpoint is left alone
+    (tmp_path / "sort.ckpt").write_bytes(b"earlier")
+    result, _, saves = checkpoint.run("bubble_sort", data, path, interval=0)
+    assert result == sorted(data, reverse=True) and saves == 0
+    assert (tmp_path / "sort.ckpt").read_bytes() == b"earlier"
+
+    with pytest.raises(OverflowError):
+        checkpoint.save(path, "bubble_sort", data, 0, 0.0)
+    assert not (tmp_path / "sort.ckpt.part").exists()
@@ -0,0 +1,17 @@
+"""Dataset profiling: inversion counts, run statistics and the algorithm recommendation."""
+from common import data_profile
+
+def test_data_profile(rng):
+    data = [rng.randint(-50, 50) for _ in range(300)]
+    expected = sum(1 for i in range(300) for j in range(i + 1, 300) if data[i] < data[j])
+    assert data_profile.count_inversions(data) == expected
+    assert data_profile.analyze(data)["inversions"] == expected
+
+    stats = data_profile.analyze([9, 7, 7, 8, 1, 3])
+    assert (stats["runs"], stats["longest_run"], stats["distinct"]) == (3, 3, 5)
+
+    wide = [rng.randint(-2 ** 62, 2 ** 62) for _ in range(1000)]
+    assert data_profile.recommend(data_profile.analyze(wide))[0] == "introsort"
+    assert data_profile.recommend(data_profile.analyze([v >> 30 for v in wide]))[0] == "radix_sort"
+    assert data_profile.recommend(data_profile.analyze(data))[0] == "counting_sort"
+    assert data_profile.recommend(data_profile.analyze(sorted(wide, reverse=True)[:990] + wide[990:]))[0] == "natural_merge_sort"
@@ -0,0 +1,97 @@
+"""The virtualized data viewer: only the rows in view are formatted, scrolling stays in range."""
+from common import data_viewer
+from conftest import bare_instance
+
+
+class FakeText:
+    def __init__(self):
+        self.lines = []
+
+    def config(self, **options):
+        pass
+
+    def delete(self, first, last):
+        self.lines = []
+
+    def insert(self, index, text, tag=None):
+        if text.endswith("\n"):
+            self.lines[-1] += (text, tag)
+        else:
+            self.lines.append((text, tag))
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class FakeLabel:
+    def config(self, text):
+        self.text = text
+
+
+def _viewer(data, visible_rows=20):
+    view = bare_instance(data_viewer.VirtualDataView)
+    view.items_per_line = 10
+    view.visible_rows = visible_rows
+    view.text, view.scrollbar = FakeText(), FakeScrollbar()
+    view.title_label, view.subtitle_label = FakeLabel(), FakeLabel()
+    view.show(data, "Merge Sort", f"{len(data):,} numbers")
+    return view
+
+
+def test_renders_only_visible_rows():
+    data = range(1_000_003, 0, -1)
+    view = _viewer(data)
+    assert view.total_rows() == 100_001 and view.title_label.text == "Merge Sort"
+    assert len(view.text.lines) == 20
+    # Indices are padded to the widest one, values come ten to a line
+    assert view.text.lines[0] == ("        0  ", "index", ", ".join(map(str, range(1_000_003, 999_993, -1))) + "\n", None)
+    assert view.scrollbar.position == (0.0, 20 / 100_001)
+
+    # The last row holds the three leftover values
+    view.scroll_to_row(10 ** 9)
+    assert view.top_row == 100_001 - 20 and view.text.lines[-1][2] == "3, 2, 1\n"
+    assert view.scrollbar.position[1] == 1.0
+
+    view.clear()
+    assert view.text.lines == [] and view.scrollbar.position == (0.0, 1.0)
+
+
+def test_scrolling_stays_in_range():
+    view = _viewer(list(range(1000)))
+    assert view.scroll_rows(-3) == "break" and view.top_row == 0
+    view.scroll_rows(5)
+    assert view.top_row == 5
+
+    view.on_scrollbar("scroll", "1", "pages")
+    assert view.top_row == 25
+    view.on_scrollbar("scroll", "-2", "units")
+    assert view.top_row == 23
+    view.on_scrollbar("moveto", "0.5")
+    assert view.top_row == 50
+    view.on_scrollbar("moveto", "1.0")
+    assert view.top_row == 80
+
+    # Fewer rows than the window: nothing to scroll
+    small = _viewer(list(range(50)))
+    small.scroll_rows(10)
+    assert small.top_row == 0 and len(small.text.lines) == 5
+
+
+def test_jump_to_index_highlights_its_row():
+    view = _viewer(list(range(1000)))
+    view.jump_to_index(437)
+    assert view.highlight_index == 437 and view.top_row == 43
+    assert view.text.lines[0][3] == "highlight" and view.text.lines[1][3] is None
+
+    # Out of range indices clamp to the data; the last rows cannot scroll past the end
+    view.jump_to_index(10 ** 6)
+    assert view.highlight_index == 999 and view.top_row == 80
+    assert view.text.lines[-1][3] == "highlight"
+    view.jump_to_index(-5)
+    assert view.highlight_index == 0 and view.top_row == 0
+
+    empty = _viewer([])
+    empty.jump_to_index(3)
+    assert empty.highlight_index is None
@@ -0,0 +1,17 @@
+"""LabWork2 dataset buffer and the windows the size sweeps take from it."""
+import pytest
+
+from conftest import load_script
+
+@pytest.mark.parametrize("top", [5000, 2 ** 70])
+def test_dataset_stride_window_spans_file(top):
+    dataset_views = load_script("LabWork2/dataset_views.py")
+    # A value beyond 64 bits makes the buffer fall back to a plain list
+    numbers = list(range(4999)) + [top]
+    buffer = dataset_views.DatasetBuffer(numbers)
+    for size in (2, 7, 2500, 3000, 4999):
+        window = list(buffer.window(size, dataset_views.STRIDE_SAMPLE))
+        assert len(window) == len(set(window)) == size and window == sorted(window)
+        # Spread over the whole file, not a prefix, even for more than half of it
+        assert (window[0], window[-1]) == (0, top)
+    assert list(buffer.window(1, dataset_views.STRIDE_SAMPLE)) == [0]
@@ -0,0 +1,61 @@
+"""Headless "python -m LabWork1/LabWork2" entry points, run as the build servers run them."""
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+# Runs the package's __main__ with tkinter made unimportable, as on a display-less server
+HEADLESS = "import runpy, sys; sys.modules['tkinter'] = None; runpy.run_module(sys.argv.pop(1), run_name='__main__')"
+
+
+def _run(package, *args):
+    return subprocess.run([sys.executable, "-c", HEADLESS, package, *args], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=120)
+
+
+@pytest.fixture
+def dataset(tmp_path, rng):
+    path = tmp_path / "numbers.txt"
+    path.write_text("\n".join(str(rng.randint(-999, 999)) for _ in range(300)))
+    return str(path)
+
+
+@pytest.mark.parametrize("package, algorithms", [
+    ("LabWork1", ["classic_bubble_sort", "cocktail_shaker_sort"]),
+    ("LabWork2", ["merge_sort", "heap_sort"]),
+])
+def test_bench_prints_json(package, algorithms, dataset):
+    process = _run(package, "bench", "--dataset", dataset, "--sizes", "50,200",
+                   "--algorithms", *algorithms, "--repeat", "2")
+    assert process.returncode == 0, process.stderr
+    report = json.loads(process.stdout)
+    assert report["dataset"] == dataset and report["python"]
+    assert [(entry["algorithm"], entry["n"]) for entry in report["results"]] == [
+        (name, size) for size in (50, 200) for name in algorithms
+    ]
+    for entry in report["results"]:
+        assert len(entry["times"]) == 2 and min(entry["times"]) <= entry["time"] <= max(entry["times"])
+    if package == "LabWork1":
+        # Bubble sort counts come along with the timings
+        assert all(0 < entry["passes"] <= entry["max_passes"] == entry["n"] - 1 for entry in report["results"])
+
+
+@pytest.mark.parametrize("package", ["LabWork1", "LabWork2"])
+def test_bench_bad_dataset(package, tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("no numbers here")
+    for path in (str(empty), str(tmp_path / "missing.txt")):
+        process = _run(package, "bench", "--dataset", path)
+        assert process.returncode == 2 and process.stderr.startswith("Error: ") and process.stdout == ""
+
+
+def test_networks_table():
+    process = _run("LabWork2", "networks", "--batches", "20", "--repeat", "1")
+    assert process.returncode == 0, process.stderr
+    lines = process.stdout.splitlines()
+    assert "comparators" in lines[1]
+    # One row per network size, 2 to 16
+    assert [int(line.split()[0]) for line in lines[2:]] == list(range(2, 17))
@@ -0,0 +1,92 @@
+"""Background file work of the GUIs: chunked parsing and atomic, cancellable exports."""
+import threading
+
+import pytest
+
+from common import file_tasks
+
+
+def _part_files(folder):
+    return [path.name for path in folder.iterdir() if path.name.endswith(".part")]
+
+
+def test_write_numbers_file(tmp_path):
+    target = tmp_path / "sorted.txt"
+    calls = []
+    file_tasks.write_numbers_file(str(target), list(range(10, -11, -1)),
+                                  progress=lambda done, total: calls.append((done, total)), chunk_items=8)
+    assert target.read_text() == "".join(f"{n}\n" for n in range(10, -11, -1))
+    assert calls == [(8, 21), (16, 21), (21, 21)]
+    assert _part_files(tmp_path) == []
+
+
+def test_write_counts_file(tmp_path):
+    target = tmp_path / "counts.csv"
+    file_tasks.write_counts_file(str(target), [(9, 2), (-3, 1)])
+    assert target.read_text() == "9,2\n-3,1\n"
+
+
+def test_cancelled_write_removes_the_part_file(tmp_path):
+    target = tmp_path / "sorted.txt"
+    target.write_text("earlier export\n")
+    cancel = threading.Event()
+
+    def cancel_after_first_chunk(done, total):
+        # The temp file exists and holds the first chunk when the cancel arrives
+        assert _part_files(tmp_path) == [".sorted.txt.part"]
+        cancel.set()
+
+    with pytest.raises(file_tasks.TaskCancelled):
+        file_tasks.write_numbers_file(str(target), list(range(100)), progress=cancel_after_first_chunk,
+                                      cancel_event=cancel, chunk_items=10)
+    assert _part_files(tmp_path) == []
+    assert target.read_text() == "earlier export\n"
+
+
+def test_failed_write_keeps_the_target(tmp_path):
+    target = tmp_path / "sorted.txt"
+    target.write_text("earlier export\n")
+
+    def formatter(item):
+        if item == 50:
+            raise ValueError("bad item")
+        return str(item)
+
+    with pytest.raises(ValueError):
+        file_tasks.write_numbers_file(str(target), list(range(100)), chunk_items=10, formatter=formatter)
+    assert _part_files(tmp_path) == []
+    assert target.read_text() == "earlier export\n"
+
+
+def test_target_replaced_atomically(tmp_path, monkeypatch):
+    target = tmp_path / "sorted.txt"
+    target.write_text("earlier export\n")
+    replaced = []
+    real_replace = file_tasks.os.replace
+
+    def replace(source, destination):
+        # The target still holds the old export until the single rename
+        assert target.read_text() == "earlier export\n"
+        replaced.append((source, destination))
+        real_replace(source, destination)
+
+    monkeypatch.setattr(file_tasks.os, "replace", replace)
+    file_tasks.write_numbers_file(str(target), [3, 2, 1], chunk_items=1)
+    assert replaced == [(str(tmp_path / ".sorted.txt.part"), str(target))]
+    assert target.read_text() == "3\n2\n1\n"
+
+
+def test_parse_numbers_file_across_chunks(tmp_path):
+    source = tmp_path / "data.txt"
+    source.write_text("12345, -678 9\n1000000,x, 42 -7")
+    calls = []
+    # Tiny chunks split tokens across reads; they must come out whole
+    numbers = file_tasks.parse_numbers_file(str(source), progress=lambda done, total: calls.append((done, total)),
+                                            chunk_size=3)
+    assert numbers == [12345, -678, 9, 1000000, 42, -7]
+    assert calls[-1] == (source.stat().st_size, source.stat().st_size)
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(file_tasks.TaskCancelled):
+        file_tasks.parse_numbers_file(str(source), cancel_event=cancel)
@@ -0,0 +1,24 @@
+"""Activities k-way merge of sorted files."""
+import pytest
+
+from conftest import load_script
+
+def test_kway_merge_files(tmp_path, rng):
+    kway_merge = load_script("Activities/kway_merge.py")
+    inputs, everything = [], []
+    for k, size in enumerate((0, 1, 500, 3000)):
+        data = sorted((rng.randint(-99, 99) for _ in range(size)), reverse=True)
+        everything += data
+        path = tmp_path / f"part{k}.txt"
+        path.write_text("\n".join(map(str, data)))
+        inputs.append(str(path))
+    output = tmp_path / "merged.txt"
+
+    stats = kway_merge.merge_files(inputs, str(output), verify=True)
+    assert stats["count"] == len(everything)
+    assert list(map(int, output.read_text().split())) == sorted(everything, reverse=True)
+
+    (tmp_path / "bad.txt").write_text("5 4 6")
+    with pytest.raises(kway_merge.UnsortedInputError):
+        kway_merge.merge_files([inputs[2], str(tmp_path / "bad.txt")], str(tmp_path / "out.txt"), verify=True)
+    assert not (tmp_path / "out.txt.part").exists()
@@ -0,0 +1,71 @@
+"""Merge sort cutoff calibration and the per-machine config it is saved to."""
+import json
+import time
+from types import SimpleNamespace
+
+from common import merge_tuning
+from conftest import load_script
+
+
+def _fake_clock(monkeypatch):
+    """A clock the fake sort advances by hand; 12 is the fastest cutoff"""
+    clock = [0.0]
+    monkeypatch.setattr(merge_tuning, "time", SimpleNamespace(perf_counter=lambda: clock[0],
+                                                              strftime=time.strftime))
+    calls = []
+
+    def merge_sort(data, cutoff):
+        calls.append((len(data), cutoff))
+        clock[0] += abs(cutoff - 12) + 1.0
+
+    return merge_sort, calls
+
+
+def test_calibrate_interleaves_candidates(monkeypatch):
+    merge_sort, calls = _fake_clock(monkeypatch)
+    timings = merge_tuning.calibrate(merge_sort, size=300, candidates=(4, 12, 32), repeat=3)
+    assert timings == {4: 9.0, 12: 1.0, 32: 21.0}
+    # Each round times every candidate once, on the same data
+    assert calls == [(300, cutoff) for _ in range(3) for cutoff in (4, 12, 32)]
+
+
+def test_save_keeps_other_machines(tmp_path, monkeypatch):
+    path = str(tmp_path / merge_tuning.CONFIG_NAME)
+    assert merge_tuning.load_cutoff(path) == merge_tuning.DEFAULT_CUTOFF
+
+    with open(path, "w") as file:
+        json.dump({"machines": {"other host | other cpu | CPython 3.8.0": {"cutoff": 4}}}, file)
+    merge_sort, _ = _fake_clock(monkeypatch)
+    timings = merge_tuning.calibrate(merge_sort, size=10, candidates=(1, 12, 32), repeat=1)
+    entry = merge_tuning.save_calibration(path, timings, 10)
+    assert entry["cutoff"] == 12 and entry["timings"] == {"1": 12.0, "12": 1.0, "32": 21.0}
+    assert merge_tuning.load_cutoff(path) == 12
+    assert not (tmp_path / (merge_tuning.CONFIG_NAME + ".part")).exists()
+
+    machines = merge_tuning.load_config(path)["machines"]
+    assert machines["other host | other cpu | CPython 3.8.0"] == {"cutoff": 4}
+    assert machines[merge_tuning.machine_key()]["size"] == 10
+
+    lines = merge_tuning.report_lines(path, timings)
+    assert lines[1] == f"{1:>6} {12.0:>11.6f}s"
+    assert lines[2].endswith("12.00x vs no cutoff  <- best")
+    marked = [line for line in lines if line.startswith(" * ")]
+    assert len(marked) == 1 and merge_tuning.machine_key() in marked[0]
+    assert any(line.startswith("     4  other host") for line in lines)
+
+
+def test_load_cutoff_falls_back(tmp_path):
+    path = tmp_path / merge_tuning.CONFIG_NAME
+    for content in ("{not json", '{"machines": []}',
+                    json.dumps({"machines": {merge_tuning.machine_key(): {"cutoff": "many"}}})):
+        path.write_text(content)
+        assert merge_tuning.load_cutoff(str(path)) == merge_tuning.DEFAULT_CUTOFF
+    # A cutoff below one still sorts, as plain merge sort
+    path.write_text(json.dumps({"machines": {merge_tuning.machine_key(): {"cutoff": 0}}}))
+    assert merge_tuning.load_cutoff(str(path)) == 1
+
+
+def test_calibrate_real_merge_sort():
+    sort_algorithms = load_script("LabWork2/sort_algorithms.py")
+    timings = merge_tuning.calibrate(sort_algorithms.merge_sort, size=500, candidates=(1, 16), repeat=1)
+    assert sorted(timings) == [1, 16] and all(seconds > 0 for seconds in timings.values())
@@ -0,0 +1,54 @@
+"""LabWork1 pass telemetry: PassTelemetry itself and Compare All recording it in the timed run."""
+import pytest
+
+from conftest import RecordingUI, bare_instance, load_script
+
+
+def test_pass_telemetry_records_passes(rng):
+    bubble_algorithms = load_script("LabWork1/bubble_algorithms.py")
+    data = [rng.randint(0, 99) for _ in range(200)]
+    telemetry = bubble_algorithms.PassTelemetry(len(data) - 1)
+    result, passes, _ = bubble_algorithms.classic_bubble_sort(data, telemetry=telemetry)
+    assert result == sorted(data, reverse=True)
+    assert telemetry.passes == passes == len(data) - 1
+    assert list(telemetry.elapsed[:passes]) == sorted(telemetry.elapsed[:passes])
+
+    # Every pass after the data is sorted swaps nothing; idle_passes counts them
+    first_idle = next(i for i in range(passes) if telemetry.swaps[i] == 0)
+    assert all(telemetry.swaps[i] == 0 for i in range(first_idle, passes))
+    idle_passes, idle_time = telemetry.idle_passes()
+    assert idle_passes == passes - first_idle and 0 <= idle_time <= telemetry.elapsed[passes - 1]
+
+
+@pytest.mark.parametrize("record", [False, True])
+def test_compare_all_records_in_the_timed_run(record, rng, monkeypatch):
+    module = load_script("LabWork1/bubblesort.py")
+    gui = bare_instance(module.ModernSortingGUI)
+    gui.data = [rng.randint(-999, 999) for _ in range(150)]
+    gui.ui = RecordingUI()
+    gui.stats_text = None
+    gui.set_status = lambda text: None
+    gui.show_sorted_data = lambda title, data: None
+    gui.profile_mode = None
+    gui.use_process = False
+    gui.record_telemetry = record
+
+    runs = []
+    timed_sort = gui._timed_sort
+
+    def counted(name, sort_func, **kwargs):
+        runs.append(name)
+        return timed_sort(name, sort_func, **kwargs)
+
+    monkeypatch.setattr(gui, "_timed_sort", counted)
+    gui._compare_all()
+
+    # One run per variant, with or without telemetry
+    assert len(runs) == 4
+    assert gui.last_sorted_data == sorted(gui.data, reverse=True)
+    if record:
+        assert set(gui.telemetry) == {"classic", "optimized", "last_swap", "cocktail"}
+        assert gui.telemetry["classic"].passes == len(gui.data) - 1
+        assert "already sorted data" in gui.ui.text()
+    else:
+        assert gui.telemetry == {}
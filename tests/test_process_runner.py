@@ -0,0 +1,66 @@
+"""Process-isolated sorts: shared memory in, progress and results over the pipe, killable."""
+import threading
+
+import pytest
+
+from common import process_runner
+from conftest import load_script
+
+
+@pytest.fixture(autouse=True)
+def importable_modules():
+    # The GUIs pass their algorithm module by name; spawned children inherit sys.path
+    load_script("LabWork1/bubble_algorithms.py")
+    load_script("LabWork2/sort_algorithms.py")
+
+
+def test_sort_in_child_with_progress(rng):
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(6000)]
+    fractions = []
+    sort = process_runner.ProcessSort("sort_algorithms", "insertion_sort", data, on_progress=fractions.append)
+    result, elapsed_time, extra = sort.run()
+    assert result == sorted(data, reverse=True) and elapsed_time > 0 and extra == ()
+    assert fractions and all(0 <= fraction <= 1 for fraction in fractions)
+    assert fractions == sorted(fractions)
+
+
+def test_extras_kwargs_and_wide_numbers(rng):
+    data = [rng.randint(-999, 999) for _ in range(300)]
+    result, _, extra = process_runner.ProcessSort("bubble_algorithms", "classic_bubble_sort", data).run()
+    # Tuple results keep their pass and comparison counts
+    assert result == sorted(data, reverse=True) and extra[0] == len(data) - 1
+
+    # Values beyond 64 bits cannot go through shared memory and travel through the pipe
+    wide = data + [2 ** 70, -2 ** 80]
+    result, _, _ = process_runner.ProcessSort("sort_algorithms", "shell_sort", wide, kwargs={"gaps": "knuth"}).run()
+    assert result == sorted(wide, reverse=True)
+
+    assert process_runner.ProcessSort("sort_algorithms", "merge_sort", []).run()[0] == []
+
+
+def test_child_error_is_raised():
+    with pytest.raises(RuntimeError, match="AttributeError"):
+        process_runner.ProcessSort("sort_algorithms", "no_such_sort", [3, 1, 2]).run()
+    with pytest.raises(RuntimeError, match="TypeError"):
+        process_runner.ProcessSort("sort_algorithms", "merge_sort", [3, 1, 2], kwargs={"bogus": 1}).run()
+
+
+def test_kill_stops_the_child(rng):
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(30000)]
+    started = threading.Event()
+    sort = process_runner.ProcessSort("sort_algorithms", "bubble_sort", data, on_progress=lambda f: started.set())
+    outcome = []
+
+    def run():
+        try:
+            sort.run()
+        except process_runner.SortKilled:
+            outcome.append("killed")
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(30)
+    sort.kill()
+    thread.join(10)
+    assert not thread.is_alive() and outcome == ["killed"]
+    assert not sort.process.is_alive()
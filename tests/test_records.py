@@ -0,0 +1,18 @@
+"""Activities records: stable multi-column sorting of CSV rows."""
+import pytest
+
+from conftest import load_script
+
+def test_records_sort_stable_by_composite_key(rng):
+    records = load_script("Activities/records.py")
+    algorithms = load_script("Activities/sorting_algorithms.py").ALGORITHMS
+    rows = [[str(i), str(rng.randint(-3, 3)), str(rng.choice([-1.5, -0.0, 0.0, 2.25, 1e-300, -7e10]))]
+            for i in range(200)]
+    # Descending by column 2, then column 3; equal keys keep their input order
+    expected = sorted(rows, key=lambda row: (-int(row[1]), -float(row[2])))
+    for name in ("merge_sort", "introsort", "radix_sort"):
+        assert records.sort_records(rows, [1, 2], algorithms[name]) == expected, name
+
+    assert records.resolve_columns("score, 1", ["id", "score"]) == [1, 0]
+    with pytest.raises(ValueError):
+        records.column_keys([["1", "x"]], 1)
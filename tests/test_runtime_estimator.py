@@ -0,0 +1,102 @@
+"""LabWork2 runtime prediction and the Run All time budget built on it."""
+import pytest
+
+from conftest import RecordingUI, bare_instance, load_script
+
+
+def _exact_ratio(data):
+    n = len(data)
+    inversions = sum(1 for i in range(n) for j in range(i + 1, n) if data[i] < data[j])
+    return inversions / (n * (n - 1) // 2)
+
+
+def test_presortedness_exact_on_small_inputs(rng):
+    runtime_estimator = load_script("LabWork2/runtime_estimator.py")
+    data = [rng.randint(0, 50) for _ in range(150)]
+    profile = runtime_estimator.presortedness(data)
+    assert profile["inversion_ratio"] == _exact_ratio(data)
+    assert profile["inversions"] == round(_exact_ratio(data) * 150 * 149 / 2)
+    assert runtime_estimator.presortedness([5])["inversion_ratio"] == 0.0
+
+
+@pytest.mark.parametrize("shape", ["random", "nearly_descending", "ascending"])
+def test_presortedness_sampled_matches_exact(shape, rng):
+    runtime_estimator = load_script("LabWork2/runtime_estimator.py")
+    n = 400  # 79,800 pairs: above the sample count, so pairs are sampled
+    if shape == "random":
+        data = rng.sample(range(10 ** 6), n)
+    elif shape == "nearly_descending":
+        data = list(range(n, 0, -1))
+        for _ in range(20):
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+    else:
+        data = list(range(n))
+    assert n * (n - 1) // 2 > runtime_estimator.INVERSION_SAMPLES
+
+    ratio = runtime_estimator.presortedness(data)["inversion_ratio"]
+    assert ratio == pytest.approx(_exact_ratio(data), abs=0.015)
+    if shape == "ascending":
+        # Every distinct pair is inverted; draws of the same index must not dilute that
+        assert ratio == 1.0
+
+
+def test_estimate_runtime_scales_the_calibration(monkeypatch):
+    runtime_estimator = load_script("LabWork2/runtime_estimator.py")
+    sort_algorithms = load_script("LabWork2/sort_algorithms.py")
+    monkeypatch.setattr(runtime_estimator, "calibrate", lambda sort_func, sample: 0.01)
+    data = list(range(10000))  # Ascending: every pair inverted
+    profile = runtime_estimator.presortedness(data)
+
+    # Quadratic work grows 100x for 10x the items, n log n work about 13x
+    bubble = runtime_estimator.estimate_runtime("bubble_sort", sort_algorithms.bubble_sort, data, profile)
+    merge = runtime_estimator.estimate_runtime("merge_sort", sort_algorithms.merge_sort, data, profile)
+    assert bubble == pytest.approx(1.0, rel=0.01)
+    assert merge == pytest.approx(0.01 * 10000 * 13.288 / (1000 * 9.966), rel=0.01)
+
+    # Data no larger than the sample is simply timed
+    small = data[:500]
+    assert runtime_estimator.estimate_runtime(
+        "bubble_sort", sort_algorithms.bubble_sort, small, runtime_estimator.presortedness(small)
+    ) == 0.01
+
+
+def test_run_all_skips_over_budget(monkeypatch, rng):
+    module = load_script("LabWork2/sort-algo.py")
+    runtime_estimator = module.runtime_estimator
+    # Every calibration takes 10ms, so the estimates follow the work models alone
+    monkeypatch.setattr(runtime_estimator, "calibrate", lambda sort_func, sample: 0.01)
+
+    gui = bare_instance(module.ModernSortingGUI)
+    gui.data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+    gui.ui = RecordingUI()
+    gui.stats_text = None
+    gui.set_status = lambda text: None
+    gui.show_sorted_data = lambda title, data: None
+    gui.profile_mode = None
+    gui.use_process = False
+    gui.trace_memory = False
+    gui.time_budget = 0.1
+
+    timed = []
+
+    def timed_sort(name, sort_func):
+        timed.append(name)
+        return sort_func(gui.data), 0.0
+
+    monkeypatch.setattr(gui, "_timed_sort", timed_sort)
+    gui._run_all_sorts()
+    text = gui.ui.text()
+
+    # The O(n²) sorts are predicted at about 25x the 1,000-item calibration, over the budget
+    assert timed == ["Merge Sort", "Shell Sort (Ciura)", "Introsort", "Heap Sort"]
+    assert "Bubble Sort\n   skipped (est. " in text and "Insertion Sort\n   skipped (est. " in text
+    assert gui.last_sorted_data == sorted(gui.data, reverse=True)
+
+    # No budget: everything runs and nothing is estimated
+    timed.clear()
+    gui.ui = RecordingUI()
+    gui.time_budget = 0.0
+    gui.data = gui.data[:600]
+    gui._run_all_sorts()
+    assert len(timed) == 6 and "skipped" not in gui.ui.text() and "Predicted" not in gui.ui.text()
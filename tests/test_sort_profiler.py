@@ -0,0 +1,66 @@
+"""Profiling hooks: output names, cProfile and sampling runs, and peak memory tracing."""
+import os
+import pstats
+import time
+
+import pytest
+
+from common import sort_profiler
+from conftest import load_script
+
+
+def test_profile_output_path():
+    path = sort_profiler.profile_output_path("Shell Sort (Ciura)", "/data/My Numbers.txt", 5000)
+    assert path == os.path.join(sort_profiler.PROFILE_DIR, "shell_sort_ciura_my_numbers_5000.pstats")
+    assert sort_profiler.profile_output_path("Merge Sort", "", 10, "sampling").endswith("merge_sort_data_10.samples.txt")
+
+
+def test_cprofile_run_writes_stats(tmp_path, rng):
+    sort_algorithms = load_script("LabWork2/sort_algorithms.py")
+    data = [rng.randint(-999, 999) for _ in range(3000)]
+    output = str(tmp_path / "nested" / "merge.pstats")
+
+    result, elapsed_time, lines = sort_profiler.run_profiled(sort_algorithms.merge_sort, data, "cprofile", output)
+    assert result == sorted(data, reverse=True) and elapsed_time > 0
+    assert lines[0] == f"cProfile -> {output}" and len(lines) > 1
+    # The dump loads with pstats and names the sort's own functions
+    functions = {key[2] for key in pstats.Stats(output).stats}
+    assert "_merge_sort_range" in functions
+
+
+def test_sampling_run_finds_the_hot_function(tmp_path):
+    def slow_sort(data):
+        deadline = time.perf_counter() + 0.2
+        while time.perf_counter() < deadline:
+            pass
+        return sorted(data, reverse=True)
+
+    output = str(tmp_path / "slow.samples.txt")
+    result, elapsed_time, lines = sort_profiler.run_profiled(slow_sort, [1, 3, 2], "sampling", output)
+    assert result == [3, 2, 1] and elapsed_time >= 0.2
+    assert lines[0].startswith("Sampling profile (") and "slow_sort" in lines[1]
+    with open(output) as file:
+        assert "samples every 5.0 ms" in file.readline()
+
+
+def test_measure_peak_memory(rng):
+    sort_algorithms = load_script("LabWork2/sort_algorithms.py")
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+    original = list(data)
+
+    # A copying sort's result list is not counted as auxiliary memory
+    peak, auxiliary = sort_profiler.measure_peak_memory(sort_algorithms.merge_sort, data)
+    assert 0 < auxiliary < peak
+
+    # Sorting the given list needs far less memory than merge sort's copies
+    heap_peak, heap_auxiliary = sort_profiler.measure_peak_memory(sort_algorithms.heap_sort_in_place, data,
+                                                                  in_place=True)
+    assert heap_auxiliary == heap_peak < auxiliary
+    # Both sorts ran on a copy of the caller's list
+    assert data == original
+
+
+@pytest.mark.parametrize("size, text", [(0, "0 B"), (1023, "1023 B"), (1536, "1.5 KiB"),
+                                        (5 * 1024 ** 2, "5.0 MiB"), (3 * 1024 ** 3, "3.0 GiB")])
+def test_format_bytes(size, text):
+    assert sort_profiler.format_bytes(size) == text
@@ -0,0 +1,49 @@
+"""Sort verification: the permutation fingerprint and the descending check, serial and parallel."""
+from common import sort_verifier
+
+def test_sort_verifier(rng):
+    data = rng.sample(range(-10 ** 6, 10 ** 6), 2000)
+    expected = sort_verifier.fingerprint(data)
+    output = sorted(data, reverse=True)
+    assert sort_verifier.verify(output, expected)["ok"]
+
+    # Offsetting changes keep the plain sum but must still be caught
+    tampered = list(output)
+    tampered[10] += 1
+    tampered[1500] -= 1
+    result = sort_verifier.verify(tampered, expected)
+    assert not result["permutation"]
+    assert not sort_verifier.verify([4, 1], sort_verifier.fingerprint([3, 2]))["ok"]
+
+    swapped = list(output)
+    swapped[99], swapped[100] = swapped[100], swapped[99]
+    result = sort_verifier.verify(swapped, expected)
+    assert result["permutation"] and not result["descending"]
+    assert result["first_ascent"] == 100
+
+
+def test_sort_verifier_parallel_chunks(rng, monkeypatch):
+    # The spawned pool workers import common.sort_verifier from the repository root
+    monkeypatch.setattr(sort_verifier, "CHUNK_ITEMS", 256)
+    # A pool of its own, dropped again when the test ends
+    monkeypatch.setattr(sort_verifier, "_pool", None)
+    try:
+        data = rng.sample(range(-10 ** 6, 10 ** 6), 2000)
+        expected = sort_verifier.fingerprint(data, parallel=True)
+        assert expected == sort_verifier.fingerprint(data, parallel=False)
+        output = sorted(data, reverse=True)
+        assert sort_verifier.verify(output, expected, parallel=True)["ok"]
+        assert sort_verifier._pool is not None
+
+        # Each chunk stays descending; only the check across the boundary sees the ascent
+        output[255], output[256] = output[256], output[255]
+        result = sort_verifier.verify(output, expected, parallel=True)
+        assert result["permutation"] and not result["descending"]
+        assert result["first_ascent"] == 256
+
+        output[255], output[256] = output[256], output[255]
+        output[700] += 1
+        assert not sort_verifier.verify(output, expected, parallel=True)["permutation"]
+    finally:
+        if sort_verifier._pool is not None:
+            sort_verifier._pool.shutdown()
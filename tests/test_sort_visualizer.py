@@ -0,0 +1,30 @@
+"""The visualizer mirror: step callbacks show the live list and stop on request."""
+import pytest
+
+from common import sort_visualizer
+from conftest import load_script
+
+@pytest.mark.parametrize("module_path, names", [
+    ("LabWork1/bubble_algorithms.py", ["classic_bubble_sort", "optimized_bubble_sort"]),
+    ("LabWork2/sort_algorithms.py", ["bubble_sort", "insertion_sort", "merge_sort"]),
+])
+def test_visualizer_steps_mirror_sort(module_path, names, rng):
+    module = load_script(module_path)
+    data = [rng.randint(-99, 99) for _ in range(300)]
+    for name in names:
+        state = sort_visualizer.SortState(data)
+
+        def step(values, lo, hi):
+            state.step(values, lo, hi)
+            # Every frame shows a rearrangement of the input
+            assert sorted(state.arr) == sorted(data) and 0 <= lo < hi <= len(data)
+
+        getattr(module, name)(state.arr, step=step)
+        # The mirror the window draws ends up as the sorted output
+        assert state.arr == sorted(data, reverse=True), name
+        assert state.steps > 0
+
+        state = sort_visualizer.SortState(data)
+        state.stop = True
+        with pytest.raises(sort_visualizer.SortStopped):
+            getattr(module, name)(state.arr, step=state.step)
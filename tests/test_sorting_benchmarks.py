@@ -0,0 +1,43 @@
+"""
+Benchmark tier: times every implementation per input size.
+
+Skipped by default; run with
+    python -m pytest --benchmark [--benchmark-sizes 500,1000,2000]
+Results are printed and written to bench_output.txt in the repository root.
+"""
+import os
+import random
+import time
+
+import pytest
+
+from conftest import IMPLEMENTATIONS, REPO_ROOT
+
+RESULTS = []
+
+
+@pytest.fixture(scope="module", autouse=True)
+def report():
+    yield
+    if not RESULTS:
+        return
+    lines = [f"{'implementation':<40} {'n':>8} {'seconds':>12}"]
+    lines += [f"{name:<40} {n:>8} {elapsed:>12.6f}" for name, n, elapsed in RESULTS]
+    text = "\n".join(lines)
+    print("\n" + text)
+    with open(os.path.join(REPO_ROOT, "bench_output.txt"), "w") as file:
+        file.write(text + "\n")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name, sort_func", IMPLEMENTATIONS, ids=[name for name, _ in IMPLEMENTATIONS])
+def test_benchmark(name, sort_func, request):
+    sizes = [int(size) for size in request.config.getoption("--benchmark-sizes").split(",")]
+    rng = random.Random(1234)
+
+    for size in sizes:
+        data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(size)]
+        start_time = time.perf_counter()
+        result = sort_func(data)
+        RESULTS.append((name, size, time.perf_counter() - start_time))
+        assert result == sorted(data, reverse=True)
@@ -0,0 +1,70 @@
+"""Every implementation must agree with sorted(reverse=True) on the same inputs."""
+import random
+
+import pytest
+
+from conftest import IMPLEMENTATIONS, load_script
+
+def _inputs():
+    rng = random.Random(42)
+    return {
+        "empty": [],
+        "single": [7],
+        "pair": [1, 2],
+        "duplicates": [rng.choice([3, 3, 5, 1]) for _ in range(60)],
+        "all_equal": [4] * 25,
+        "negatives": [rng.randint(-500, -1) for _ in range(80)],
+        "mixed_sign": [rng.randint(-1000, 1000) for _ in range(120)],
+        "already_sorted": list(range(200, 0, -1)),
+        "reverse_sorted": list(range(200)),
+        "large_random": [rng.randint(-10 ** 6, 10 ** 6) for _ in range(1500)],
+    }
+
+
+INPUTS = _inputs()
+
+
+@pytest.mark.parametrize("name, sort_func", IMPLEMENTATIONS, ids=[name for name, _ in IMPLEMENTATIONS])
+@pytest.mark.parametrize("case", list(INPUTS))
+def test_sorts_descending(name, sort_func, case):
+    data = INPUTS[case]
+    original = list(data)
+
+    assert sort_func(data) == sorted(original, reverse=True)
+    # The caller's list must not be modified
+    assert data == original
+
+
+@pytest.mark.parametrize("name, sort_func", IMPLEMENTATIONS, ids=[name for name, _ in IMPLEMENTATIONS])
+def test_random_inputs_agree(name, sort_func, rng):
+    for size in (2, 3, 17, 64, 255):
+        data = [rng.randint(-20, 20) for _ in range(size)]
+        assert sort_func(data) == sorted(data, reverse=True)
+
+
+def test_all_implementations_collected():
+    # Three classes with bubble/insertion/merge/shell/introsort/heap, the
+    # nine engines of the Activities and LabWork2 modules, Shell sort with each of the four gap
+    # sequences and merge sort with two fixed cutoffs in both modules, and the
+    # four bubble sort variants of LabWork1 (GUI and module)
+    assert len(IMPLEMENTATIONS) == 3 * 6 + 9 + 9 + 2 * (4 + 2) + 4 + 4
+
+
+@pytest.mark.parametrize("module_path", ["Activities/sorting_algorithms.py", "LabWork2/sort_algorithms.py"])
+def test_distinct_counts(module_path, rng):
+    module = load_script(module_path)
+    data = [rng.randint(-30, 30) for _ in range(2000)]
+    expected = [(value, data.count(value)) for value in sorted(set(data), reverse=True)]
+    assert module.distinct_counts(data) == expected
+    assert module.distinct_counts([]) == []
+
+
+@pytest.mark.parametrize("module_path", ["Activities/sorting_algorithms.py", "LabWork2/sort_algorithms.py"])
+def test_heap_sort_in_place(module_path, rng):
+    module = load_script(module_path)
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+    original = list(data)
+    assert module.heap_sort(data) == sorted(original, reverse=True) and data == original
+
+    assert module.heap_sort_in_place(data) is None
+    assert data == sorted(original, reverse=True)
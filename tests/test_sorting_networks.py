@@ -0,0 +1,14 @@
+"""Sorting networks: optimal comparator counts, verified by the 0-1 principle."""
+from common import sorting_networks
+
+def test_sorting_networks(rng):
+    for n, network in sorting_networks.NETWORKS.items():
+        # The 0-1 principle covers every input of this size
+        assert sorting_networks.verify(network, n), n
+        data = [rng.randint(-9, 9) for _ in range(n)]
+        assert sorting_networks.network_sort(data) == sorted(data, reverse=True)
+    assert sorted(sorting_networks.NETWORKS) == list(range(2, sorting_networks.MAX_SIZE + 1))
+    # Smallest known comparator counts for every size
+    optimal = [1, 3, 5, 9, 12, 16, 19, 25, 29, 35, 39, 45, 51, 56, 60]
+    assert [len(sorting_networks.NETWORKS[n]) for n in range(2, 17)] == optimal
+    assert not sorting_networks.verify(((0, 1), (1, 2)), 3)
@@ -0,0 +1,84 @@
+"""The batched UI queue: appends from worker threads reach the widgets once per frame."""
+import threading
+
+from common import ui_queue
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append((ms, func))
+
+
+class FakeText:
+    def __init__(self):
+        self.calls = []
+
+    def config(self, **options):
+        self.calls.append(("config", options["state"]))
+
+    def insert(self, index, *chunks):
+        self.calls.append(("insert", index) + chunks)
+
+    def see(self, index):
+        self.calls.append(("see", index))
+
+
+def test_drain_coalesces_appends():
+    root = FakeRoot()
+    queue = ui_queue.UIUpdateQueue(root, fps=50)
+    assert root.scheduled == [(20, queue._drain)]
+    log, stats = FakeText(), FakeText()
+    order = []
+
+    threads = [threading.Thread(target=queue.append, args=(log, f"line {i}\n")) for i in range(3)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    queue.append(log, "done\n", "success")
+    queue.call(order.append, "status")
+    queue.append(log, "after\n")
+    queue.append(stats, "stats\n", "header")
+    # Nothing touches a widget until the main loop drains the queue
+    assert log.calls == [] and order == []
+
+    root.scheduled[-1][1]()
+    # One insert for the first run of appends, untagged chunks get an empty tag tuple
+    assert log.calls == [
+        ("config", "normal"),
+        ("insert", "end", "line 0\n", (), "line 1\n", (), "line 2\n", (), "done\n", "success"),
+        ("see", "end"),
+        ("config", "disabled"),
+        ("config", "normal"), ("insert", "end", "after\n", ()), ("see", "end"), ("config", "disabled"),
+    ]
+    assert stats.calls[1] == ("insert", "end", "stats\n", "header")
+    assert order == ["status"]
+    assert len(root.scheduled) == 2
+
+    # An empty frame draws nothing and keeps the loop going
+    root.scheduled[-1][1]()
+    assert len(log.calls) == 8 and len(root.scheduled) == 3
+
+
+def test_drain_survives_failing_updates(capsys):
+    root = FakeRoot()
+    queue = ui_queue.UIUpdateQueue(root)
+    assert root.scheduled[0][0] == 33
+    order = []
+
+    def fail():
+        raise ValueError("widget destroyed")
+
+    queue.call(order.append, 1)
+    queue.call(fail)
+    queue.append(None, "lost\n")
+    queue.call(order.append, 2)
+    root.scheduled[-1][1]()
+
+    # Each failure is printed; the updates after it still run and the next frame is scheduled
+    assert order == [1, 2]
+    err = capsys.readouterr().err
+    assert "ValueError: widget destroyed" in err and "AttributeError" in err
+    assert len(root.scheduled) == 2